@@ -1,11 +1,11 @@
 import os
 import shutil
+import time
 import uuid
-import tempfile
-from groq import Groq
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Depends, status
+import asyncio
+from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from ultralytics import YOLO                         # YOLOv8 model
 from PIL import Image                  
 import cv2
@@ -13,72 +13,25 @@ import io
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 # Database imports
-from sqlalchemy import create_engine, Column, String, Integer
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
 
 from src.langgraphagenticai.graph.graph_builder import GraphBuilder
-from src.langgraphagenticai.state.state import CandidateState # Assumed available
-from src.langgraphagenticai.nodes.nodes import WebSearchChatbotNode
+from src.langgraphagenticai.state.state import CandidateState, LearningResource, merge_dicts # Assumed available
+from src.langgraphagenticai.nodes.nodes import WebSearchChatbotNode, answer_fingerprint, compute_jd_features
+from src.langgraphagenticai.nodes.cascade_ranker import cascade_rank
 from src.langgraphagenticai.LLMS.groqllm import GroqLLM # Assuming this is the class used in the node
-import sqlite3
-from datetime import datetime
-# ---------------------------
-# Database Configuration (SQLite) - CORRECTED
-# ---------------------------
-# Use a standard relative path for sqlite3 functions
-DB_FILE_PATH = "./jds.db"
-# Use the full URI for SQLAlchemy
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_FILE_PATH}" 
-
-# SQLAlchemy Setup
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
-
-# ---------------------------
-# Database Model (SQLAlchemy)
-# ---------------------------
-class DBJobDescription(Base):
-    __tablename__ = "job_descriptions"
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
-    text = Column(String)
-    company = Column(String) # Required for JDItem/init_db consistency
-    created_at = Column(String) # Required for JDItem/init_db consistency
-
-# Initialize database (used by sqlite3 endpoints)
-def init_db():
-    # Use the simple file path for sqlite3.connect()
-    conn = sqlite3.connect(DB_FILE_PATH) 
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS job_descriptions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            company TEXT NOT NULL,
-            text TEXT NOT NULL,
-            created_at TEXT NOT NULL
-        )
-    """)
-    conn.commit()
-    conn.close()
-
-# Create tables for both SQLAlchemy and sqlite3 consistency
-Base.metadata.create_all(bind=engine)
-init_db() 
-
-
-# Dependency to get the database session (SQLAlchemy)
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
+from src.langgraphagenticai.LLMS.client_pool import client_pool
+from src.langgraphagenticai.backends.transcribe import transcriber
+from src.langgraphagenticai.utils.audio_preprocess import audio_preprocessor
+from src.langgraphagenticai.tools.resource_catalog import resource_catalog
+from src.langgraphagenticai.utils.singleflight import singleflight_stats
+from src.langgraphagenticai.utils.metrics import metrics, cache_families, PROMETHEUS_CONTENT_TYPE
+from src.langgraphagenticai.tools.search_cache import search_cache
+from src.langgraphagenticai.utils.tracing import tracer, render_waterfall
+from src.langgraphagenticai.jobs.job_queue import JobQueue, TERMINAL_STATUSES
+from src.langgraphagenticai.database.jd_store import jd_store, parse_fields, JD_FIELDS, JD_SUMMARY_FIELDS
+from src.langgraphagenticai.database.jd_import import import_jds, detect_format
+from src.langgraphagenticai.database.match_store import match_store
+import json
 
 # ---------------------------
 # App Setup & Globals (Unchanged)
@@ -94,10 +47,56 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Link", "X-Next-Cursor"],
 )
 
+# Scrape / debug endpoints would otherwise flood the trace buffer.
+UNTRACED_PATHS = ("/metrics", "/debug/traces")
+
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """Root span per request; graph, search, LLM and DB spans nest under it and tag it with the thread_id."""
+    if request.url.path.startswith(UNTRACED_PATHS):
+        return await call_next(request)
+    with tracer.span(f"{request.method} {request.url.path}", kind="http",
+                     thread_id=request.query_params.get("thread_id")):
+        response = await call_next(request)
+        tracer.annotate(status_code=response.status_code)
+        return response
+
 graph_builder = GraphBuilder(model_name="qwen/qwen3-32b") 
-ACTIVE_SESSIONS: Dict[str, CandidateState] = {}
+
+# Sessions not written to for this long are evicted with their background evaluations.
+SESSION_IDLE_TTL_S = float(os.getenv("SESSION_IDLE_TTL_S", str(6 * 3600)))
+SESSION_SWEEP_INTERVAL_S = 300
+
+
+class SessionStore(dict):
+    """thread_id -> CandidateState, remembering when each session was last written."""
+
+    def __init__(self):
+        super().__init__()
+        self.last_seen: Dict[str, float] = {}
+
+    def __setitem__(self, thread_id: str, state: CandidateState):
+        super().__setitem__(thread_id, state)
+        self.last_seen[thread_id] = time.time()
+
+    def idle(self, max_idle_s: float) -> List[str]:
+        cutoff = time.time() - max_idle_s
+        return [thread_id for thread_id, seen in self.last_seen.items() if seen < cutoff]
+
+    def pop(self, thread_id: str, default=None):
+        self.last_seen.pop(thread_id, None)
+        return super().pop(thread_id, default)
+
+
+ACTIVE_SESSIONS = SessionStore()
+# Background per-answer evaluations: thread_id -> {question_index: (answer_hash, task)}
+PENDING_EVALUATIONS: Dict[str, Dict[int, Any]] = {}
+# Serialises read-modify-write of one session across awaits (e.g. concurrent transcriptions).
+SESSION_LOCKS: Dict[str, asyncio.Lock] = {}
 
 try:
     temp_llm_instance = GroqLLM(model_name="qwen/qwen3-32b")
@@ -106,6 +105,9 @@ except Exception as e:
     print(f"Warning: Could not initialize temp_node for utility matching: {e}")
     temp_node = None
 
+# Candidate JDs kept by the full-text prefilter of /match-all-jds
+JD_PREFILTER_TOP_K = int(os.getenv("JD_PREFILTER_TOP_K", "50"))
+
 
 # ---------------------------
 # Pydantic Models for API
@@ -114,6 +116,11 @@ class StatePayload(BaseModel):
     state: dict
     thread_id: str
 
+class AnswerPayload(BaseModel):
+    thread_id: str
+    question_index: int
+    answer: str
+
 # Pydantic models for admin endpoints
 class JDCreate(BaseModel):
     title: str
@@ -124,7 +131,6 @@ class JDItem(BaseModel):
     company: str
     text: str
 
-
 class JDResponse(JDCreate):
     id: int
     company: str
@@ -147,124 +153,302 @@ def save_resume(resume: UploadFile, thread_id: str) -> str:
     return temp_path
 
 
+async def _evaluate_answer(thread_id: str, index: int, question, answer: str, answer_hash: str):
+    metadata: Dict[str, Any] = {}
+    try:
+        with tracer.span("evaluate_answer", kind="task", thread_id=thread_id, question_index=index):
+            review = await asyncio.to_thread(
+                graph_builder.recruitment_node.evaluate_single_answer, question, answer, index, metadata
+            )
+    except Exception as e:
+        print(f"⚠️ Background evaluation failed for Q{index + 1}: {e}")
+        return
+    # Re-read the session: another endpoint may have replaced the state object meanwhile.
+    # Assign new containers rather than mutating: shallow model_copy snapshots taken by
+    # other requests share the old ones.
+    session_state = ACTIVE_SESSIONS.get(thread_id)
+    if session_state is not None:
+        session_state.answer_feedback = {
+            **session_state.answer_feedback, index: {"answer_hash": answer_hash, "review_feedback": review}
+        }
+        session_state.run_metadata = merge_dicts(session_state.run_metadata, {"routing": metadata.get("routing", {})})
+        print(f"📝 Background feedback ready for Q{index + 1}")
+
+
+def schedule_answer_evaluation(thread_id: str, index: int, answer: str) -> bool:
+    """Start evaluating an answer in the background unless it is already evaluated or in flight."""
+    session_state = ACTIVE_SESSIONS.get(thread_id)
+    if session_state is None or not (0 <= index < len(session_state.interview_questions)):
+        return False
+
+    answer_hash = answer_fingerprint(answer)
+    cached = session_state.answer_feedback.get(index)
+    if cached and cached.get("answer_hash") == answer_hash:
+        return False
+
+    pending = PENDING_EVALUATIONS.setdefault(thread_id, {})
+    in_flight = pending.get(index)
+    if in_flight and in_flight[0] == answer_hash and not in_flight[1].done():
+        return False
+
+    question = session_state.interview_questions[index]
+    task = asyncio.create_task(_evaluate_answer(thread_id, index, question, answer, answer_hash))
+    pending[index] = (answer_hash, task)
+    return True
+
+
+def end_session(thread_id: str) -> None:
+    """Drop a session with its lock and cancel its unfinished background evaluations."""
+    ACTIVE_SESSIONS.pop(thread_id, None)
+    SESSION_LOCKS.pop(thread_id, None)
+    for _, task in PENDING_EVALUATIONS.pop(thread_id, {}).values():
+        task.cancel()
+
+
+async def evict_idle_sessions():
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL_S)
+        idle = ACTIVE_SESSIONS.idle(SESSION_IDLE_TTL_S)
+        for thread_id in idle:
+            end_session(thread_id)
+        if idle:
+            print(f"🧹 Evicted {len(idle)} idle sessions")
+
+
+def merge_answer_feedback(thread_id: str, candidate_state: CandidateState) -> None:
+    """
+    Add the session's per-answer feedback to a client-sent state. The session wins:
+    it holds the latest background results, while the client may echo older ones.
+    """
+    session_state = ACTIVE_SESSIONS.get(thread_id)
+    if session_state is not None:
+        candidate_state.answer_feedback = {**candidate_state.answer_feedback, **session_state.answer_feedback}
+
+
+async def wait_for_pending_evaluations(thread_id: str):
+    pending = PENDING_EVALUATIONS.pop(thread_id, {})
+    tasks = [task for _, task in pending.values() if not task.done()]
+    if tasks:
+        print(f"⏳ Waiting for {len(tasks)} background evaluations")
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 # ---------------------------
-# JD Admin Endpoints (Using sqlite3 for manual CRUD)
+# JD Admin Endpoints (pooled JD store)
 # ---------------------------
 
 # ✅ Add a new JD
 @app.post("/admin/jds", response_model=JDItem)
-def add_jd(jd: JDItem):
-    # Use the simple file path
-    conn = sqlite3.connect(DB_FILE_PATH)
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO job_descriptions (title, company, text, created_at)
-        VALUES (?, ?, ?, ?)
-    """, (jd.title, jd.company, jd.text, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    new_id = cursor.lastrowid
-    conn.close()
-    
-    return {**jd.model_dump(), "id": new_id}
+async def add_jd(jd: JDItem):
+    created = await jd_store.aadd(jd.title, jd.company, jd.text)
+    if created["duplicate_of"] is not None:
+        print(f"♻️ JD '{jd.title}' is a near-duplicate of #{created['duplicate_of']} "
+              f"(similarity {created['similarity']}, {'merged' if created['merged'] else 'flagged'})")
+    if not created["merged"]:
+        await job_queue.asubmit("jd-features", {"jd_ids": [created["id"]]})
+    return created
+
+
+# ✅ Near-duplicate JD clusters (only each cluster's representative is used for matching)
+@app.get("/admin/jds/clusters")
+async def list_jd_clusters(limit: int = Query(100, ge=1, le=1000)):
+    return await jd_store.aclusters(limit)
+
 
+# ✅ Bulk import JDs from a JSONL or CSV export (title, company, text[, created_at])
+@app.post("/admin/jds/import")
+async def import_jds_file(file: UploadFile = File(...), format: Optional[str] = Query(None, pattern="^(jsonl|csv)$")):
+    """
+    Rows are validated as they stream in and inserted in batched transactions;
+    skills/embeddings are then computed by a background `jd-features` job.
+    Returns throughput and row-level errors.
+    """
+    fmt = format or detect_format(file.filename, file.content_type)
+    # Parsing, validation and MinHash run on a thread of their own; the pool's executor
+    # is not held for the upload, and a pooled connection is taken only per batch commit.
+    with tracer.span("import_jds", kind="task", format=fmt):
+        report = await asyncio.to_thread(import_jds, jd_store, file.file, fmt)
+    feature_job_id = await job_queue.asubmit("jd-features", {"jd_ids": report.jd_ids}, priority=-1) if report.jd_ids else None
+    print(f"📥 Imported {report.inserted}/{report.rows_read} JDs ({report.rows_per_sec} rows/s, {report.failed} errors)")
+    return {**report.model_dump(), "feature_job_id": feature_job_id}
+
+
+def _jd_etag(version: int) -> str:
+    return f'W/"jds-v{version}"'
+
+
+async def _jd_listing(
+    request: Request,
+    default_fields,
+    descending: bool,
+    fields: Optional[str],
+    limit: Optional[int],
+    cursor: Optional[int],
+    company: Optional[str],
+    created_from: Optional[str],
+    created_to: Optional[str],
+) -> Response:
+    """
+    Shared JD listing: a JSON array (unchanged shape), keyset-paginated via
+    `limit`/`cursor` with the next cursor in `X-Next-Cursor` and a `Link: rel="next"`
+    header, projected via `fields`. The ETag is the JD table version, so an
+    unchanged table answers If-None-Match with a 304 before any rows are read.
+    """
+    etag = _jd_etag(await jd_store.aversion())
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-# ✅ Get all JDs
+    try:
+        columns = parse_fields(fields, default_fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    page = await jd_store.alist_page(
+        fields=columns, limit=limit, cursor=cursor, descending=descending,
+        company=company, created_from=created_from, created_to=created_to,
+    )
+    headers = {"ETag": _jd_etag(page.version), "Cache-Control": "no-cache"}
+    if page.next_cursor is not None:
+        headers["X-Next-Cursor"] = str(page.next_cursor)
+        headers["Link"] = f'<{request.url.include_query_params(cursor=page.next_cursor)}>; rel="next"'
+    return JSONResponse(page.items, headers=headers)
+
+
+# ✅ Get all JDs (newest first; pass `fields=id,title,company,created_at` to skip body text)
 @app.get("/admin/jds", response_model=List[JDResponse])
-def list_jds():
-    # Use the simple file path
-    conn = sqlite3.connect(DB_FILE_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, title, company, text, created_at FROM job_descriptions ORDER BY id DESC")
-    rows = cursor.fetchall()
-    conn.close()
-    return [
-        {
-            "id": row[0],
-            "title": row[1],
-            "company": row[2],
-            "text": row[3],
-            "created_at": row[4]
-        }
-        for row in rows
-    ]
+async def list_jds(
+    request: Request,
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[int] = None,
+    company: Optional[str] = None,
+    created_from: Optional[str] = None,
+    created_to: Optional[str] = None,
+):
+    return await _jd_listing(request, JD_FIELDS, True, fields, limit, cursor, company, created_from, created_to)
 
 
 # ✅ Delete JD by ID
 @app.delete("/admin/jds/{jd_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_jd(jd_id: int):
-    # Use the simple file path
-    conn = sqlite3.connect(DB_FILE_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id FROM job_descriptions WHERE id = ?", (jd_id,))
-    row = cursor.fetchone()
-    if not row:
-        conn.close()
+async def delete_jd(jd_id: int):
+    if not await jd_store.adelete(jd_id):
         raise HTTPException(status_code=404, detail="JD not found")
 
-    cursor.execute("DELETE FROM job_descriptions WHERE id = ?", (jd_id,))
-    conn.commit()
-    conn.close()
-    return {"message": f"JD with ID {jd_id} deleted successfully"}
+
+# ✅ Import curated learning resources per skill (used by skill gap analysis before any web search)
+@app.post("/admin/skill-resources")
+def import_skill_resources(entries: Dict[str, List[LearningResource]]):
+    imported = resource_catalog.import_entries(
+        {skill: [r.model_dump() for r in resources] for skill, resources in entries.items()}
+    )
+    return {"imported": imported}
+
+
+# ✅ List the skill resource catalog
+@app.get("/admin/skill-resources")
+def list_skill_resources():
+    return resource_catalog.list_entries()
 
 
 # ---------------------------
-# Core Recruitment Endpoints (Using SQLAlchemy)
+# Core Recruitment Endpoints
 # ---------------------------
 
 @app.get("/jds", response_model=List[JDSummary])
-async def get_jds(db: Session = Depends(get_db)):
+async def get_jds(
+    request: Request,
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[int] = None,
+    company: Optional[str] = None,
+    created_from: Optional[str] = None,
+    created_to: Optional[str] = None,
+):
     """Returns a list of available job descriptions (ID and Title) from SQLite."""
-    # Uses SQLAlchemy Session
-    jds = db.query(DBJobDescription).all()
-    return [{"id": jd.id, "title": jd.title} for jd in jds]
+    return await _jd_listing(request, JD_SUMMARY_FIELDS, False, fields, limit, cursor, company, created_from, created_to)
+
+
+@app.get("/jds/search")
+async def search_jds(q: str, limit: int = Query(20, ge=1, le=200), match: str = Query("all", pattern="^(all|any)$")):
+    """Full-text JD search (FTS5, BM25-ranked; lower score is better) with a highlighted snippet."""
+    return await jd_store.asearch(q, limit=limit, match_all=match == "all")
 
 
 @app.post("/match-all-jds")
-async def match_all_jds(payload: StatePayload, db: Session = Depends(get_db)):
-    """Matches the candidate's resume against all JDs in the database and selects the best one."""
+async def match_all_jds(
+    payload: StatePayload,
+    prefilter: bool = False,
+    top_k: int = Query(JD_PREFILTER_TOP_K, ge=1),
+    cascade: bool = True,
+):
+    """
+    Matches the candidate's resume against every JD (one per near-duplicate cluster) and selects the best one.
+    With `prefilter=true`, only the `top_k` JDs whose FTS5/BM25 rank against the candidate's
+    skills is best are scored (all JDs if the skills match nothing).
+    With `cascade` (default), JDs whose score upper bound cannot beat the best one are never fully scored.
+    """
     if temp_node is None:
         raise HTTPException(status_code=500, detail="Internal server error: Matching utility not initialized.")
          
     try:
         candidate_state = CandidateState(**payload.state)
         best_match_score = -1.0
-        best_match_jd: DBJobDescription = None
+        best_match_jd: Optional[Dict[str, Any]] = None
         best_match_jd_state: CandidateState = None
+        ranking = None
         
-        # Query all JDs from the database (SQLAlchemy Session)
-        all_jds = db.query(DBJobDescription).all()
+        all_jds = None
+        if prefilter and candidate_state.candidate_skills:
+            candidate_ids = await jd_store.aprefilter(candidate_state.candidate_skills, top_k)
+            if candidate_ids:
+                all_jds = await jd_store.aget_many(candidate_ids)
+                print(f"🔎 BM25 prefilter kept {len(all_jds)} JDs for matching")
+        if all_jds is None:
+            all_jds = await jd_store.alist_all(representatives_only=True)
 
         if not all_jds:
             raise HTTPException(status_code=404, detail="No Job Descriptions available for matching in the database.")
              
-        # Use the pre-instantiated temp_node for matching logic
-        for jd in all_jds:
-            temp_state = candidate_state.copy(deep=True) 
-            temp_state.jd_text = jd.text
-            
-            temp_state = temp_node.jd_upload(temp_state)
-            temp_state = temp_node.match_resume_with_jd(temp_state)
-            
-            if temp_state.match_score > best_match_score:
-                best_match_score = temp_state.match_score
-                best_match_jd = jd
-                best_match_jd_state = temp_state
+        if cascade:
+            features = await jd_store.aget_features([jd["id"] for jd in all_jds])
+            bm25 = await jd_store.abm25_scores(candidate_state.candidate_skills)
+            best, ranking = await asyncio.to_thread(cascade_rank, temp_node, candidate_state, all_jds, features, bm25)
+            if best:
+                best_match_score, best_match_jd, best_match_jd_state = best[0]
+            print(f"🪜 Cascade ranking: {ranking['stage2']['fully_scored']} of {ranking['candidates']} JDs fully scored, "
+                  f"{ranking['stage2']['pruned']} pruned by bound")
+        else:
+            # Use the pre-instantiated temp_node for matching logic
+            for jd in all_jds:
+                temp_state = candidate_state.copy(deep=True) 
+                temp_state.jd_text = jd["text"]
+                temp_state.jd_id = jd["id"]
+                
+                temp_state = temp_node.jd_upload(temp_state)
+                temp_state = temp_node.match_resume_with_jd(temp_state)
+                
+                if temp_state.match_score > best_match_score:
+                    best_match_score = temp_state.match_score
+                    best_match_jd = jd
+                    best_match_jd_state = temp_state
 
         if best_match_jd_state is None:
             raise HTTPException(status_code=500, detail="Matching process failed to select a JD.")
              
         final_state = best_match_jd_state
         ACTIVE_SESSIONS[payload.thread_id] = final_state
-        print("✅ Best Match JD ->", best_match_jd.title, best_match_jd.company, best_match_jd.created_at)
+        print("✅ Best Match JD ->", best_match_jd["title"], best_match_jd["company"], best_match_jd["created_at"])
         return {
             "thread_id": payload.thread_id,
-            "best_match_title": best_match_jd.title,
+            "best_match_title": best_match_jd["title"],
             "match_score": final_state.match_score,
-            "jd_text": best_match_jd.text,
+            "jd_text": best_match_jd["text"],
             "matched_skills": final_state.matched_skills,
             "missing_skills": final_state.missing_skills,
-            "company": getattr(best_match_jd, "company", None) or getattr(best_match_jd, "company_name", None),
-            "date": getattr(best_match_jd, "date", None) or getattr(best_match_jd, "created_at", None),
+            "company": best_match_jd["company"],
+            "date": best_match_jd["created_at"],
+            "ranking": ranking,
             "state": final_state.model_dump()
         }
     except Exception as e:
@@ -282,13 +466,14 @@ async def resume_upload(resume: UploadFile = File(...)):
     temp_path = save_resume(resume, thread_id)
     try:
         state = CandidateState(resume_file=temp_path)
-        final_state = graph_builder.run_resume(state, thread_id=thread_id)
+        final_state = await asyncio.to_thread(graph_builder.run_resume, state, thread_id=thread_id)
         
         ACTIVE_SESSIONS[thread_id] = final_state
 
         return JSONResponse({
             "thread_id": thread_id,
             "resume_skills": final_state.candidate_skills,
+            "node_cache": final_state.run_metadata.get("node_cache", {}),
             "state": final_state.model_dump()
         })
     except Exception as e:
@@ -303,13 +488,14 @@ async def jd_upload(payload: StatePayload):
     try:
         candidate_state = CandidateState(**payload.state)
         candidate_state.jd_text = payload.state.get("jd_text", "")
-        final_state = graph_builder.run_jd(candidate_state, thread_id=payload.thread_id)
+        final_state = await asyncio.to_thread(graph_builder.run_jd, candidate_state, thread_id=payload.thread_id)
         
         ACTIVE_SESSIONS[payload.thread_id] = final_state
         
         return {
             "thread_id": payload.thread_id,
             "jd_skills": final_state.jd_skills,
+            "node_cache": final_state.run_metadata.get("node_cache", {}),
             "state": final_state.model_dump()
         }
     except Exception as e:
@@ -320,7 +506,7 @@ async def match_resume_jd(payload: StatePayload):
     # Endpoint kept for compatibility, uses graph_builder.run_match
     try:
         candidate_state = CandidateState(**payload.state)
-        final_state = graph_builder.run_match(candidate_state, thread_id=payload.thread_id)
+        final_state = await asyncio.to_thread(graph_builder.run_match, candidate_state, thread_id=payload.thread_id)
 
         ACTIVE_SESSIONS[payload.thread_id] = final_state
         
@@ -329,6 +515,7 @@ async def match_resume_jd(payload: StatePayload):
             "match_score": final_state.match_score,
             "matched_skills": final_state.matched_skills,
             "missing_skills": final_state.missing_skills,
+            "node_cache": final_state.run_metadata.get("node_cache", {}),
             "state": final_state.model_dump()
         }
     except Exception as e:
@@ -338,7 +525,7 @@ async def match_resume_jd(payload: StatePayload):
 async def skill_gap(payload: StatePayload):
     try:
         candidate_state = CandidateState(**payload.state)
-        final_state = graph_builder.run_skill_gap(candidate_state, thread_id=payload.thread_id)
+        final_state = await asyncio.to_thread(graph_builder.run_skill_gap, candidate_state, thread_id=payload.thread_id)
         
         ACTIVE_SESSIONS[payload.thread_id] = final_state
         
@@ -346,6 +533,7 @@ async def skill_gap(payload: StatePayload):
             "thread_id": payload.thread_id,
             "missing_skills": final_state.missing_skills,
             "skill_resources": final_state.skill_resources,
+            "node_cache": final_state.run_metadata.get("node_cache", {}),
             "state": final_state.model_dump()
         }
     except Exception as e:
@@ -357,13 +545,14 @@ async def skill_gap(payload: StatePayload):
 async def generate_assessment(payload: StatePayload):
     try:
         candidate_state = CandidateState(**payload.state)
-        final_state = graph_builder.run_assessment(candidate_state, thread_id=payload.thread_id)
+        final_state = await asyncio.to_thread(graph_builder.run_assessment, candidate_state, thread_id=payload.thread_id)
 
         ACTIVE_SESSIONS[payload.thread_id] = final_state
         
         return {
             "thread_id": payload.thread_id,
             "mcqs": [q.model_dump() for q in final_state.mcqs],
+            "node_cache": final_state.run_metadata.get("node_cache", {}),
             "state": final_state.model_dump()
         }
     except Exception as e:
@@ -373,19 +562,48 @@ async def generate_assessment(payload: StatePayload):
 async def generate_interview(payload: StatePayload):
     try:
         candidate_state = CandidateState(**payload.state)
-        final_state = graph_builder.run_interview(candidate_state, thread_id=payload.thread_id)
+        final_state = await asyncio.to_thread(graph_builder.run_interview, candidate_state, thread_id=payload.thread_id)
 
         ACTIVE_SESSIONS[payload.thread_id] = final_state
         
         return {
             "thread_id": payload.thread_id,
             "interview_questions": [q.model_dump() for q in final_state.interview_questions],
+            "node_cache": final_state.run_metadata.get("node_cache", {}),
             "state": final_state.model_dump()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/post-match-analysis")
+async def post_match_analysis(payload: StatePayload):
+    """
+    Runs skill gap analysis, MCQ generation and interview question generation
+    as parallel branches on an already matched state (one round trip instead of three).
+    """
+    try:
+        candidate_state = CandidateState(**payload.state)
+        final_state = await asyncio.to_thread(graph_builder.run_post_match, candidate_state, thread_id=payload.thread_id)
+
+        ACTIVE_SESSIONS[payload.thread_id] = final_state
+
+        return {
+            "thread_id": payload.thread_id,
+            "missing_skills": final_state.missing_skills,
+            "skill_resources": final_state.skill_resources,
+            "mcqs": [q.model_dump() for q in final_state.mcqs],
+            "interview_questions": [q.model_dump() for q in final_state.interview_questions],
+            "branch_timings": final_state.run_metadata.get("branches", {}),
+            "node_cache": final_state.run_metadata.get("node_cache", {}),
+            "state": final_state.model_dump()
+        }
+    except Exception as e:
+        import traceback
+        print(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Post-match analysis error: {e}")
+
+
 @app.post("/transcribe-groq")
 async def transcribe_groq(
     thread_id: str = Form(...),
@@ -394,53 +612,46 @@ async def transcribe_groq(
 ):
     """
     Transcribe uploaded audio using Groq Whisper and store text in session memory.
+    The upload is streamed to the API from memory on a pooled async client (no temp files).
     """
-    temp_path = None
     try:
-        # Initialize Groq client
-        if not os.getenv("GROQ_API_KEY"):
-            raise HTTPException(status_code=500, detail="GROQ_API_KEY not configured in environment.")
-            
-        client = Groq(api_key=os.getenv("GROQ_API_KEY"))
-
         # 1. Retrieve current session from memory
-        session_state = ACTIVE_SESSIONS.get(thread_id)
-        if not session_state:
+        if thread_id not in ACTIVE_SESSIONS:
             raise HTTPException(status_code=404, detail=f"Session not found for thread_id: {thread_id}.")
-            
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".webm") as tmp:
-            temp_path = tmp.name
-            content = await file.read()
-            if not content:
-                raise ValueError("Uploaded file content is empty (zero bytes).")
-            tmp.write(content)
-
-        with open(temp_path, "rb") as audio_file:
-            transcription_obj = client.audio.transcriptions.create(
-                file=audio_file,
-                model="whisper-large-v3",
-                response_format="text",
-                language="en"
-            )
 
-        text = str(transcription_obj).strip()
+        content = await file.read()
+        if not content:
+            raise HTTPException(status_code=400, detail="Uploaded file content is empty (zero bytes).")
+
+        # 16 kHz mono, silence-trimmed Opus when ffmpeg is available (AUDIO_PREPROCESS)
+        audio, filename, preprocessing = await audio_preprocessor.process(content, file.filename or "answer.webm")
+        if preprocessing["applied"]:
+            print(f"🎚️ Audio preprocessed: {preprocessing['bytes_in']} -> {preprocessing['bytes_out']} bytes in {preprocessing['elapsed_ms']} ms")
+
+        # Groq Whisper or the offline fake, per TRANSCRIBE_BACKEND
+        text = await transcriber.transcribe(audio, filename)
         print(f"🧠 Transcribed (Q{question_index + 1}): {text[:100]}...")
 
-        if not hasattr(session_state, "audio_transcripts"):
-             session_state.audio_transcripts = {}
+        # Re-read the session after the await and swap in an updated copy, so a state
+        # written by another request meanwhile is never overwritten with a stale one.
+        async with SESSION_LOCKS.setdefault(thread_id, asyncio.Lock()):
+            session_state = ACTIVE_SESSIONS.get(thread_id)
+            if session_state is None:
+                raise HTTPException(status_code=404, detail=f"Session not found for thread_id: {thread_id}.")
+            transcripts = {**session_state.audio_transcripts, int(question_index): text}
+            ACTIVE_SESSIONS[thread_id] = session_state.model_copy(update={"audio_transcripts": transcripts})
 
-        session_state.audio_transcripts[int(question_index)] = text
-        ACTIVE_SESSIONS[thread_id] = session_state
+        # Start evaluating this answer now instead of after the last question.
+        schedule_answer_evaluation(thread_id, int(question_index), text)
 
-        return {"status": "success", "text": text}
+        return {"status": "success", "text": text, "preprocessing": preprocessing}
 
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         print(traceback.format_exc())
-        
-        if temp_path and os.path.exists(temp_path):
-            os.remove(temp_path)
-        
+
         error_detail = str(e)
         if 'BadRequestError' in str(type(e)):
             error_detail = f"Groq API Error (Code 400): {e.response.json().get('error', {}).get('message', 'Check file format/API Key')}"
@@ -449,21 +660,46 @@ async def transcribe_groq(
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {error_detail}")
 
 
+@app.post("/submit-answer")
+async def submit_answer(payload: AnswerPayload):
+    """
+    Store a typed (or edited) answer and evaluate it in the background right away.
+    """
+    session_state = ACTIVE_SESSIONS.get(payload.thread_id)
+    if not session_state:
+        raise HTTPException(status_code=404, detail=f"Session not found for thread_id: {payload.thread_id}.")
+    if not (0 <= payload.question_index < len(session_state.interview_questions)):
+        raise HTTPException(status_code=400, detail=f"Invalid question_index: {payload.question_index}.")
+
+    answers = list(session_state.candidate_answers)
+    answers.extend([""] * (payload.question_index + 1 - len(answers)))
+    answers[payload.question_index] = payload.answer
+    session_state.candidate_answers = answers
+
+    scheduled = schedule_answer_evaluation(payload.thread_id, payload.question_index, payload.answer)
+    return {"status": "success", "thread_id": payload.thread_id, "evaluation_scheduled": scheduled}
+
+
 @app.post("/evaluate-interview")
 async def evaluate_interview(payload: StatePayload):
     """
     Evaluate interview answers using the LLM.
+    Answers evaluated in the background are reused; only missing or edited ones are evaluated here.
     Returns per-question textual feedback only.
     """
     try:
+        await wait_for_pending_evaluations(payload.thread_id)
+
         candidate_state = CandidateState(**payload.state)
-        evaluated_state = graph_builder.run_evaluation(candidate_state, thread_id=payload.thread_id)
+        merge_answer_feedback(payload.thread_id, candidate_state)
+        evaluated_state = await asyncio.to_thread(graph_builder.run_evaluation, candidate_state, thread_id=payload.thread_id)
         ACTIVE_SESSIONS[payload.thread_id] = evaluated_state
 
         return {
             "status": "success",
             "thread_id": payload.thread_id,
             "feedback": evaluated_state.feedback,  
+            "node_cache": evaluated_state.run_metadata.get("node_cache", {}),
             "state": evaluated_state.model_dump(),
         }
 
@@ -471,6 +707,258 @@ async def evaluate_interview(payload: StatePayload):
         print(f"❌ Evaluation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {e}")
 
+# ---------------------------
+# Background jobs (long-running pipeline steps)
+# ---------------------------
+JOB_MAX_WAIT_S = 60
+
+
+def _step_job(run_step, extract, reuse_feedback: bool = False):
+    """
+    Wrap a GraphBuilder.run_* step as a job handler. The session is only
+    updated when the job was not cancelled while it ran.
+    """
+    def handler(payload: Dict, is_cancelled) -> Dict:
+        thread_id = payload["thread_id"]
+        candidate_state = CandidateState(**payload["state"])
+        if reuse_feedback:
+            # Background evaluations live on the event loop: let in-flight ones finish
+            # instead of paying for the same answers again in run_step.
+            asyncio.run_coroutine_threadsafe(wait_for_pending_evaluations(thread_id), app.state.loop).result()
+            merge_answer_feedback(thread_id, candidate_state)
+
+        final_state = run_step(candidate_state, thread_id=thread_id)
+        if is_cancelled():
+            return {}
+        ACTIVE_SESSIONS[thread_id] = final_state
+        return {
+            "thread_id": thread_id,
+            **extract(final_state),
+            "node_cache": final_state.run_metadata.get("node_cache", {}),
+            "state": final_state.model_dump(mode="json"),
+        }
+    return handler
+
+
+JD_FEATURE_BATCH_SIZE = 256
+
+
+def _compute_jd_features(payload: Dict, is_cancelled) -> Dict:
+    """
+    Background pass: skills, cleaned text and embeddings for new JDs. Without ids it
+    catches up on everything missing, including near-duplicate signatures.
+    """
+    if not payload.get("jd_ids"):
+        signed = jd_store.backfill_signatures()
+        if signed:
+            print(f"🔏 Signed {signed} existing JDs for near-duplicate detection")
+    jd_ids = payload.get("jd_ids") or jd_store.missing_feature_ids()
+    computed = 0
+    for i in range(0, len(jd_ids), JD_FEATURE_BATCH_SIZE):
+        if is_cancelled():
+            break
+        jds = jd_store.get_many(jd_ids[i:i + JD_FEATURE_BATCH_SIZE])
+        jd_store.save_features(compute_jd_features(jds))
+        computed += len(jds)
+    return {"requested": len(jd_ids), "computed": computed}
+
+
+job_queue = JobQueue({
+    "jd-features": _compute_jd_features,
+    "skill-gap": _step_job(graph_builder.run_skill_gap, lambda s: {
+        "missing_skills": s.missing_skills,
+        "skill_resources": s.skill_resources,
+    }),
+    "assessment": _step_job(graph_builder.run_assessment, lambda s: {
+        "mcqs": [q.model_dump() for q in s.mcqs],
+    }),
+    "interview": _step_job(graph_builder.run_interview, lambda s: {
+        "interview_questions": [q.model_dump() for q in s.interview_questions],
+    }),
+    "post-match-analysis": _step_job(graph_builder.run_post_match, lambda s: {
+        "missing_skills": s.missing_skills,
+        "skill_resources": s.skill_resources,
+        "mcqs": [q.model_dump() for q in s.mcqs],
+        "interview_questions": [q.model_dump() for q in s.interview_questions],
+        "branch_timings": s.run_metadata.get("branches", {}),
+    }),
+    "evaluate-interview": _step_job(graph_builder.run_evaluation, lambda s: {
+        "feedback": s.feedback,
+    }, reuse_feedback=True),
+})
+
+
+@app.on_event("startup")
+async def start_job_queue():
+    # Job handlers run on worker threads and hand coroutines back to this loop.
+    app.state.loop = asyncio.get_running_loop()
+    job_queue.start()
+    # Catch up on JDs written before features / duplicate signatures existed.
+    await job_queue.asubmit("jd-features", {}, priority=-1)
+    app.state.session_sweeper = asyncio.create_task(evict_idle_sessions())
+
+
+@app.on_event("shutdown")
+async def stop_job_queue():
+    app.state.session_sweeper.cancel()
+    job_queue.stop()
+
+
+@app.post("/jobs/{kind}", status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(kind: str, payload: StatePayload, priority: int = 0):
+    """
+    Queue a pipeline step (skill-gap, assessment, interview, post-match-analysis,
+    evaluate-interview) and return its job id immediately. Higher priority runs first.
+    """
+    if kind not in job_queue.handlers:
+        raise HTTPException(status_code=404, detail=f"Unknown job kind: {kind}. Use one of {sorted(job_queue.handlers)}.")
+    job_id = await job_queue.asubmit(kind, payload.model_dump(), priority=priority)
+    return {"job_id": job_id, "kind": kind, "status": "queued"}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, wait: float = 0):
+    """
+    Job status and, once finished, its result. With `wait` (seconds) the request
+    long-polls until the job finishes or the wait elapses.
+    """
+    wait = max(0.0, min(wait, JOB_MAX_WAIT_S))
+    job = await asyncio.to_thread(job_queue.wait, job_id, wait) if wait else await job_queue.aget(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """Server-Sent Events stream of status changes; the last event carries the result."""
+    if await job_queue.aget(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    async def stream():
+        last_status = None
+        while True:
+            job = await asyncio.to_thread(job_queue.wait, job_id, 15, last_status)
+            if job["status"] != last_status:
+                last_status = job["status"]
+                yield f"event: status\ndata: {json.dumps(job)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            if last_status in TERMINAL_STATUSES:
+                return
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued job, or flag a running one so its result is discarded."""
+    job = await job_queue.acancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@app.get("/jobs")
+async def job_queue_depth():
+    """Job counts per status."""
+    return await job_queue.adepth()
+
+
+@app.get("/llm/routing")
+async def llm_routing():
+    """Per-node routes, latency budgets and rolling p50/p95/error-rate per model."""
+    return graph_builder.router.stats()
+
+
+@app.get("/llm/pool")
+async def llm_pool():
+    """Groq client pool counters: requests, retries, 429s, in-flight and queue-wait time per model."""
+    return client_pool.stats()
+
+
+@app.get("/audio/preprocessing")
+async def audio_preprocessing():
+    """Totals for audio preprocessing: uploads processed/skipped/failed, bytes saved and time spent."""
+    return audio_preprocessor.stats()
+
+
+@app.get("/graph/memo")
+async def graph_memo():
+    """Node memoization hits/misses across threads, and direct fast-path calls."""
+    return dict(graph_builder.memo.stats(), fast_path=graph_builder.direct.stats())
+
+
+@app.get("/match/cache")
+async def match_cache():
+    """Match score store hits/misses: repeat matches re-combine cached component scores."""
+    return match_store.stats()
+
+
+@app.get("/singleflight")
+async def singleflight():
+    """How many identical in-flight search / LLM calls were coalesced into one."""
+    return singleflight_stats()
+
+
+def _runtime_metrics():
+    """Cache hit rates and queue depths, read from the existing stats() counters at scrape time."""
+    caches = {
+        "search": {"hits": search_cache.stats["hits"] + search_cache.stats["stale_hits"],
+                   "misses": search_cache.stats["misses"]},
+        "match_score": match_store.stats(),
+        "node_memo": graph_builder.memo.stats(),
+        "resource_catalog": dict(resource_catalog.stats),
+    }
+    for group, stats in singleflight_stats().items():
+        caches[f"singleflight_{group}"] = {"hits": stats["coalesced"], "misses": stats["executions"]}
+    families = cache_families(caches)
+
+    families.append(("talentfit_job_queue_jobs", "gauge", "Background jobs per status.",
+                     [({"status": s}, n) for s, n in job_queue.depth().items()]))
+    pool = client_pool.stats()
+    families.append(("talentfit_llm_pool_in_flight", "gauge", "Groq requests currently holding a pool slot.",
+                     [({"model": m}, p["in_flight"]) for m, p in pool.items()]))
+    families.append(("talentfit_llm_pool_requests_total", "counter", "Groq requests admitted by the pool.",
+                     [({"model": m}, p["requests"]) for m, p in pool.items()]))
+    families.append(("talentfit_llm_pool_retries_total", "counter", "Groq requests retried after an error.",
+                     [({"model": m}, p["retries"]) for m, p in pool.items()]))
+    families.append(("talentfit_llm_pool_queue_wait_seconds_total", "counter",
+                     "Time spent waiting on the rate limiter and semaphores.",
+                     [({"model": m}, p["queue_wait_ms_total"] / 1000) for m, p in pool.items()]))
+    return families
+
+
+metrics.register_collector(_runtime_metrics)
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus text format: node / LLM / search / embedding / PDF latency histograms, cache hit rates, queue depths."""
+    # Collectors read SQLite (job depth), so render off the event loop.
+    return Response(content=await asyncio.to_thread(metrics.render), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@app.get("/debug/traces")
+async def trace_buffer():
+    """Span ring buffer size and capacity."""
+    return tracer.stats()
+
+
+@app.get("/debug/traces/{thread_id}")
+async def session_trace(thread_id: str, format: str = Query("json", pattern="^(json|text)$")):
+    """
+    Every traced request / job / background task of one session, as waterfalls:
+    spans in start order with depth, offset_ms and duration_ms. format=text draws bars.
+    """
+    traces = tracer.session(thread_id)
+    if not traces:
+        raise HTTPException(status_code=404, detail=f"No spans recorded for thread_id: {thread_id}")
+    if format == "text":
+        return Response(content="\n\n".join(render_waterfall(t) for t in traces) + "\n", media_type="text/plain; charset=utf-8")
+    return {"thread_id": thread_id, "traces": traces}
+
+
 @app.get("/")
 async def root():
     return {"message": "✅ Recruitment Assistant API is running"}
\ No newline at end of file
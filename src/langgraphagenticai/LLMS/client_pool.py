@@ -0,0 +1,248 @@
+import os
+import time
+import random
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+from groq import Groq, AsyncGroq, APIConnectionError, APIStatusError, APITimeoutError
+from dotenv import load_dotenv
+
+load_dotenv()
+
+T = TypeVar("T")
+
+MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "8"))
+MAX_CONCURRENCY_PER_MODEL = int(os.getenv("GROQ_MAX_CONCURRENCY_PER_MODEL", "4"))
+REQUESTS_PER_MINUTE = float(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30"))
+RATE_BURST = float(os.getenv("GROQ_RATE_BURST", "5"))
+MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "4"))
+BACKOFF_BASE_S = float(os.getenv("GROQ_BACKOFF_BASE_S", "0.5"))
+BACKOFF_MAX_S = float(os.getenv("GROQ_BACKOFF_MAX_S", "20"))
+# A retry-after longer than this is not waited out; the error is raised so the
+# router can fail over to another model instead.
+MAX_RETRY_AFTER_S = float(os.getenv("GROQ_MAX_RETRY_AFTER_S", "20"))
+
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `acquire` blocks until a token is available."""
+
+    def __init__(self, rate_per_s: float, capacity: Optional[float] = None):
+        self.rate = rate_per_s
+        self.capacity = capacity or max(1.0, rate_per_s)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    if isinstance(error, APIStatusError):
+        return error.status_code
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, (APIConnectionError, APITimeoutError, httpx.TransportError)):
+        return True
+    status = _status_code(error)
+    return status == 429 or (status is not None and status >= 500)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read retry-after / retry-after-ms from a provider error response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+class ClientPool:
+    """
+    Shared Groq access layer.
+
+    - one keep-alive httpx client (and Groq SDK clients built on it) for the process
+    - global + per-model concurrency semaphores
+    - per-model token-bucket rate limiting (GROQ_REQUESTS_PER_MINUTE)
+    - retries on 429/5xx/connection errors with jittered exponential backoff,
+      honouring retry-after
+    - queue-wait time (limiter + semaphores) tracked per model
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._global = threading.BoundedSemaphore(MAX_CONCURRENCY)
+        self._model_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._groq_client: Optional[Groq] = None
+        self._async_groq_client: Optional[AsyncGroq] = None
+
+    # ---------------- clients ---------------- #
+    def http_client(self) -> httpx.Client:
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+            return self._http_client
+
+    def groq_client(self) -> Groq:
+        client = self.http_client()
+        with self._lock:
+            if self._groq_client is None:
+                self._groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"), http_client=client, max_retries=0)
+            return self._groq_client
+
+    def async_groq_client(self) -> AsyncGroq:
+        with self._lock:
+            if self._async_groq_client is None:
+                self._async_groq_client = AsyncGroq(
+                    api_key=os.getenv("GROQ_API_KEY"),
+                    http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+                    max_retries=0,
+                )
+            return self._async_groq_client
+
+    # ---------------- limits ---------------- #
+    def _model_state(self, model: str):
+        with self._lock:
+            if model not in self._model_semaphores:
+                self._model_semaphores[model] = threading.BoundedSemaphore(MAX_CONCURRENCY_PER_MODEL)
+                self._buckets[model] = TokenBucket(REQUESTS_PER_MINUTE / 60.0, capacity=RATE_BURST)
+                self._stats[model] = {
+                    "requests": 0, "retries": 0, "rate_limited": 0, "errors": 0, "in_flight": 0,
+                    "queue_wait_ms_total": 0.0, "queue_wait_ms_max": 0.0,
+                }
+            return self._model_semaphores[model], self._buckets[model], self._stats[model]
+
+    def _acquire(self, model: str) -> float:
+        semaphore, bucket, stats = self._model_state(model)
+        start = time.perf_counter()
+        bucket.acquire()
+        # Per-model slot first: callers queued behind a saturated model must not
+        # hold global slots that other models could use.
+        semaphore.acquire()
+        self._global.acquire()
+        waited_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            stats["requests"] += 1
+            stats["in_flight"] += 1
+            stats["queue_wait_ms_total"] += waited_ms
+            stats["queue_wait_ms_max"] = max(stats["queue_wait_ms_max"], waited_ms)
+        return waited_ms
+
+    def _release(self, model: str) -> None:
+        semaphore, _, stats = self._model_state(model)
+        self._global.release()
+        semaphore.release()
+        with self._lock:
+            stats["in_flight"] -= 1
+
+    async def _aacquire(self, model: str) -> float:
+        """
+        `_acquire` on a worker thread (the limits are shared with sync `execute`).
+        If the awaiting task is cancelled, the thread still ends up taking the slot
+        after the caller has gone; release it as soon as it does, or it leaks for good.
+        """
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self._acquire, model))
+        try:
+            return await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            def release_orphaned(future: asyncio.Future) -> None:
+                if not future.cancelled() and future.exception() is None:
+                    self._release(model)
+            acquiring.add_done_callback(release_orphaned)
+            raise
+
+    def _retry_delay(self, model: str, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None if the error should be raised."""
+        _, _, stats = self._model_state(model)
+        with self._lock:
+            stats["errors"] += 1
+            if _status_code(error) == 429:
+                stats["rate_limited"] += 1
+        if attempt >= MAX_RETRIES or not is_retryable(error):
+            return None
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            if retry_after > MAX_RETRY_AFTER_S:
+                return None
+            delay = retry_after
+        else:
+            delay = min(BACKOFF_MAX_S, BACKOFF_BASE_S * (2 ** attempt))
+        with self._lock:
+            stats["retries"] += 1
+        # Full jitter on top of the floor so a burst of callers doesn't retry in lockstep.
+        return delay + random.uniform(0, delay)
+
+    # ---------------- execution ---------------- #
+    def execute(self, model: str, fn: Callable[[], T]) -> T:
+        """Blocks on the limiter, the semaphores and retry backoff: call it off the event loop."""
+        attempt = 0
+        while True:
+            self._acquire(model)
+            try:
+                return fn()
+            except Exception as e:
+                delay = self._retry_delay(model, e, attempt)
+                if delay is None:
+                    raise
+                print(f"🔁 [{model}] {type(e).__name__}; retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s")
+            finally:
+                self._release(model)
+            time.sleep(delay)
+            attempt += 1
+
+    async def aexecute(self, model: str, fn: Callable[[], Awaitable[T]]) -> T:
+        attempt = 0
+        while True:
+            # Limiter/semaphores are thread primitives; wait for them off the event loop.
+            await self._aacquire(model)
+            try:
+                return await fn()
+            except Exception as e:
+                delay = self._retry_delay(model, e, attempt)
+                if delay is None:
+                    raise
+                print(f"🔁 [{model}] {type(e).__name__}; retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s")
+            finally:
+                self._release(model)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            snapshot = {}
+            for model, stats in self._stats.items():
+                entry = dict(stats)
+                entry["queue_wait_ms_avg"] = round(stats["queue_wait_ms_total"] / stats["requests"], 1) if stats["requests"] else 0.0
+                entry["queue_wait_ms_total"] = round(stats["queue_wait_ms_total"], 1)
+                entry["queue_wait_ms_max"] = round(stats["queue_wait_ms_max"], 1)
+                snapshot[model] = entry
+            return snapshot
+
+
+# Process-wide pool shared by every GroqLLM and the transcription endpoint.
+client_pool = ClientPool()
@@ -1,21 +1,178 @@
 import os
+import json
+import hashlib
+from typing import Type, TypeVar
+from pydantic import BaseModel, ValidationError
+from groq import BadRequestError
 from langchain_groq import ChatGroq
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
 from dotenv import load_dotenv
 
-class GroqLLM:
+from src.langgraphagenticai.LLMS.client_pool import client_pool
+from src.langgraphagenticai.backends.llm import LLM_BACKENDS, RecordingChatModel, ReplayChatModel
+from src.langgraphagenticai.utils.json_extract import extract_json
+from src.langgraphagenticai.utils.singleflight import SingleFlight
+from src.langgraphagenticai.utils.metrics import LLM_SECONDS, observe_token_usage
+from src.langgraphagenticai.utils.tracing import tracer
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# Structured-output failures that a plain generation + extract_json can recover from:
+# unparseable / invalid payloads, and 400s for schemas or tool calls the model rejects.
+# Rate limits, 5xx and connection errors are raised so the router can fail over.
+SCHEMA_ERRORS = (OutputParserException, ValidationError, json.JSONDecodeError, BadRequestError)
+
+# How schema-bound generations are requested from the provider:
+#   function_calling | json_schema | json_mode | off (plain prompt + JSON extractor)
+STRUCTURED_OUTPUT_MODES = ("function_calling", "json_schema", "json_mode", "off")
+# json_mode only asks for *some* JSON object: the schema has to travel in the prompt.
+PROMPT_SCHEMA_MODES = ("json_mode",)
+
+# Identical generations in flight at the same time share one provider call.
+llm_flight = SingleFlight("llm")
+
+
+def flight_key(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def reasoning_kwargs(model_name: str) -> dict:
+    """Turn hidden chain-of-thought off (or at least out of the payload) where Groq supports it."""
+    if os.getenv("LLM_KEEP_REASONING", "").lower() in ("1", "true", "yes"):
+        return {}
+    name = model_name.lower()
+    if name.startswith("qwen/qwen3"):
+        return {"reasoning_effort": "none"}
+    if "deepseek-r1" in name:
+        return {"reasoning_format": "hidden"}
+    return {}
+
+
+_format_instructions = {}
+
+
+def format_instructions(schema: Type[BaseModel]) -> str:
+    """LangChain's textual format instructions for `schema` (cached per schema)."""
+    if schema not in _format_instructions:
+        _format_instructions[schema] = PydanticOutputParser(pydantic_object=schema).get_format_instructions()
+    return _format_instructions[schema]
+
+
+def with_instructions(prompt: str, schema: Type[BaseModel]) -> str:
+    return f"{prompt}\n\n{format_instructions(schema)}"
+
+
+class TokenUsageCallback(BaseCallbackHandler):
+    """Feeds the provider's token usage for every live call into the LLM token histogram."""
+
     def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def on_llm_end(self, response, **kwargs) -> None:
+        usage = (response.llm_output or {}).get("token_usage")
+        if not usage and response.generations and response.generations[0]:
+            usage = getattr(getattr(response.generations[0][0], "message", None), "usage_metadata", None)
+        tokens = observe_token_usage(self.model_name, usage)
+        if tokens:
+            tracer.annotate(**tokens)
+
+
+class GroqLLM:
+    def __init__(self, model_name: str, structured_output: str | None = None):
         # The constructor now accepts the model_name
         self.model_name = model_name
+        # groq (live) | record (live + fixtures) | replay (fixtures only, offline)
+        self.backend = os.getenv("LLM_BACKEND", "groq")
+        if self.backend not in LLM_BACKENDS:
+            raise ValueError(f"Unknown LLM_BACKEND: {self.backend}")
+        self.structured_output = structured_output or os.getenv("LLM_STRUCTURED_OUTPUT", "function_calling")
+        if self.structured_output not in STRUCTURED_OUTPUT_MODES:
+            raise ValueError(f"Unknown structured output mode: {self.structured_output}")
         self.llm = self.get_llm_model()
+        self._structured_llms = {}
 
     def get_llm_model(self):
+        if self.backend == "replay":
+            return ReplayChatModel(self.model_name)
         try:
             load_dotenv()
             groq_api_key = os.getenv("GROQ_API_KEY")
             if not groq_api_key:
                 raise ValueError("GROQ_API_KEY environment variable not set.")
             # Use the model_name from the instance variable
-            llm = ChatGroq(api_key=groq_api_key, model=self.model_name)
+            # Shared keep-alive HTTP client; retries are handled by the client pool, not the SDK.
+            llm = ChatGroq(
+                api_key=groq_api_key,
+                model=self.model_name,
+                http_client=client_pool.http_client(),
+                max_retries=0,
+                callbacks=[TokenUsageCallback(self.model_name)],
+                **reasoning_kwargs(self.model_name),
+            )
         except Exception as e:
             raise ValueError(f"Error occurred with exception: {e}")
-        return llm
\ No newline at end of file
+        if self.backend == "record":
+            return RecordingChatModel(llm, self.model_name)
+        return llm
+
+    def _execute(self, fn, mode: str):
+        def timed():
+            # Timed per attempt inside the pool, so queue wait and retry backoff are excluded.
+            with tracer.span(f"llm.{mode}", kind="llm", model=self.model_name), \
+                    LLM_SECONDS.time(model=self.model_name, mode=mode):
+                return fn()
+
+        # Replayed responses have no provider to protect, so skip the rate limiter / semaphores.
+        if self.backend == "replay":
+            return timed()
+        return client_pool.execute(self.model_name, timed)
+
+    @property
+    def uses_structured_output(self) -> bool:
+        return self.structured_output != "off"
+
+    def generate(self, prompt: str) -> str:
+        """Plain text generation; returns the message content."""
+        def call() -> str:
+            response = self._execute(lambda: self.llm.invoke(prompt), "text")
+            return (response.content or "").strip()
+
+        return llm_flight.do(flight_key(self.model_name, "text", prompt), call)
+
+    def generate_structured(self, prompt: str, schema: Type[SchemaT]) -> SchemaT:
+        """
+        Generate an instance of `schema`.
+
+        Uses provider-side structured output (tool calling / JSON schema / JSON mode)
+        when enabled, so the payload arrives already parsed. In "off" mode, or if the
+        provider rejects the schema or returns an invalid payload (SCHEMA_ERRORS),
+        falls back to a plain generation parsed once by `extract_json`.
+        Prompts carry no schema; the format instructions are appended here whenever the
+        provider is not given the schema itself (json_mode and the text path).
+        """
+        if self.uses_structured_output:
+            if self.structured_output in PROMPT_SCHEMA_MODES:
+                prompt_sent = with_instructions(prompt, schema)
+            else:
+                prompt_sent = prompt
+            try:
+                runnable = self._structured_llms.get(schema)
+                if runnable is None:
+                    runnable = self.llm.with_structured_output(schema, method=self.structured_output)
+                    self._structured_llms[schema] = runnable
+                key = flight_key(self.model_name, self.structured_output, schema.__name__, prompt_sent)
+                result = llm_flight.do(key, lambda: self._execute(lambda: runnable.invoke(prompt_sent), self.structured_output))
+                return result if isinstance(result, schema) else schema.model_validate(result)
+            except SCHEMA_ERRORS as e:
+                print(f"⚠️ Structured output ({self.structured_output}) failed for {schema.__name__}: {e}. Falling back to text mode.")
+
+        return coerce_to_schema(extract_json(self.generate(with_instructions(prompt, schema))), schema)
+
+
+def coerce_to_schema(obj, schema: Type[SchemaT]) -> SchemaT:
+    """Validate `obj`; a bare list is wrapped into the schema's single list field."""
+    if isinstance(obj, list) and len(schema.model_fields) == 1:
+        obj = {next(iter(schema.model_fields)): obj}
+    return schema.model_validate(obj)
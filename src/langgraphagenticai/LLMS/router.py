@@ -0,0 +1,182 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from src.langgraphagenticai.LLMS.groqllm import GroqLLM
+
+T = TypeVar("T")
+
+# Node method -> ordered model preference (first = primary, rest = fallbacks).
+# "{default}" is replaced by the GraphBuilder's model.
+DEFAULT_ROUTES: Dict[str, List[str]] = {
+    "skill_gap_analysis": ["llama-3.1-8b-instant", "{default}"],
+    "generate_assessment": ["{default}", "llama-3.3-70b-versatile"],
+    "generate_interview_questions": ["{default}", "llama-3.3-70b-versatile"],
+    "evaluate_answers": ["{default}", "llama-3.1-8b-instant"],
+}
+
+# p95 latency budget per node; a model whose rolling p95 exceeds it is demoted.
+DEFAULT_LATENCY_BUDGETS_MS: Dict[str, float] = {
+    "skill_gap_analysis": 5000,
+    "generate_assessment": 45000,
+    "generate_interview_questions": 25000,
+    "evaluate_answers": 8000,
+}
+
+STATS_WINDOW = 100        # calls kept per model for the rolling percentiles
+STATS_MAX_AGE_S = 300     # older observations expire, so a demoted model gets retried
+MIN_SAMPLES = 5           # don't demote a model on fewer observations than this
+MAX_ERROR_RATE = 0.5      # demote a model failing more often than this
+
+
+class ModelStats:
+    """Rolling latency / error window for one model."""
+
+    def __init__(self, window: int = STATS_WINDOW, max_age_s: float = STATS_MAX_AGE_S):
+        self._calls = deque(maxlen=window)
+        self._max_age_s = max_age_s
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        with self._lock:
+            self._calls.append((time.monotonic(), latency_ms, ok))
+
+    def snapshot(self) -> Dict[str, float]:
+        cutoff = time.monotonic() - self._max_age_s
+        with self._lock:
+            calls = [(latency, ok) for ts, latency, ok in self._calls if ts >= cutoff]
+        latencies = sorted(latency for latency, ok in calls if ok)
+
+        def pct(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 1)
+
+        errors = sum(1 for _, ok in calls if not ok)
+        return {
+            "calls": len(calls),
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "error_rate": round(errors / len(calls), 3) if calls else 0.0,
+        }
+
+
+def load_route_config() -> Tuple[Dict[str, List[str]], Dict[str, float]]:
+    """
+    Routes and budgets, optionally overridden with LLM_ROUTES, e.g.
+    {"skill_gap_analysis": {"models": ["llama-3.1-8b-instant"], "budget_ms": 3000}}
+    """
+    routes = {node: list(models) for node, models in DEFAULT_ROUTES.items()}
+    budgets = dict(DEFAULT_LATENCY_BUDGETS_MS)
+    raw = os.getenv("LLM_ROUTES")
+    if raw:
+        for node, cfg in json.loads(raw).items():
+            if cfg.get("models"):
+                routes[node] = list(cfg["models"])
+            if cfg.get("budget_ms"):
+                budgets[node] = float(cfg["budget_ms"])
+    return routes, budgets
+
+
+class ModelRouter:
+    """
+    Assigns a model to each node method and fails over between models.
+
+    Ordering for a call: the configured preference list, except that models whose
+    rolling p95 is over the node's latency budget (or whose error rate is too high)
+    are moved behind the healthy ones, fastest first. If a call raises, the next
+    model in the plan is tried. Every call returns a decision dict for metadata.
+    """
+
+    def __init__(self, default_model: str, llms: Optional[Dict[str, GroqLLM]] = None,
+                 routes: Optional[Dict[str, List[str]]] = None,
+                 budgets: Optional[Dict[str, float]] = None):
+        self.default_model = default_model
+        config_routes, config_budgets = load_route_config()
+        self.routes = routes or config_routes
+        self.budgets = budgets or config_budgets
+        self._llms: Dict[str, GroqLLM] = dict(llms or {})
+        self._stats: Dict[str, ModelStats] = {}
+        self._lock = threading.Lock()
+
+    # ---------------- models ---------------- #
+    def llm(self, model_name: str) -> GroqLLM:
+        with self._lock:
+            if model_name not in self._llms:
+                self._llms[model_name] = GroqLLM(model_name=model_name)
+            return self._llms[model_name]
+
+    def _model_stats(self, model_name: str) -> ModelStats:
+        with self._lock:
+            return self._stats.setdefault(model_name, ModelStats())
+
+    def models_for(self, node: str) -> List[str]:
+        models = [m.replace("{default}", self.default_model) for m in self.routes.get(node, ["{default}"])]
+        if self.default_model not in models:
+            models.append(self.default_model)
+        return list(dict.fromkeys(models))
+
+    # ---------------- routing ---------------- #
+    def plan(self, node: str) -> Tuple[List[str], str]:
+        budget = self.budgets.get(node)
+        healthy, demoted = [], []
+        for model in self.models_for(node):
+            snap = self._model_stats(model).snapshot()
+            too_slow = (
+                budget is not None and snap["calls"] >= MIN_SAMPLES
+                and snap["p95_ms"] is not None and snap["p95_ms"] > budget
+            )
+            failing = snap["calls"] >= MIN_SAMPLES and snap["error_rate"] > MAX_ERROR_RATE
+            (demoted if too_slow or failing else healthy).append((model, snap))
+
+        if not demoted:
+            return [m for m, _ in healthy], "primary"
+        # Among demoted models prefer the fastest one.
+        demoted.sort(key=lambda item: item[1]["p95_ms"] or float("inf"))
+        order = [m for m, _ in healthy] + [m for m, _ in demoted]
+        reason = f"demoted over budget/error-rate: {[m for m, _ in demoted]}"
+        return order, reason
+
+    def call(self, node: str, fn: Callable[[GroqLLM], T]) -> Tuple[T, Dict]:
+        """Run `fn(llm)` on the routed model, failing over on errors."""
+        order, reason = self.plan(node)
+        attempts = []
+        last_error: Optional[Exception] = None
+
+        for model in order:
+            start = time.perf_counter()
+            try:
+                result = fn(self.llm(model))
+            except Exception as e:
+                latency_ms = (time.perf_counter() - start) * 1000
+                self._model_stats(model).record(latency_ms, ok=False)
+                attempts.append({"model": model, "latency_ms": round(latency_ms, 1), "error": str(e)[:200]})
+                last_error = e
+                print(f"⚠️ [{node}] {model} failed ({e}); trying next model")
+                continue
+
+            latency_ms = (time.perf_counter() - start) * 1000
+            self._model_stats(model).record(latency_ms, ok=True)
+            attempts.append({"model": model, "latency_ms": round(latency_ms, 1)})
+            decision = {
+                "model": model,
+                "reason": reason if len(attempts) == 1 else "failover after error",
+                "budget_ms": self.budgets.get(node),
+                "latency_ms": round(latency_ms, 1),
+                "attempts": attempts,
+            }
+            return result, decision
+
+        raise last_error or RuntimeError(f"No model available for node {node}")
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            models = list(self._stats)
+        return {
+            "routes": {node: self.models_for(node) for node in self.routes},
+            "budgets_ms": self.budgets,
+            "models": {model: self._model_stats(model).snapshot() for model in models},
+        }
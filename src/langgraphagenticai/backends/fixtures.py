@@ -0,0 +1,77 @@
+import os
+import json
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from typing import Any, Optional
+
+FIXTURE_DIR = os.getenv("FIXTURE_DIR", "./fixtures")
+# Synthetic latency added on replay: mean +/- jitter, deterministic per fixture key.
+REPLAY_LATENCY_MS = float(os.getenv("REPLAY_LATENCY_MS", "0"))
+REPLAY_LATENCY_JITTER_MS = float(os.getenv("REPLAY_LATENCY_JITTER_MS", "0"))
+
+
+class FixtureMissingError(KeyError):
+    """Raised in replay mode when no recorded response exists for a request."""
+
+
+def fixture_key(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FixtureStore:
+    """
+    Recorded request/response pairs on disk: <FIXTURE_DIR>/<namespace>/<key>.json.
+    One file per request keeps fixtures diffable and safe to record concurrently.
+    """
+
+    def __init__(self, namespace: str, root: str = FIXTURE_DIR):
+        self.directory = os.path.join(root, namespace)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["response"]
+
+    def require(self, key: str, description: str) -> Any:
+        response = self.load(key)
+        if response is None:
+            raise FixtureMissingError(f"No recorded fixture for {description} (key {key[:12]}) in {self.directory}")
+        return response
+
+    def save(self, key: str, request: Any, response: Any) -> None:
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self._path(key) + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"request": request, "response": response}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self._path(key))
+
+
+def replay_delay_s(key: str) -> float:
+    """Synthetic latency for a fixture; the same key always gets the same delay."""
+    if REPLAY_LATENCY_MS <= 0 and REPLAY_LATENCY_JITTER_MS <= 0:
+        return 0.0
+    jitter = random.Random(key).uniform(-REPLAY_LATENCY_JITTER_MS, REPLAY_LATENCY_JITTER_MS)
+    return max(0.0, REPLAY_LATENCY_MS + jitter) / 1000
+
+
+def simulate_latency(key: str) -> None:
+    delay = replay_delay_s(key)
+    if delay:
+        time.sleep(delay)
+
+
+async def asimulate_latency(key: str) -> None:
+    delay = replay_delay_s(key)
+    if delay:
+        await asyncio.sleep(delay)
@@ -0,0 +1,78 @@
+from typing import Any, Type
+from pydantic import BaseModel
+from langchain_core.messages import AIMessage
+
+from src.langgraphagenticai.backends.fixtures import FixtureStore, fixture_key, simulate_latency
+
+# LLM_BACKEND: groq (live) | record (live + save fixtures) | replay (fixtures only, no network)
+LLM_BACKENDS = ("groq", "record", "replay")
+
+_store = FixtureStore("llm")
+
+
+def _text_key(model_name: str, prompt: Any) -> str:
+    return fixture_key("text", model_name, str(prompt))
+
+
+def _structured_key(model_name: str, schema: Type[BaseModel], method: str, prompt: Any) -> str:
+    return fixture_key("structured", model_name, schema.__name__, method, str(prompt))
+
+
+class _RecordingStructured:
+    def __init__(self, inner, model_name: str, schema: Type[BaseModel], method: str):
+        self.inner, self.model_name, self.schema, self.method = inner, model_name, schema, method
+
+    def invoke(self, prompt):
+        result = self.inner.invoke(prompt)
+        payload = result.model_dump() if isinstance(result, BaseModel) else result
+        key = _structured_key(self.model_name, self.schema, self.method, prompt)
+        _store.save(key, {"model": self.model_name, "schema": self.schema.__name__, "prompt": str(prompt)}, payload)
+        return result
+
+
+class RecordingChatModel:
+    """Wraps a live chat model and stores every response as a fixture."""
+
+    def __init__(self, inner, model_name: str):
+        self.inner = inner
+        self.model_name = model_name
+
+    def invoke(self, prompt):
+        response = self.inner.invoke(prompt)
+        _store.save(
+            _text_key(self.model_name, prompt),
+            {"model": self.model_name, "prompt": str(prompt)},
+            {"content": response.content},
+        )
+        return response
+
+    def with_structured_output(self, schema: Type[BaseModel], method: str = "function_calling", **kwargs):
+        inner = self.inner.with_structured_output(schema, method=method, **kwargs)
+        return _RecordingStructured(inner, self.model_name, schema, method)
+
+
+class _ReplayStructured:
+    def __init__(self, model_name: str, schema: Type[BaseModel], method: str):
+        self.model_name, self.schema, self.method = model_name, schema, method
+
+    def invoke(self, prompt):
+        key = _structured_key(self.model_name, self.schema, self.method, prompt)
+        payload = _store.require(key, f"{self.model_name} {self.schema.__name__} generation")
+        simulate_latency(key)
+        return self.schema.model_validate(payload)
+
+
+class ReplayChatModel:
+    """Serves recorded responses with configurable synthetic latency; never touches the network."""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def invoke(self, prompt):
+        key = _text_key(self.model_name, prompt)
+        payload = _store.require(key, f"{self.model_name} text generation")
+        simulate_latency(key)
+        return AIMessage(content=payload["content"])
+
+    def with_structured_output(self, schema: Type[BaseModel], method: str = "function_calling", **kwargs):
+        return _ReplayStructured(self.model_name, schema, method)
@@ -0,0 +1,102 @@
+import os
+from typing import Dict, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from src.langgraphagenticai.backends.fixtures import (
+    FixtureStore, fixture_key, simulate_latency, asimulate_latency,
+)
+
+load_dotenv()
+
+# SEARCH_BACKEND: tavily (live) | record (live + save fixtures) | replay (fixtures only)
+SEARCH_BACKENDS = ("tavily", "record", "replay")
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+SEARCH_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+
+class TavilyBackend:
+    """Live Tavily search. The client is built lazily, so importing the tool needs no API key."""
+
+    # Results may be served from the search cache.
+    cacheable = True
+
+    def __init__(self):
+        self._client = None
+
+    def search(self, query: str, params: Dict) -> Dict:
+        if self._client is None:
+            from tavily import TavilyClient  # Import the Tavily client
+            self._client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+        return self._client.search(query=query, **params)
+
+    async def asearch(self, query: str, params: Dict, client: Optional[httpx.AsyncClient] = None) -> Dict:
+        payload = {"query": query, **params}
+        headers = {"Authorization": f"Bearer {os.getenv('TAVILY_API_KEY')}"}
+        if client is None:
+            async with httpx.AsyncClient(timeout=SEARCH_TIMEOUT) as own_client:
+                response = await own_client.post(TAVILY_SEARCH_URL, json=payload, headers=headers)
+        else:
+            response = await client.post(TAVILY_SEARCH_URL, json=payload, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+
+class RecordingSearchBackend:
+    """Live search that stores every raw response as a fixture."""
+
+    # Every query must reach the backend, or cache hits would never be recorded.
+    cacheable = False
+
+    def __init__(self, inner: TavilyBackend):
+        self.inner = inner
+        self.store = FixtureStore("search")
+
+    def _save(self, query: str, params: Dict, result: Dict) -> Dict:
+        self.store.save(fixture_key(query, params), {"query": query, "params": params}, result)
+        return result
+
+    def search(self, query: str, params: Dict) -> Dict:
+        return self._save(query, params, self.inner.search(query, params))
+
+    async def asearch(self, query: str, params: Dict, client: Optional[httpx.AsyncClient] = None) -> Dict:
+        return self._save(query, params, await self.inner.asearch(query, params, client))
+
+
+class ReplaySearchBackend:
+    """Serves recorded search responses with synthetic latency; never touches the network."""
+
+    # Replay must hit the fixtures, so a missing one surfaces instead of a cached answer.
+    cacheable = False
+
+    def __init__(self):
+        self.store = FixtureStore("search")
+
+    def search(self, query: str, params: Dict) -> Dict:
+        key = fixture_key(query, params)
+        result = self.store.require(key, f"search '{query}'")
+        simulate_latency(key)
+        return result
+
+    async def asearch(self, query: str, params: Dict, client: Optional[httpx.AsyncClient] = None) -> Dict:
+        key = fixture_key(query, params)
+        result = self.store.require(key, f"search '{query}'")
+        await asimulate_latency(key)
+        return result
+
+
+def build_search_backend(name: Optional[str] = None):
+    name = name or os.getenv("SEARCH_BACKEND", "tavily")
+    if name not in SEARCH_BACKENDS:
+        raise ValueError(f"Unknown SEARCH_BACKEND: {name}")
+    if name == "replay":
+        return ReplaySearchBackend()
+    if name == "record":
+        return RecordingSearchBackend(TavilyBackend())
+    return TavilyBackend()
+
+
+# Process-wide backend used by WebSearchTool / InterviewWebSearchTool.
+search_backend = build_search_backend()
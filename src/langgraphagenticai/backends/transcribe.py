@@ -0,0 +1,59 @@
+import os
+import hashlib
+from typing import Optional
+
+from src.langgraphagenticai.LLMS.client_pool import client_pool
+from src.langgraphagenticai.backends.fixtures import FixtureStore, asimulate_latency
+
+# TRANSCRIBE_BACKEND: groq (Whisper on Groq) | fake (deterministic, offline)
+TRANSCRIBE_BACKENDS = ("groq", "fake")
+WHISPER_MODEL = "whisper-large-v3"
+
+
+class GroqTranscriber:
+    """Groq Whisper on the pooled async client; audio is sent from memory, never written to disk."""
+
+    async def transcribe(self, content: bytes, filename: str) -> str:
+        if not os.getenv("GROQ_API_KEY"):
+            raise ValueError("GROQ_API_KEY not configured in environment.")
+        client = client_pool.async_groq_client()
+
+        async def create_transcription():
+            return await client.audio.transcriptions.create(
+                file=(filename, content),
+                model=WHISPER_MODEL,
+                response_format="text",
+                language="en"
+            )
+
+        return str(await client_pool.aexecute(WHISPER_MODEL, create_transcription)).strip()
+
+
+class FakeTranscriber:
+    """
+    Deterministic stand-in for Whisper: returns the transcript recorded for the
+    audio's hash in fixtures/transcripts/<sha256>.json if present, otherwise a
+    synthetic transcript derived from the hash. Adds the replay synthetic latency.
+    """
+
+    def __init__(self):
+        self.store = FixtureStore("transcripts")
+
+    async def transcribe(self, content: bytes, filename: str) -> str:
+        digest = hashlib.sha256(content).hexdigest()
+        await asimulate_latency(digest)
+        recorded = self.store.load(digest)
+        if recorded is not None:
+            return str(recorded)
+        return f"Synthetic transcript {digest[:8]}: the candidate explains their approach step by step."
+
+
+def build_transcriber(name: Optional[str] = None):
+    name = name or os.getenv("TRANSCRIBE_BACKEND", "groq")
+    if name not in TRANSCRIBE_BACKENDS:
+        raise ValueError(f"Unknown TRANSCRIBE_BACKEND: {name}")
+    return FakeTranscriber() if name == "fake" else GroqTranscriber()
+
+
+# Process-wide transcriber used by /transcribe-groq.
+transcriber = build_transcriber()
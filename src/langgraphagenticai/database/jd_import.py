@@ -0,0 +1,124 @@
+import io
+import os
+import csv
+import json
+import time
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, ValidationError
+
+from src.langgraphagenticai.database.jd_store import JDStore
+
+JD_IMPORT_BATCH_SIZE = int(os.getenv("JD_IMPORT_BATCH_SIZE", "1000"))
+# Row errors returned in the report; the total is always counted.
+JD_IMPORT_MAX_ERRORS = int(os.getenv("JD_IMPORT_MAX_ERRORS", "100"))
+IMPORT_FORMATS = ("jsonl", "csv")
+
+
+class JDImportRow(BaseModel):
+    title: str = Field(..., min_length=1)
+    company: str = ""
+    text: str = Field(..., min_length=1)
+    created_at: Optional[str] = None
+
+
+class ImportReport(BaseModel):
+    format: str
+    rows_read: int = 0
+    inserted: int = 0
+    duplicates_flagged: int = 0
+    duplicates_merged: int = 0
+    failed: int = 0
+    errors: List[Dict] = Field(default_factory=list)
+    elapsed_s: float = 0.0
+    rows_per_sec: float = 0.0
+    jd_ids: List[int] = Field(default_factory=list, exclude=True)
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str] = None) -> str:
+    name = (filename or "").lower()
+    if name.endswith(".csv") or (content_type or "").startswith("text/csv"):
+        return "csv"
+    return "jsonl"
+
+
+def iter_rows(stream: IO[bytes], fmt: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """
+    Yields (row number, raw row, parse error) one line at a time, so an
+    export of any size is never held in memory.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            csv.field_size_limit(16 * 1024 * 1024)
+            for line_no, row in enumerate(csv.DictReader(text), start=2):
+                # Short rows give None for missing columns; treat them as absent.
+                yield line_no, {k: v for k, v in row.items() if k and v is not None}, None
+            return
+
+        for line_no, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, None, f"Invalid JSON: {e.msg}"
+                continue
+            if not isinstance(row, dict):
+                yield line_no, None, "Expected a JSON object"
+                continue
+            yield line_no, row, None
+    except UnicodeDecodeError as e:
+        yield -1, None, f"File is not valid UTF-8: {e.reason}"
+    finally:
+        # Leave the caller's stream open.
+        text.detach()
+
+
+def import_jds(store: JDStore, stream: IO[bytes], fmt: str, batch_size: int = JD_IMPORT_BATCH_SIZE) -> ImportReport:
+    """
+    Validate rows as they stream in and insert them in batched transactions. Blocking:
+    run it on its own thread, not the store pool's executor, since a pooled connection
+    is only needed for each batch's commit (JDStore.add_many).
+    """
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Unsupported import format: {fmt}. Use one of {IMPORT_FORMATS}.")
+    report = ImportReport(format=fmt)
+    start = time.perf_counter()
+    batch: List[Tuple[str, str, str, Optional[str]]] = []
+
+    def fail(line_no: int, error: str):
+        report.failed += 1
+        if len(report.errors) < JD_IMPORT_MAX_ERRORS:
+            report.errors.append({"row": line_no, "error": error})
+
+    def flush():
+        if batch:
+            for result in store.add_many(batch):
+                if result["merged"]:
+                    report.duplicates_merged += 1
+                    continue
+                report.jd_ids.append(result["id"])
+                report.inserted += 1
+                if result["duplicate_of"] is not None:
+                    report.duplicates_flagged += 1
+            batch.clear()
+
+    for line_no, raw, error in iter_rows(stream, fmt):
+        report.rows_read += 1
+        if error:
+            fail(line_no, error)
+            continue
+        try:
+            row = JDImportRow.model_validate(raw)
+        except ValidationError as e:
+            fail(line_no, "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+            continue
+        batch.append((row.title.strip(), row.company.strip(), row.text, row.created_at))
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    report.elapsed_s = round(time.perf_counter() - start, 3)
+    report.rows_per_sec = round(report.rows_read / report.elapsed_s, 1) if report.elapsed_s else float(report.rows_read)
+    return report
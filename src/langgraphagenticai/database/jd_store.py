@@ -0,0 +1,486 @@
+import os
+import re
+import json
+import time
+import functools
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from src.langgraphagenticai.database.pool import SQLitePool
+from src.langgraphagenticai.database.near_duplicates import (
+    LSH_BANDS, JD_DUPLICATE_THRESHOLD, minhash_signature, lsh_buckets, estimate_similarity, signature_from_bytes,
+)
+
+JD_DB_PATH = os.getenv("JD_DB_PATH", "./jds.db")
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS job_descriptions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        text TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS ix_job_descriptions_title ON job_descriptions (title);
+    CREATE INDEX IF NOT EXISTS ix_job_descriptions_company ON job_descriptions (company COLLATE NOCASE, id);
+    CREATE INDEX IF NOT EXISTS ix_job_descriptions_created_at ON job_descriptions (created_at, id);
+
+    -- Bumped by triggers on every write (from any process), used for listing ETags.
+    CREATE TABLE IF NOT EXISTS jd_table_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO jd_table_version (id, version) VALUES (1, 0);
+    CREATE TRIGGER IF NOT EXISTS trg_jd_version_insert AFTER INSERT ON job_descriptions
+    BEGIN UPDATE jd_table_version SET version = version + 1 WHERE id = 1; END;
+    CREATE TRIGGER IF NOT EXISTS trg_jd_version_update AFTER UPDATE ON job_descriptions
+    BEGIN UPDATE jd_table_version SET version = version + 1 WHERE id = 1; END;
+    CREATE TRIGGER IF NOT EXISTS trg_jd_version_delete AFTER DELETE ON job_descriptions
+    BEGIN UPDATE jd_table_version SET version = version + 1 WHERE id = 1; END;
+
+    -- External-content FTS5 index over title/company/text, kept in sync by triggers.
+    CREATE VIRTUAL TABLE IF NOT EXISTS job_descriptions_fts USING fts5(
+        title, company, text,
+        content='job_descriptions', content_rowid='id',
+        tokenize='porter unicode61'
+    );
+    CREATE TRIGGER IF NOT EXISTS trg_jd_fts_insert AFTER INSERT ON job_descriptions BEGIN
+        INSERT INTO job_descriptions_fts (rowid, title, company, text) VALUES (new.id, new.title, new.company, new.text);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_jd_fts_delete AFTER DELETE ON job_descriptions BEGIN
+        INSERT INTO job_descriptions_fts (job_descriptions_fts, rowid, title, company, text)
+        VALUES ('delete', old.id, old.title, old.company, old.text);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_jd_fts_update AFTER UPDATE ON job_descriptions BEGIN
+        INSERT INTO job_descriptions_fts (job_descriptions_fts, rowid, title, company, text)
+        VALUES ('delete', old.id, old.title, old.company, old.text);
+        INSERT INTO job_descriptions_fts (rowid, title, company, text) VALUES (new.id, new.title, new.company, new.text);
+    END;
+
+    -- Per-JD features computed in the background (skills, cleaned text, embedding).
+    CREATE TABLE IF NOT EXISTS jd_features (
+        jd_id INTEGER PRIMARY KEY REFERENCES job_descriptions (id) ON DELETE CASCADE,
+        skills TEXT NOT NULL,
+        experience TEXT,
+        clean_text TEXT NOT NULL,
+        embedding BLOB,
+        computed_at REAL NOT NULL
+    );
+    CREATE TRIGGER IF NOT EXISTS trg_jd_features_stale AFTER UPDATE OF text ON job_descriptions BEGIN
+        DELETE FROM jd_features WHERE jd_id = new.id;
+    END;
+
+    -- Near-duplicate detection: MinHash signature + LSH band buckets per JD.
+    -- cluster_id is the id of the cluster's representative (its oldest JD).
+    CREATE TABLE IF NOT EXISTS jd_signatures (
+        jd_id INTEGER PRIMARY KEY,
+        minhash BLOB NOT NULL,
+        cluster_id INTEGER NOT NULL,
+        similarity REAL
+    );
+    CREATE INDEX IF NOT EXISTS ix_jd_signatures_cluster ON jd_signatures (cluster_id);
+    CREATE TABLE IF NOT EXISTS jd_lsh_buckets (
+        band INTEGER NOT NULL,
+        bucket INTEGER NOT NULL,
+        jd_id INTEGER NOT NULL,
+        PRIMARY KEY (band, bucket, jd_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS ix_jd_lsh_buckets_jd ON jd_lsh_buckets (jd_id);
+    -- Removing (or rewriting) a JD drops its signature and promotes the next-oldest member.
+    CREATE TRIGGER IF NOT EXISTS trg_jd_signature_delete AFTER DELETE ON job_descriptions BEGIN
+        DELETE FROM jd_lsh_buckets WHERE jd_id = old.id;
+        DELETE FROM jd_signatures WHERE jd_id = old.id;
+        UPDATE jd_signatures SET similarity = NULL
+        WHERE jd_id = (SELECT MIN(jd_id) FROM jd_signatures WHERE cluster_id = old.id);
+        UPDATE jd_signatures SET cluster_id = (SELECT MIN(jd_id) FROM jd_signatures WHERE cluster_id = old.id)
+        WHERE cluster_id = old.id;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_jd_signature_stale AFTER UPDATE OF text ON job_descriptions BEGIN
+        DELETE FROM jd_lsh_buckets WHERE jd_id = new.id;
+        DELETE FROM jd_signatures WHERE jd_id = new.id;
+        UPDATE jd_signatures SET similarity = NULL
+        WHERE jd_id = (SELECT MIN(jd_id) FROM jd_signatures WHERE cluster_id = new.id);
+        UPDATE jd_signatures SET cluster_id = (SELECT MIN(jd_id) FROM jd_signatures WHERE cluster_id = new.id)
+        WHERE cluster_id = new.id;
+    END;
+"""
+
+JD_FIELDS = ("id", "title", "company", "text", "created_at")
+JD_SUMMARY_FIELDS = ("id", "title")
+JD_PAGE_MAX = int(os.getenv("JD_PAGE_MAX", "1000"))
+# BM25 column weights for (title, company, text): a title hit outranks a body hit.
+JD_BM25_WEIGHTS = (10.0, 2.0, 1.0)
+JD_SNIPPET_TOKENS = 16
+# JD_DUPLICATE_POLICY: flag (insert, group into the existing cluster) | merge (skip the insert, return the representative)
+JD_DUPLICATE_POLICY = os.getenv("JD_DUPLICATE_POLICY", "flag").lower()
+
+INSERT_JD = "INSERT INTO job_descriptions (title, company, text, created_at) VALUES (?, ?, ?, ?)"
+SELECT_JD = "SELECT id, title, company, text, created_at FROM job_descriptions WHERE id = ?"
+SELECT_ALL_JDS = "SELECT id, title, company, text, created_at FROM job_descriptions ORDER BY id DESC"
+# One JD per near-duplicate cluster (JDs not yet signed count as their own cluster).
+SELECT_MATCH_CORPUS = """
+    SELECT j.id, j.title, j.company, j.text, j.created_at
+    FROM job_descriptions j LEFT JOIN jd_signatures s ON s.jd_id = j.id
+    WHERE s.cluster_id IS NULL OR s.cluster_id = j.id
+    ORDER BY j.id DESC
+"""
+SELECT_VERSION = "SELECT version FROM jd_table_version WHERE id = 1"
+DELETE_JD = "DELETE FROM job_descriptions WHERE id = ?"
+UPSERT_FEATURES = """
+    INSERT OR REPLACE INTO jd_features (jd_id, skills, experience, clean_text, embedding, computed_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+SELECT_MISSING_FEATURES = """
+    SELECT j.id FROM job_descriptions j LEFT JOIN jd_features f ON f.jd_id = j.id
+    WHERE f.jd_id IS NULL ORDER BY j.id
+"""
+FTS_EXISTS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_descriptions_fts'"
+FTS_REBUILD = "INSERT INTO job_descriptions_fts (job_descriptions_fts) VALUES ('rebuild')"
+SEARCH_JDS = f"""
+    SELECT j.id, j.title, j.company, j.created_at,
+           bm25(job_descriptions_fts, {', '.join(map(str, JD_BM25_WEIGHTS))}) AS score,
+           snippet(job_descriptions_fts, 2, '[', ']', '…', {JD_SNIPPET_TOKENS}) AS snippet
+    FROM job_descriptions_fts
+    JOIN job_descriptions j ON j.id = job_descriptions_fts.rowid
+    WHERE job_descriptions_fts MATCH ?
+    ORDER BY score
+    LIMIT ?
+"""
+SEARCH_JD_IDS = f"""
+    SELECT job_descriptions_fts.rowid FROM job_descriptions_fts
+    LEFT JOIN jd_signatures s ON s.jd_id = job_descriptions_fts.rowid
+    WHERE job_descriptions_fts MATCH ? AND (s.cluster_id IS NULL OR s.cluster_id = job_descriptions_fts.rowid)
+    ORDER BY bm25(job_descriptions_fts, {', '.join(map(str, JD_BM25_WEIGHTS))}) LIMIT ?
+"""
+SEARCH_JD_BM25 = f"""
+    SELECT rowid, bm25(job_descriptions_fts, {', '.join(map(str, JD_BM25_WEIGHTS))}) AS score
+    FROM job_descriptions_fts WHERE job_descriptions_fts MATCH ?
+"""
+SELECT_LSH_CANDIDATES = f"""
+    SELECT DISTINCT s.jd_id, s.minhash, s.cluster_id
+    FROM jd_lsh_buckets b JOIN jd_signatures s ON s.jd_id = b.jd_id
+    WHERE (b.band, b.bucket) IN (VALUES {', '.join('(?, ?)' for _ in range(LSH_BANDS))})
+"""
+INSERT_SIGNATURE = "INSERT OR REPLACE INTO jd_signatures (jd_id, minhash, cluster_id, similarity) VALUES (?, ?, ?, ?)"
+INSERT_BUCKET = "INSERT OR IGNORE INTO jd_lsh_buckets (band, bucket, jd_id) VALUES (?, ?, ?)"
+SELECT_MISSING_SIGNATURES = """
+    SELECT j.id, j.title, j.company, j.text FROM job_descriptions j
+    LEFT JOIN jd_signatures s ON s.jd_id = j.id WHERE s.jd_id IS NULL ORDER BY j.id LIMIT ?
+"""
+SELECT_CLUSTERS = """
+    SELECT s.cluster_id, s.jd_id, s.similarity, j.title, j.company, j.created_at
+    FROM jd_signatures s JOIN job_descriptions j ON j.id = s.jd_id
+    WHERE s.cluster_id IN (
+        SELECT cluster_id FROM jd_signatures GROUP BY cluster_id HAVING COUNT(*) > 1
+        ORDER BY COUNT(*) DESC, cluster_id LIMIT ?
+    )
+    ORDER BY s.cluster_id, s.jd_id
+"""
+
+
+def parse_fields(fields: Optional[str], default=JD_FIELDS) -> Tuple[str, ...]:
+    """Comma-separated projection -> validated column tuple (id is always included)."""
+    if not fields:
+        return tuple(default)
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in JD_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(JD_FIELDS)}")
+    return tuple(["id"] + [f for f in JD_FIELDS if f in requested and f != "id"])
+
+
+def fts_query(terms: List[str], match_all: bool = False) -> Optional[str]:
+    """
+    Free text / skill phrases -> safe FTS5 MATCH expression: every term is
+    quoted as a phrase (so user input can never be FTS syntax), joined by AND or OR.
+    """
+    phrases = []
+    for term in terms:
+        words = re.findall(r"\w+", str(term).lower())
+        if words:
+            phrase = '"' + " ".join(words) + '"'
+            if phrase not in phrases:
+                phrases.append(phrase)
+    if not phrases:
+        return None
+    return (" AND " if match_all else " OR ").join(phrases)
+
+
+class JDPage(BaseModel):
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[int] = None
+    version: int
+
+
+class JDStore:
+    """
+    All job description reads and writes, on one pooled, WAL-mode SQLite layer.
+    Each method has an `a`-prefixed twin for async handlers.
+    """
+
+    def __init__(self, db_path: str = JD_DB_PATH, pool: Optional[SQLitePool] = None):
+        self.pool = pool or SQLitePool(db_path)
+        with self.pool.connection() as conn:
+            fts_existed = conn.execute(FTS_EXISTS).fetchone() is not None
+            conn.executescript(SCHEMA)
+            if not fts_existed:
+                # Index rows that predate the FTS table.
+                conn.execute(FTS_REBUILD)
+
+    @staticmethod
+    def _signature(title: str, company: str, text: str):
+        return minhash_signature(f"{title} {company} {text}")
+
+    @staticmethod
+    def _find_duplicate(conn, signature) -> Tuple[Optional[int], Optional[float], List[int]]:
+        """(cluster id, similarity) of the most similar signed JD above the threshold, plus the LSH buckets."""
+        buckets = lsh_buckets(signature)
+        params = [v for band, bucket in enumerate(buckets) for v in (band, bucket)]
+        best_cluster, best_similarity = None, 0.0
+        for row in conn.execute(SELECT_LSH_CANDIDATES, params):
+            similarity = estimate_similarity(signature, signature_from_bytes(row["minhash"]))
+            if similarity >= JD_DUPLICATE_THRESHOLD and similarity > best_similarity:
+                best_cluster, best_similarity = row["cluster_id"], similarity
+        return best_cluster, (round(best_similarity, 3) if best_cluster is not None else None), buckets
+
+    @staticmethod
+    def _store_signature(conn, jd_id: int, signature, buckets: List[int], cluster_id: Optional[int], similarity):
+        conn.execute(INSERT_SIGNATURE, (jd_id, signature.tobytes(), cluster_id or jd_id, similarity))
+        conn.executemany(INSERT_BUCKET, [(band, bucket, jd_id) for band, bucket in enumerate(buckets)])
+
+    def add_many(self, rows: List[Tuple[str, str, str, Optional[str]]], policy: str = JD_DUPLICATE_POLICY) -> List[Dict]:
+        """
+        Insert (title, company, text, created_at) rows in one transaction. Each row is
+        checked against existing JDs (and earlier rows of the batch) for near-duplicates:
+        returns {id, duplicate_of, similarity, merged} per row, where a merged row was
+        not inserted and `id` is its cluster representative.
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # MinHash is the expensive part; compute it before taking the write lock.
+        signatures = [self._signature(title, company, text) for title, company, text, _ in rows]
+        results = []
+        with self.pool.transaction() as conn:
+            for (title, company, text, created_at), signature in zip(rows, signatures):
+                cluster_id, similarity, buckets = self._find_duplicate(conn, signature)
+                if cluster_id is not None and policy == "merge":
+                    results.append({"id": cluster_id, "duplicate_of": cluster_id, "similarity": similarity, "merged": True})
+                    continue
+                jd_id = conn.execute(INSERT_JD, (title, company, text, created_at or now)).lastrowid
+                self._store_signature(conn, jd_id, signature, buckets, cluster_id, similarity)
+                results.append({"id": jd_id, "duplicate_of": cluster_id, "similarity": similarity, "merged": False})
+        return results
+
+    def add(self, title: str, company: str, text: str) -> Dict:
+        """Insert one JD; when merged into an existing cluster, the representative is returned."""
+        result = self.add_many([(title, company, text, None)])[0]
+        return {**self.get(result["id"]), **result}
+
+    def backfill_signatures(self, batch_size: int = 200) -> int:
+        """Sign (and cluster, in id order) JDs inserted before duplicate detection existed."""
+        signed = 0
+        while True:
+            with self.pool.connection() as conn:
+                rows = [dict(row) for row in conn.execute(SELECT_MISSING_SIGNATURES, (batch_size,))]
+            if not rows:
+                return signed
+            signatures = [self._signature(r["title"], r["company"], r["text"]) for r in rows]
+            with self.pool.transaction() as conn:
+                for row, signature in zip(rows, signatures):
+                    cluster_id, similarity, buckets = self._find_duplicate(conn, signature)
+                    self._store_signature(conn, row["id"], signature, buckets, cluster_id, similarity)
+            signed += len(rows)
+
+    def clusters(self, limit: int = 100) -> List[Dict]:
+        """Near-duplicate clusters (largest first): the representative and its duplicates."""
+        with self.pool.connection() as conn:
+            rows = [dict(row) for row in conn.execute(SELECT_CLUSTERS, (limit,))]
+        clusters: Dict[int, Dict] = {}
+        for row in rows:
+            cluster = clusters.setdefault(row["cluster_id"], {"cluster_id": row["cluster_id"], "representative": None, "duplicates": []})
+            member = {k: row[k] for k in ("title", "company", "created_at")}
+            member["id"] = row["jd_id"]
+            if row["jd_id"] == row["cluster_id"]:
+                cluster["representative"] = member
+            else:
+                cluster["duplicates"].append({**member, "similarity": row["similarity"]})
+        result = [{**c, "size": len(c["duplicates"]) + 1} for c in clusters.values()]
+        return sorted(result, key=lambda c: (-c["size"], c["cluster_id"]))
+
+    def get(self, jd_id: int) -> Optional[Dict]:
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_JD, (jd_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list_all(self, representatives_only: bool = False) -> List[Dict]:
+        with self.pool.connection() as conn:
+            return [dict(row) for row in conn.execute(SELECT_MATCH_CORPUS if representatives_only else SELECT_ALL_JDS)]
+
+    def version(self) -> int:
+        with self.pool.connection() as conn:
+            return conn.execute(SELECT_VERSION).fetchone()[0]
+
+    def list_page(
+        self,
+        fields: Tuple[str, ...] = JD_FIELDS,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None,
+        descending: bool = True,
+        company: Optional[str] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+    ) -> JDPage:
+        """
+        Keyset-paginated, projected listing. `cursor` is the last id of the
+        previous page; `next_cursor` is None on the last page. Rows and the
+        table version are read in one snapshot so the version matches the rows.
+        """
+        where, params = [], []
+        if cursor is not None:
+            where.append("id < ?" if descending else "id > ?")
+            params.append(cursor)
+        if company:
+            where.append("company = ? COLLATE NOCASE")
+            params.append(company)
+        if created_from:
+            where.append("created_at >= ?")
+            params.append(created_from)
+        if created_to:
+            # A bare date includes the whole day.
+            where.append("created_at <= ?")
+            params.append(f"{created_to} 23:59:59" if len(created_to) == 10 else created_to)
+
+        sql = f"SELECT {', '.join(fields)} FROM job_descriptions"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY id {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            # One extra row tells us whether another page exists.
+            params.append(min(limit, JD_PAGE_MAX) + 1)
+
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                version = conn.execute(SELECT_VERSION).fetchone()[0]
+                rows = [dict(row) for row in conn.execute(sql, params)]
+            finally:
+                conn.execute("COMMIT")
+
+        next_cursor = None
+        if limit is not None and len(rows) > min(limit, JD_PAGE_MAX):
+            rows = rows[:min(limit, JD_PAGE_MAX)]
+            next_cursor = rows[-1]["id"]
+        return JDPage(items=rows, next_cursor=next_cursor, version=version)
+
+    def get_many(self, jd_ids: List[int]) -> List[Dict]:
+        """Full rows for `jd_ids`, in the given order."""
+        if not jd_ids:
+            return []
+        placeholders = ",".join("?" for _ in jd_ids)
+        with self.pool.connection() as conn:
+            rows = {
+                row["id"]: dict(row)
+                for row in conn.execute(
+                    f"SELECT id, title, company, text, created_at FROM job_descriptions WHERE id IN ({placeholders})",
+                    jd_ids,
+                )
+            }
+        return [rows[jd_id] for jd_id in jd_ids if jd_id in rows]
+
+    def search(self, query: str, limit: int = 20, match_all: bool = True) -> List[Dict]:
+        """
+        BM25-ranked full-text search with a highlighted snippet of the body.
+        `score` is SQLite's bm25 (lower is better). All words must match unless `match_all=False`.
+        """
+        match = fts_query(query.split(), match_all=match_all)
+        if match is None:
+            return []
+        with self.pool.connection() as conn:
+            return [dict(row) for row in conn.execute(SEARCH_JDS, (match, min(limit, JD_PAGE_MAX)))]
+
+    def prefilter(self, terms: List[str], limit: int) -> List[int]:
+        """Ids of the `limit` JDs that best match any of `terms` (e.g. candidate skills), by BM25."""
+        match = fts_query(terms, match_all=False)
+        if match is None:
+            return []
+        with self.pool.connection() as conn:
+            return [row[0] for row in conn.execute(SEARCH_JD_IDS, (match, limit))]
+
+    def save_features(self, features: List[Dict]) -> None:
+        """Store {jd_id, skills, experience, clean_text, embedding (bytes)} rows."""
+        now = time.time()
+        with self.pool.transaction() as conn:
+            conn.executemany(UPSERT_FEATURES, [
+                (f["jd_id"], json.dumps(f["skills"]), f.get("experience"), f["clean_text"], f.get("embedding"), now)
+                for f in features
+            ])
+
+    def get_features(self, jd_ids: List[int]) -> Dict[int, Dict]:
+        if not jd_ids:
+            return {}
+        placeholders = ",".join("?" for _ in jd_ids)
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT jd_id, skills, experience, clean_text, embedding FROM jd_features WHERE jd_id IN ({placeholders})",
+                jd_ids,
+            ).fetchall()
+        return {row["jd_id"]: {**dict(row), "skills": json.loads(row["skills"])} for row in rows}
+
+    def missing_feature_ids(self) -> List[int]:
+        with self.pool.connection() as conn:
+            return [row[0] for row in conn.execute(SELECT_MISSING_FEATURES)]
+
+    def bm25_scores(self, terms: List[str]) -> Dict[int, float]:
+        """BM25 score (lower is better) of every JD matching any of `terms`."""
+        match = fts_query(terms, match_all=False)
+        if match is None:
+            return {}
+        with self.pool.connection() as conn:
+            return {row[0]: row[1] for row in conn.execute(SEARCH_JD_BM25, (match,))}
+
+    def delete(self, jd_id: int) -> bool:
+        with self.pool.transaction() as conn:
+            return conn.execute(DELETE_JD, (jd_id,)).rowcount > 0
+
+    # ---------------- async twins ---------------- #
+    async def aadd(self, title: str, company: str, text: str) -> Dict:
+        return await self.pool.arun(self.add, title, company, text)
+
+    async def aget(self, jd_id: int) -> Optional[Dict]:
+        return await self.pool.arun(self.get, jd_id)
+
+    async def alist_all(self, representatives_only: bool = False) -> List[Dict]:
+        return await self.pool.arun(self.list_all, representatives_only)
+
+    async def aclusters(self, limit: int = 100) -> List[Dict]:
+        return await self.pool.arun(self.clusters, limit)
+
+    async def aversion(self) -> int:
+        return await self.pool.arun(self.version)
+
+    async def alist_page(self, **kwargs) -> JDPage:
+        return await self.pool.arun(functools.partial(self.list_page, **kwargs))
+
+    async def aget_many(self, jd_ids: List[int]) -> List[Dict]:
+        return await self.pool.arun(self.get_many, jd_ids)
+
+    async def asearch(self, query: str, limit: int = 20, match_all: bool = True) -> List[Dict]:
+        return await self.pool.arun(self.search, query, limit, match_all)
+
+    async def aprefilter(self, terms: List[str], limit: int) -> List[int]:
+        return await self.pool.arun(self.prefilter, terms, limit)
+
+    async def aget_features(self, jd_ids: List[int]) -> Dict[int, Dict]:
+        return await self.pool.arun(self.get_features, jd_ids)
+
+    async def abm25_scores(self, terms: List[str]) -> Dict[int, float]:
+        return await self.pool.arun(self.bm25_scores, terms)
+
+    async def adelete(self, jd_id: int) -> bool:
+        return await self.pool.arun(self.delete, jd_id)
+
+
+# Process-wide JD store used by the admin, listing and matching endpoints.
+jd_store = JDStore()
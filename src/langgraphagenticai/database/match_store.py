@@ -0,0 +1,113 @@
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.langgraphagenticai.database.pool import SQLitePool
+from src.langgraphagenticai.database.jd_store import jd_store
+from src.langgraphagenticai.utils.tracing import tracer
+
+SCHEMA = """
+    -- Earlier layout, which also cached skill_overlap / match_score.
+    DROP TABLE IF EXISTS match_scores;
+    CREATE TABLE IF NOT EXISTS match_vectors (
+        resume_hash TEXT NOT NULL,
+        jd_id INTEGER NOT NULL,
+        jd_version TEXT NOT NULL,
+        config_hash TEXT NOT NULL,
+        tfidf_score REAL NOT NULL,
+        bow_score REAL NOT NULL,
+        embedding_score REAL NOT NULL,
+        computed_at REAL NOT NULL,
+        PRIMARY KEY (resume_hash, jd_id, jd_version, config_hash)
+    ) WITHOUT ROWID;
+"""
+
+SELECT_SCORE = """
+    SELECT tfidf_score, bow_score, embedding_score FROM match_vectors
+    WHERE resume_hash = ? AND jd_id = ? AND jd_version = ? AND config_hash = ?
+"""
+UPSERT_SCORE = """
+    INSERT OR REPLACE INTO match_vectors
+    (resume_hash, jd_id, jd_version, config_hash, tfidf_score, bow_score, embedding_score, computed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Ad-hoc JD text (/match, /jd-upload) has no row id.
+ADHOC_JD_ID = 0
+
+MatchKey = Tuple[str, int, str, str]
+
+
+def content_hash(text: Optional[str]) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()[:32]
+
+
+def config_hash(config: Dict) -> str:
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class MatchStore:
+    """
+    Persistent vector similarity scores (TF-IDF, BoW, embedding) per (resume
+    content hash, JD id, JD version, scoring config). The JD version is a hash of
+    its cleaned text, so edits invalidate naturally. Skill overlap and the final
+    score are not cached: they depend on the request's skill lists and the
+    weights, and are re-combined from these components on every call.
+    """
+
+    def __init__(self, pool: SQLitePool):
+        self.pool = pool
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    @staticmethod
+    def key(resume_clean: Optional[str], jd_id: Optional[int], jd_clean: Optional[str], config: str) -> MatchKey:
+        return content_hash(resume_clean), jd_id or ADHOC_JD_ID, content_hash(jd_clean), config
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += n
+
+    @tracer.traced("match_vectors.get", kind="db")
+    def get(self, key: MatchKey) -> Optional[Dict[str, float]]:
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_SCORE, key).fetchone()
+        self._count("hits" if row else "misses")
+        return dict(row) if row else None
+
+    @tracer.traced("match_vectors.get_many", kind="db")
+    def get_many(self, keys: List[MatchKey]) -> Dict[int, Dict[str, float]]:
+        """Cached components by JD id, for many JDs against one resume."""
+        found = {}
+        with self.pool.connection() as conn:
+            for key in keys:
+                row = conn.execute(SELECT_SCORE, key).fetchone()
+                if row:
+                    found[key[1]] = dict(row)
+        self._count("hits", len(found))
+        self._count("misses", len(keys) - len(found))
+        return found
+
+    @tracer.traced("match_vectors.put", kind="db")
+    def put(self, key: MatchKey, components: Dict[str, float]) -> None:
+        with self.pool.transaction() as conn:
+            conn.execute(UPSERT_SCORE, (
+                *key,
+                components["tfidf_score"], components["bow_score"], components["embedding_score"], time.time(),
+            ))
+        self._count("writes")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+# Process-wide match score store, sharing the JD database and its connection pool.
+match_store = MatchStore(jd_store.pool)
@@ -0,0 +1,92 @@
+import os
+import re
+import random
+import hashlib
+from array import array
+from typing import List
+
+import numpy as np
+
+# 128 MinHash values split into 16 LSH bands of 8 rows: pairs above ~0.7 Jaccard
+# almost always share a band, pairs below ~0.4 almost never do.
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+SHINGLE_WORDS = 3
+# Estimated Jaccard similarity at or above which two JDs are near-duplicates.
+JD_DUPLICATE_THRESHOLD = float(os.getenv("JD_DUPLICATE_THRESHOLD", "0.85"))
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(1)  # fixed seed: signatures must be stable across processes
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+_PERM_A = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)[:, None]
+_PERM_B = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)[:, None]
+_P = np.uint64(_MERSENNE_PRIME)
+_LOW31 = np.uint64((1 << 31) - 1)
+_LOW30 = np.uint64((1 << 30) - 1)
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> set:
+    words = re.findall(r"\w+", (text or "").lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _reduce(x: np.ndarray) -> np.ndarray:
+    """x mod (2^61 - 1) for x < 2^64, using 2^61 = 1 (mod p)."""
+    x = (x & _P) + (x >> np.uint64(61))
+    x = (x & _P) + (x >> np.uint64(61))
+    return np.where(x >= _P, x - _P, x)
+
+
+def _mulmod(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Exact (a * b) mod (2^61 - 1) for a, b < 2^61 without 128-bit integers: split
+    both into 31-bit limbs, then fold the 2^62 and 2^31 carries back using
+    2^61 = 1 (mod p). Every partial sum stays below 2^64.
+    """
+    a_hi, a_lo = a >> np.uint64(31), a & _LOW31
+    b_hi, b_lo = b >> np.uint64(31), b & _LOW31
+    mid = a_hi * b_lo + a_lo * b_hi
+    high = (a_hi * b_hi) << np.uint64(1)
+    mid_folded = (mid >> np.uint64(30)) + ((mid & _LOW30) << np.uint64(31))
+    return _reduce(_reduce(high + mid_folded) + a_lo * b_lo)
+
+
+def minhash_signature(text: str) -> array:
+    """
+    min over shingles of ((a * h + b) mod (2^61 - 1)) & 0xFFFFFFFF per permutation,
+    computed for all permutations x shingles in one array pass.
+    """
+    hashes = np.array([_hash64(s) for s in shingles(text)] or [0], dtype=np.uint64)
+    values = _reduce(_mulmod(_PERM_A, _reduce(hashes)[None, :]) + _PERM_B) & np.uint64(_MAX_HASH)
+    return array("I", values.min(axis=1).astype(np.uint32).tobytes())
+
+
+def lsh_buckets(signature: array) -> List[int]:
+    """One bucket key (signed 64-bit, fits an SQLite INTEGER) per band."""
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()
+        digest = hashlib.blake2b(rows, digest_size=8, person=band.to_bytes(2, "little")).digest()
+        buckets.append(int.from_bytes(digest, "little", signed=True))
+    return buckets
+
+
+def estimate_similarity(a: array, b: array) -> float:
+    return sum(x == y for x, y in zip(a, b)) / MINHASH_PERMUTATIONS
+
+
+def signature_from_bytes(blob: bytes) -> array:
+    signature = array("I")
+    signature.frombytes(blob)
+    return signature
@@ -0,0 +1,102 @@
+import os
+import queue
+import sqlite3
+import asyncio
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, TypeVar
+
+from src.langgraphagenticai.utils.tracing import tracer
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+DB_SYNCHRONOUS = os.getenv("DB_SYNCHRONOUS", "NORMAL").upper()
+DB_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+DB_CACHE_SIZE_KB = int(os.getenv("DB_CACHE_SIZE_KB", str(16 * 1024)))
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "10000"))
+# Compiled statements kept per connection; queries are module-level constants so they hit this cache.
+DB_STATEMENT_CACHE = int(os.getenv("DB_STATEMENT_CACHE", "128"))
+
+T = TypeVar("T")
+
+
+class SQLitePool:
+    """
+    Fixed-size pool of tuned SQLite connections (WAL, synchronous level, mmap,
+    page cache, statement cache). Readers run concurrently under WAL; writers
+    are serialised in-process so they queue on a lock instead of spinning on
+    SQLITE_BUSY. `arun` executes a callable on the pool's own threads, so
+    async handlers never block the event loop on disk I/O.
+    """
+
+    def __init__(self, db_path: str, size: int = DB_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._create_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="sqlite-pool")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=DB_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            isolation_level=None,  # explicit BEGIN/COMMIT in transaction()
+            cached_statements=DB_STATEMENT_CACHE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={DB_SYNCHRONOUS}")
+        conn.execute(f"PRAGMA mmap_size={DB_MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size=-{DB_CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection (autocommit; each statement is its own read transaction)."""
+        # Traced here rather than only in arun, so synchronous store calls show up too;
+        # borrows outside a trace (e.g. idle job-queue polling) are not recorded.
+        with tracer.span("connection", kind="db", nested_only=True, db=os.path.basename(self.db_path)), \
+                self._borrow() as conn:
+            yield conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection inside BEGIN IMMEDIATE ... COMMIT, one writer at a time."""
+        with tracer.span("transaction", kind="db", nested_only=True, db=os.path.basename(self.db_path)), \
+                self._write_lock, self._borrow() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @contextmanager
+    def _borrow(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._create_lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            conn = self._connect() if create else self._idle.get()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    async def arun(self, fn: Callable[..., T], *args) -> T:
+        name = getattr(fn, "__name__", None) or getattr(getattr(fn, "func", None), "__name__", "query")
+        with tracer.span(name, kind="db"):
+            # Run in the caller's context so spans opened by `fn` nest under this one.
+            return await asyncio.get_running_loop().run_in_executor(self._executor, tracer.propagate(fn), *args)
@@ -0,0 +1,113 @@
+import os
+import time
+import uuid
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from src.langgraphagenticai.state.state import CandidateState
+
+# GRAPH_FAST_PATH=on runs single-node graphs by calling the node directly instead of graph.invoke.
+GRAPH_FAST_PATH = os.getenv("GRAPH_FAST_PATH", "on").lower() not in ("0", "off", "false")
+# Opt-in: also write each fast-path result to the graph's checkpointer, as graph.invoke
+# does, so graph.get_state(thread) shows the latest run whichever path served it.
+# Off by default: runs never read checkpoints back, and writing one costs the serialization
+# the fast path exists to skip.
+GRAPH_FAST_PATH_CHECKPOINT = os.getenv("GRAPH_FAST_PATH_CHECKPOINT", "off").lower() in ("1", "on", "true")
+
+# Fields declared Annotated[..., reducer]: a node's partial update folds into them, as in the channels.
+REDUCERS = {name: field.metadata[0] for name, field in CandidateState.model_fields.items()
+            if field.metadata and callable(field.metadata[0])}
+
+
+class DirectRunner:
+    """
+    Runs one node the way a compiled START -> node -> END graph would, minus
+    channel writes, checkpoint serialization and the model_dump round trip.
+    The node gets a shallow copy of the input, as it would from LangGraph's
+    channels, and a dict it returns is applied through the state's reducers. It keeps no per-thread state: like graph.invoke (whose entry input
+    overwrites the checkpointed bookkeeping fields), the result depends only on
+    the input state and the thread's NodeMemo entries, which both paths share.
+
+    With checkpoint on, run() also records the result on `graph`'s checkpointer as
+    an update from `as_node`, through `to_checkpoint` (the same entry values
+    graph.invoke gets, so bookkeeping fields overwrite the thread's checkpoint).
+    """
+
+    def __init__(self, checkpoint: bool = GRAPH_FAST_PATH_CHECKPOINT):
+        self.checkpoint = checkpoint
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "checkpoints": 0}
+
+    def run(self, node: Callable, state: CandidateState, thread_id: Optional[str] = None,
+            graph: Any = None, as_node: Optional[str] = None,
+            to_checkpoint: Optional[Callable[[CandidateState], dict]] = None) -> CandidateState:
+        state = state.model_copy()
+        config = {"configurable": {"thread_id": thread_id}} if thread_id else None
+        result = node(state, config)
+        if isinstance(result, dict):
+            reduced = {f: REDUCERS[f](getattr(state, f), v) for f, v in result.items() if f in REDUCERS}
+            result = state.model_copy(update={**result, **reduced})
+
+        checkpointed = bool(self.checkpoint and config and graph is not None and graph.checkpointer)
+        if checkpointed:
+            values = to_checkpoint(result) if to_checkpoint else result.model_dump()
+            graph.update_state(config, values, as_node=as_node)
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["checkpoints"] += checkpointed
+        return result
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._stats, checkpoint=self.checkpoint)
+
+
+def benchmark(iterations: int = 500) -> Dict[str, Any]:
+    """
+    Per-call overhead of a single-node graph vs. the direct runner, measured with
+    a no-op node on a populated CandidateState so only the framework cost is timed.
+    """
+    from langgraph.graph import StateGraph, START, END
+    from langgraph.checkpoint.memory import MemorySaver
+
+    def noop(state: CandidateState, config=None) -> CandidateState:
+        return state
+
+    g = StateGraph(CandidateState)
+    g.add_node("noop", noop)
+    g.add_edge(START, "noop")
+    g.add_edge("noop", END)
+    graph = g.compile(checkpointer=MemorySaver())
+    runner = DirectRunner()
+
+    state = CandidateState(
+        resume_text="Python developer with FastAPI, Docker and AWS experience. " * 100,
+        jd_text="Backend engineer: Python, FastAPI, PostgreSQL, Kubernetes. " * 60,
+        candidate_skills=["python", "fastapi", "docker", "aws", "sql", "git"],
+        jd_skills=["python", "fastapi", "postgresql", "kubernetes"],
+        interview_questions=[{"type": "technical", "question": f"Question {i}?"} for i in range(10)],
+        candidate_answers=[f"Answer {i} " * 40 for i in range(10)],
+    )
+
+    def per_call_us(call) -> float:
+        thread_id = str(uuid.uuid4())
+        call(thread_id)  # warm up
+        start = time.perf_counter()
+        for _ in range(iterations):
+            call(thread_id)
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    graph_us = per_call_us(lambda t: CandidateState(**graph.invoke(state, config={"configurable": {"thread_id": t}})))
+    direct_us = per_call_us(lambda t: runner.run(noop, state, t))
+    return {
+        "iterations": iterations,
+        "graph_invoke_us": round(graph_us, 1),
+        "direct_us": round(direct_us, 1),
+        "saved_us": round(graph_us - direct_us, 1),
+        "speedup": round(graph_us / direct_us, 1) if direct_us else None,
+    }
+
+
+if __name__ == "__main__":
+    # python -m src.langgraphagenticai.graph.fast_path
+    print(f"⏱️ Single-node graph overhead: {benchmark()}")
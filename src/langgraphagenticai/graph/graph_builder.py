@@ -1,15 +1,31 @@
 from typing import Optional, Any
+import time
 import uuid
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import Overwrite
 try:
     from langgraph.checkpoint.memory import MemorySaver
 except Exception:
     MemorySaver = None
 
-from src.langgraphagenticai.state.state import CandidateState
+from src.langgraphagenticai.state.state import CandidateState, merge_dicts
 from src.langgraphagenticai.LLMS.groqllm import GroqLLM
+from src.langgraphagenticai.LLMS.router import ModelRouter
 from src.langgraphagenticai.nodes.nodes import WebSearchChatbotNode
+from src.langgraphagenticai.graph.node_memo import NodeMemo, NODE_MEMO_ENABLED, NODE_INPUTS, NODE_OUTPUTS, fingerprint
+from src.langgraphagenticai.graph.fast_path import DirectRunner, GRAPH_FAST_PATH
+from src.langgraphagenticai.utils.tracing import tracer
+
+
+# Steps that only depend on the matched state and write disjoint fields,
+# so they can run as parallel branches after match_resume_with_jd.
+BRANCH_OUTPUTS = {
+    "skill_gap_analysis": ["skill_resources", "priority_skills"],
+    "generate_assessment": ["mcqs", "based_on_skills"],
+    "generate_interview_questions": ["interview_questions"],
+}
 
 
 class GraphBuilder:
@@ -22,17 +38,39 @@ class GraphBuilder:
       - assessment_graph
       - interview_graph
 
-    Also builds a full_workflow_graph chaining all steps.
+    Also builds a full_workflow_graph chaining resume -> jd -> match and then
+    fanning out skill gap / assessment / interview as parallel branches, plus a
+    post_match_graph that runs only the parallel fan-out on an already matched state.
     Each graph is compiled with CandidateState as the state model.
     Helper run_* methods accept CandidateState or plain dict and return CandidateState.
+    run_metadata and completed_steps in the result cover that one call, even on a
+    thread with earlier checkpoints.
+
+    Every node is memoized per thread on the CandidateState fields it reads
+    (NODE_INPUTS); run_metadata["node_cache"] reports hit/miss per node of the call.
+
+    With GRAPH_FAST_PATH on, run_* calls on single-node graphs skip graph.invoke
+    and call the (memoized) node through a DirectRunner; see fast_path.py. Either
+    way the only per-thread state a run reads is self.memo, shared by both paths:
+    the MemorySaver checkpoints written by graph.invoke are never read back (the
+    entry input overwrites every field), so results don't depend on which path
+    ran before on the thread. The fast path writes no checkpoint unless
+    GRAPH_FAST_PATH_CHECKPOINT is on, so graph.get_state() lags behind it by default.
     """
 
     def __init__(self, model_name: str = "deepseek-r1-distill-llama-70b"):
         self.llm = GroqLLM(model_name=model_name)
-        self.recruitment_node = WebSearchChatbotNode(self.llm)
+        # per-node model routing with latency-aware fallbacks; model_name is the default route
+        self.router = ModelRouter(default_model=model_name, llms={model_name: self.llm})
+        self.recruitment_node = WebSearchChatbotNode(self.llm, router=self.router)
 
         # optional persistent checkpointer
         self.checkpointer = MemorySaver() if MemorySaver is not None else None
+        # per-thread node outputs, reused while a node's inputs are unchanged
+        self.memo = NodeMemo()
+        # single-node graphs -> their wrapped node, for the direct fast path
+        self.direct = DirectRunner()
+        self._single_nodes = {}
 
         # compile individual single-node graphs
         self.resume_graph = self._single_node_graph("resume_upload", self.recruitment_node.resume_upload)
@@ -43,15 +81,97 @@ class GraphBuilder:
         self.interview_graph = self._single_node_graph("generate_interview_questions", self.recruitment_node.generate_interview_questions)
         self.evaluation_graph = self._single_node_graph("evaluate_candidate", self.recruitment_node.evaluate_answers)
 
-        # full workflow graph
+        # full workflow graph + post-match fan-out graph
         self.full_workflow_graph = self._build_full_graph()
+        self.post_match_graph = self._build_post_match_graph()
 
     # ---------------- helpers ---------------- #
+    def _memoized(self, name: str, fn):
+        """
+        Wrap a node so that, within a thread, it reuses its previous outputs when the
+        fields it reads (NODE_INPUTS) fingerprint the same as at its last run.
+        """
+        inputs, outputs = NODE_INPUTS[name], NODE_OUTPUTS[name]
+
+        def run_node(state: CandidateState, config: Optional[RunnableConfig] = None) -> CandidateState:
+            thread_id = ((config or {}).get("configurable") or {}).get("thread_id")
+            with tracer.span(name, kind="node", thread_id=thread_id):
+                return run_memoized(state, thread_id)
+
+        def run_memoized(state: CandidateState, thread_id: Optional[str]) -> CandidateState:
+            if not NODE_MEMO_ENABLED or not thread_id:
+                return fn(state)
+
+            key = fingerprint(state, inputs)
+            cached = self.memo.get(thread_id, name, key)
+            if cached is not None:
+                print(f"♻️ {name}: inputs unchanged, reusing previous outputs")
+                result = state.model_copy(update=cached)
+            else:
+                result = fn(state)
+                self.memo.put(thread_id, name, key, {field: getattr(result, field) for field in outputs})
+            outcome = "hit" if cached is not None else "miss"
+            tracer.annotate(cache=outcome)
+            result.run_metadata = merge_dicts(result.run_metadata, {"node_cache": {name: outcome}})
+            return result
+
+        return run_node
+
     def _single_node_graph(self, name: str, fn) -> Any:
+        node = self._memoized(name, fn)
         g = StateGraph(CandidateState)
-        g.add_node(name, fn)
+        g.add_node(name, node)
         g.add_edge(START, name)
         g.add_edge(name, END)
+        graph = self._compile(g)
+        self._single_nodes[id(graph)] = (name, node)
+        return graph
+
+    def _branch(self, name: str, fn):
+        """
+        Wrap a node so it can run as a parallel branch: it works on its own copy
+        of the state and only returns the fields it owns, so concurrent branches
+        never write the same channel (bookkeeping fields merge via reducers).
+        """
+        fields = BRANCH_OUTPUTS[name]
+        node = self._memoized(name, fn)
+
+        def run_branch(state: CandidateState, config: Optional[RunnableConfig] = None) -> dict:
+            start = time.perf_counter()
+            local_state = state.model_copy(update={"run_metadata": {}})
+            result = node(local_state, config)
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+
+            update = {field: getattr(result, field) for field in fields}
+            update["completed_steps"] = [name]
+            update["run_metadata"] = merge_dicts(
+                result.run_metadata, {"branches": {name: {"elapsed_ms": elapsed_ms}}}
+            )
+            return update
+
+        return run_branch
+
+    def _join_branches(self, state: CandidateState) -> dict:
+        timings = state.run_metadata.get("branches", {})
+        print(f"🔗 Parallel branches joined: {timings}")
+        return {}
+
+    def _add_parallel_branches(self, g: StateGraph, source: str) -> None:
+        """Fan out from `source` to every post-match branch and join them before END."""
+        branch_fns = {
+            "skill_gap_analysis": self.recruitment_node.skill_gap_analysis,
+            "generate_assessment": self.recruitment_node.generate_assessment,
+            "generate_interview_questions": self.recruitment_node.generate_interview_questions,
+        }
+        for name, fn in branch_fns.items():
+            g.add_node(name, self._branch(name, fn))
+            g.add_edge(source, name)
+
+        g.add_node("join_branches", self._join_branches)
+        g.add_edge(list(branch_fns), "join_branches")
+        g.add_edge("join_branches", END)
+
+    def _compile(self, g: StateGraph) -> Any:
         if self.checkpointer is not None:
             return g.compile(checkpointer=self.checkpointer)
         return g.compile()
@@ -59,24 +179,21 @@ class GraphBuilder:
     def _build_full_graph(self) -> Any:
         g = StateGraph(CandidateState)
 
-        g.add_node("resume_upload", self.recruitment_node.resume_upload)
-        g.add_node("jd_upload", self.recruitment_node.jd_upload)
-        g.add_node("match_resume_with_jd", self.recruitment_node.match_resume_with_jd)
-        g.add_node("skill_gap_analysis", self.recruitment_node.skill_gap_analysis)
-        g.add_node("generate_assessment", self.recruitment_node.generate_assessment)
-        g.add_node("generate_interview_questions", self.recruitment_node.generate_interview_questions)
+        g.add_node("resume_upload", self._memoized("resume_upload", self.recruitment_node.resume_upload))
+        g.add_node("jd_upload", self._memoized("jd_upload", self.recruitment_node.jd_upload))
+        g.add_node("match_resume_with_jd", self._memoized("match_resume_with_jd", self.recruitment_node.match_resume_with_jd))
 
         g.add_edge(START, "resume_upload")
         g.add_edge("resume_upload", "jd_upload")
         g.add_edge("jd_upload", "match_resume_with_jd")
-        g.add_edge("match_resume_with_jd", "skill_gap_analysis")
-        g.add_edge("skill_gap_analysis", "generate_assessment")
-        g.add_edge("generate_assessment", "generate_interview_questions")
-        g.add_edge("generate_interview_questions", END)
+        self._add_parallel_branches(g, "match_resume_with_jd")
 
-        if self.checkpointer is not None:
-            return g.compile(checkpointer=self.checkpointer)
-        return g.compile()
+        return self._compile(g)
+
+    def _build_post_match_graph(self) -> Any:
+        g = StateGraph(CandidateState)
+        self._add_parallel_branches(g, START)
+        return self._compile(g)
 
     # ---------------- runtime helpers ---------------- #
     def _cfg(self, thread_id: Optional[str]):
@@ -99,59 +216,61 @@ class GraphBuilder:
         except Exception as e:
             raise ValueError(f"Could not convert graph result to CandidateState: {e}")
 
-    # ---------------- run methods ---------------- #
-    def run_resume(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
+    def _entry_input(self, state: CandidateState) -> dict:
+        """
+        graph.invoke input for `state`. The bookkeeping fields overwrite the thread's
+        checkpoint instead of merging into it, so run_metadata / completed_steps
+        describe this invoke only (reducers still merge the writes of its branches).
+        """
+        values = {field: getattr(state, field) for field in CandidateState.model_fields}
+        values["run_metadata"] = Overwrite(dict(state.run_metadata))
+        values["completed_steps"] = Overwrite(list(state.completed_steps))
+        return values
+
+    def _invoke(self, graph: Any, state: CandidateState | dict, thread_id: Optional[str] = None,
+                name: str = "graph") -> CandidateState:
         if isinstance(state, dict):
             state = CandidateState(**state)
-        cfg = self._cfg(thread_id)
-        res = self.resume_graph.invoke(state, config=cfg) if cfg else self.resume_graph.invoke(state)
-        return self._to_candidate_state(res)
+        single = self._single_nodes.get(id(graph)) if GRAPH_FAST_PATH else None
+        with tracer.span(name, kind="graph", thread_id=thread_id, fast_path=single is not None):
+            if single is not None:
+                node_name, node = single
+                final_state = self.direct.run(node, state, thread_id, graph=graph, as_node=node_name,
+                                              to_checkpoint=self._entry_input)
+            else:
+                cfg = self._cfg(thread_id)
+                res = graph.invoke(self._entry_input(state), config=cfg)
+                final_state = self._to_candidate_state(res)
+        # The input may carry node_cache from an earlier result; keep only this graph's nodes.
+        node_cache = final_state.run_metadata.get("node_cache", {})
+        final_state.run_metadata["node_cache"] = {n: v for n, v in node_cache.items() if n in graph.nodes}
+        return final_state
+
+    # ---------------- run methods ---------------- #
+    def run_resume(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
+        return self._invoke(self.resume_graph, state, thread_id, "run_resume")
 
     def run_jd(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
-        if isinstance(state, dict):
-            state = CandidateState(**state)
-        cfg = self._cfg(thread_id)
-        res = self.jd_graph.invoke(state, config=cfg) if cfg else self.jd_graph.invoke(state)
-        return self._to_candidate_state(res)
+        return self._invoke(self.jd_graph, state, thread_id, "run_jd")
 
     def run_match(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
-        if isinstance(state, dict):
-            state = CandidateState(**state)
-        cfg = self._cfg(thread_id)
-        res = self.match_graph.invoke(state, config=cfg) if cfg else self.match_graph.invoke(state)
-        return self._to_candidate_state(res)
+        return self._invoke(self.match_graph, state, thread_id, "run_match")
 
     def run_skill_gap(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
-        if isinstance(state, dict):
-            state = CandidateState(**state)
-        cfg = self._cfg(thread_id)
-        res = self.skill_gap_graph.invoke(state, config=cfg) if cfg else self.skill_gap_graph.invoke(state)
-        return self._to_candidate_state(res)
+        return self._invoke(self.skill_gap_graph, state, thread_id, "run_skill_gap")
 
     def run_assessment(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
-        if isinstance(state, dict):
-            state = CandidateState(**state)
-        cfg = self._cfg(thread_id)
-        res = self.assessment_graph.invoke(state, config=cfg) if cfg else self.assessment_graph.invoke(state)
-        return self._to_candidate_state(res)
+        return self._invoke(self.assessment_graph, state, thread_id, "run_assessment")
 
     def run_interview(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
-        if isinstance(state, dict):
-            state = CandidateState(**state)
-        cfg = self._cfg(thread_id)
-        res = self.interview_graph.invoke(state, config=cfg) if cfg else self.interview_graph.invoke(state)
-        return self._to_candidate_state(res)
+        return self._invoke(self.interview_graph, state, thread_id, "run_interview")
     
     def run_evaluation(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
-        if isinstance(state, dict):
-            state = CandidateState(**state)
-        cfg = self._cfg(thread_id)
-        res = self.evaluation_graph.invoke(state, config=cfg) if cfg else self.evaluation_graph.invoke(state)
-        return self._to_candidate_state(res)
+        return self._invoke(self.evaluation_graph, state, thread_id, "run_evaluation")
 
     def run_full(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
-        if isinstance(state, dict):
-            state = CandidateState(**state)
-        cfg = self._cfg(thread_id)
-        res = self.full_workflow_graph.invoke(state, config=cfg) if cfg else self.full_workflow_graph.invoke(state)
-        return self._to_candidate_state(res)
+        return self._invoke(self.full_workflow_graph, state, thread_id, "run_full")
+
+    def run_post_match(self, state: CandidateState | dict, thread_id: Optional[str] = None) -> CandidateState:
+        """Run skill gap, assessment and interview generation in parallel on a matched state."""
+        return self._invoke(self.post_match_graph, state, thread_id, "run_post_match")
@@ -0,0 +1,84 @@
+import os
+import copy
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.langgraphagenticai.state.state import CandidateState
+
+NODE_MEMO_ENABLED = os.getenv("NODE_MEMO", "on").lower() not in ("0", "off", "false")
+NODE_MEMO_MAX_THREADS = int(os.getenv("NODE_MEMO_MAX_THREADS", "1000"))
+
+# CandidateState fields each node reads, and the fields it produces.
+NODE_INPUTS: Dict[str, List[str]] = {
+    "resume_upload": ["resume_file"],
+    "jd_upload": ["jd_text"],
+    "match_resume_with_jd": ["resume_clean", "jd_clean", "jd_id", "candidate_skills", "jd_skills"],
+    "skill_gap_analysis": ["missing_skills"],
+    "generate_assessment": ["jd_skills", "jd_experience"],
+    "generate_interview_questions": ["jd_skills", "jd_experience", "jd_text", "resume_text"],
+    "evaluate_candidate": ["interview_questions", "candidate_answers"],
+}
+NODE_OUTPUTS: Dict[str, List[str]] = {
+    "resume_upload": ["resume_text", "resume_clean", "resume_sentences", "resume_words", "candidate_skills"],
+    "jd_upload": ["jd_clean", "jd_sentences", "jd_words", "jd_skills", "jd_experience"],
+    "match_resume_with_jd": [
+        "tfidf_score", "bow_score", "embedding_score", "match_score", "matched_skills", "missing_skills",
+    ],
+    "skill_gap_analysis": ["skill_resources", "priority_skills"],
+    "generate_assessment": ["mcqs", "based_on_skills"],
+    "generate_interview_questions": ["interview_questions"],
+    "evaluate_candidate": ["feedback", "answer_feedback"],
+}
+# File path inputs are fingerprinted by path, size and mtime, so a re-upload to the same path still misses.
+FILE_FIELDS = {"resume_file"}
+
+
+def fingerprint(state: CandidateState, fields: List[str]) -> str:
+    values = state.model_dump(include=set(fields), mode="json")
+    for field in FILE_FIELDS & set(fields):
+        path = values.get(field)
+        if path and os.path.exists(path):
+            stat = os.stat(path)
+            values[field] = [path, stat.st_size, stat.st_mtime_ns]
+    return hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class NodeMemo:
+    """
+    Per-thread memo of node outputs keyed by a fingerprint of the node's declared
+    inputs: {thread_id: {node: (fingerprint, outputs)}}. Least recently used
+    threads are evicted beyond NODE_MEMO_MAX_THREADS.
+    """
+
+    def __init__(self, max_threads: int = NODE_MEMO_MAX_THREADS):
+        self.max_threads = max_threads
+        self._threads: "OrderedDict[str, Dict[str, Tuple[str, Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, thread_id: str, node: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._threads.get(thread_id, {}).get(node)
+            if entry is not None:
+                self._threads.move_to_end(thread_id)
+            hit = entry is not None and entry[0] == key
+            self._stats["hits" if hit else "misses"] += 1
+        return copy.deepcopy(entry[1]) if hit else None
+
+    def put(self, thread_id: str, node: str, key: str, outputs: Dict[str, Any]) -> None:
+        outputs = copy.deepcopy(outputs)
+        with self._lock:
+            self._threads.setdefault(thread_id, {})[node] = (key, outputs)
+            self._threads.move_to_end(thread_id)
+            while len(self._threads) > self.max_threads:
+                self._threads.popitem(last=False)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats, threads=len(self._threads))
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
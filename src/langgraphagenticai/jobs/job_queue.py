@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import functools
+import threading
+import traceback
+from typing import Callable, Dict, List, Optional
+
+from src.langgraphagenticai.database.pool import SQLitePool
+from src.langgraphagenticai.utils.tracing import tracer
+
+JOB_QUEUE_DB = os.getenv("JOB_QUEUE_DB", "./jobs.db")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = "queued", "running", "succeeded", "failed", "cancelled"
+TERMINAL_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+# handler(payload, is_cancelled) -> JSON-serialisable result
+JobHandler = Callable[[Dict, Callable[[], bool]], Dict]
+
+
+class JobQueue:
+    """
+    Local, SQLite-backed job queue for long-running pipeline steps.
+
+    Jobs survive restarts (jobs left `running` by a crash are re-queued on start),
+    are claimed highest-priority first, and run on a fixed pool of worker threads.
+    Cancelling a queued job removes it; cancelling a running job is cooperative:
+    the handler can poll `is_cancelled()` and its result is discarded either way.
+    Storage goes through a SQLitePool; each method has an `a`-prefixed twin for async handlers.
+    """
+
+    def __init__(self, handlers: Dict[str, JobHandler], db_path: str = JOB_QUEUE_DB, workers: int = JOB_WORKERS,
+                 pool: Optional[SQLitePool] = None):
+        self.handlers = handlers
+        self.db_path = db_path
+        self.workers = workers
+        self.pool = pool or SQLitePool(db_path)
+        self._changed = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+        self._init_db()
+
+    # ---------------- storage ---------------- #
+    def _init_db(self) -> None:
+        with self.pool.connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority DESC, created_at);
+            """)
+
+    def _notify(self) -> None:
+        with self._changed:
+            self._changed.notify_all()
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job.pop("payload", None)
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    # ---------------- public API ---------------- #
+    def submit(self, kind: str, payload: Dict, priority: int = 0) -> str:
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job_id = str(uuid.uuid4())
+        with self.pool.transaction() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, priority, status, payload, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, priority, QUEUED, json.dumps(payload), time.time()),
+            )
+        self._notify()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def wait(self, job_id: str, timeout: float, since_status: Optional[str] = None) -> Optional[Dict]:
+        """
+        Long-poll: block until the job is terminal, its status differs from
+        `since_status`, or `timeout` elapses. Returns the latest job record.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job["status"] in TERMINAL_STATUSES:
+                return job
+            if since_status is not None and job["status"] != since_status:
+                return job
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return job
+            with self._changed:
+                self._changed.wait(min(remaining, 1.0))
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        now = time.time()
+        with self.pool.transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, cancel_requested = 1 WHERE id = ? AND status = ?",
+                (CANCELLED, now, job_id, QUEUED),
+            )
+            conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?", (job_id, RUNNING))
+        self._notify()
+        return self.get(job_id)
+
+    def depth(self) -> Dict[str, int]:
+        with self.pool.connection() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED)}
+        counts.update({row[0]: row[1] for row in rows})
+        return counts
+
+    # ---------------- async twins ---------------- #
+    async def asubmit(self, kind: str, payload: Dict, priority: int = 0) -> str:
+        return await self.pool.arun(functools.partial(self.submit, kind, payload, priority=priority))
+
+    async def aget(self, job_id: str) -> Optional[Dict]:
+        return await self.pool.arun(self.get, job_id)
+
+    async def acancel(self, job_id: str) -> Optional[Dict]:
+        return await self.pool.arun(self.cancel, job_id)
+
+    async def adepth(self) -> Dict[str, int]:
+        return await self.pool.arun(self.depth)
+
+    # ---------------- workers ---------------- #
+    def start(self) -> None:
+        if self._threads:
+            return
+        # Jobs interrupted by a previous shutdown/crash go back to the queue.
+        with self.pool.transaction() as conn:
+            conn.execute("UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?", (QUEUED, RUNNING))
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        print(f"🧵 Job queue started with {self.workers} workers ({self.db_path})")
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._notify()
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        with self.pool.transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY priority DESC, created_at LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?", (RUNNING, time.time(), row["id"])
+                )
+        return row
+
+    def _is_cancelled(self, job_id: str) -> bool:
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row[0])
+
+    def _finish(self, job_id: str, status: str, result: Optional[Dict] = None, error: Optional[str] = None) -> None:
+        if status == SUCCEEDED and self._is_cancelled(job_id):
+            status, result = CANCELLED, None
+        with self.pool.transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id),
+            )
+        self._notify()
+
+    def _worker(self) -> None:
+        while not self._stopping:
+            try:
+                row = self._claim()
+            except sqlite3.OperationalError as e:
+                print(f"⚠️ Job claim failed: {e}")
+                row = None
+            if row is None:
+                with self._changed:
+                    self._changed.wait(1.0)
+                continue
+
+            self._notify()
+            job_id = row["id"]
+            try:
+                payload = json.loads(row["payload"])
+                with tracer.span(f"job {row['kind']}", kind="job", thread_id=payload.get("thread_id"), job_id=job_id):
+                    result = self.handlers[row["kind"]](payload, lambda: self._is_cancelled(job_id))
+                self._finish(job_id, SUCCEEDED, result=result)
+            except Exception as e:
+                print(traceback.format_exc())
+                self._finish(job_id, FAILED, error=str(e))
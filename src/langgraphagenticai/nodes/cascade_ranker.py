@@ -0,0 +1,136 @@
+import os
+import re
+import math
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.langgraphagenticai.state.state import CandidateState
+from src.langgraphagenticai.nodes.nodes import (
+    clean_text, extract_skills, get_embedding, MATCH_WEIGHTS, MATCH_SCORING_CONFIG,
+)
+from src.langgraphagenticai.database.match_store import match_store
+# Slack on the bound: stored vs. fresh embeddings differ in float noise, and scores are rounded to 2 dp.
+BOUND_SLACK = float(os.getenv("CASCADE_BOUND_SLACK", "0.01"))
+# Same tokens as sklearn's default TfidfVectorizer, so the bound holds for its score.
+_TOKEN = re.compile(r"(?u)\b\w\w+\b")
+
+
+def shared_term_bound(a: Counter, b: Counter) -> float:
+    """
+    Upper bound on the TF-IDF cosine of two documents from raw term counts.
+    By Cauchy-Schwarz, cos <= (|a_S| / |a|) * (|b_S| / |b|) over the shared terms S.
+    With a two-document corpus, idf is lowest for shared terms, so reweighting
+    can only shrink those ratios. The count-based value is therefore a valid bound.
+    """
+    if not a or not b:
+        return 0.0
+    shared = a.keys() & b.keys()
+    if not shared:
+        return 0.0
+    a_shared = math.sqrt(sum(a[t] ** 2 for t in shared))
+    b_shared = math.sqrt(sum(b[t] ** 2 for t in shared))
+    a_norm = math.sqrt(sum(v ** 2 for v in a.values()))
+    b_norm = math.sqrt(sum(v ** 2 for v in b.values()))
+    return min(1.0, (a_shared / a_norm) * (b_shared / b_norm))
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    denom = float(np.linalg.norm(a) * np.linalg.norm(b))
+    return float(np.dot(a, b) / denom) if denom else 0.0
+
+
+def cascade_rank(
+    node,
+    candidate_state: CandidateState,
+    jds: List[Dict],
+    features: Dict[int, Dict],
+    bm25_scores: Dict[int, float],
+    keep: int = 1,
+) -> Tuple[List[Tuple[float, Dict, CandidateState]], Dict]:
+    """
+    Ranks JDs for one resume without fully scoring every JD.
+
+    Stage 1 (all JDs, cheap): skill overlap and BM25 from stored features, plus
+    an upper bound on match_score. The bound combines the exact cosine against
+    the stored JD embedding (1.0 when none is stored), the shared-term TF-IDF
+    bound and the exact overlap term. JDs with cached vector scores
+    (match_store) use those instead, which makes their bound exact.
+    Stage 2: JDs are visited in descending bound order, with BM25 breaking ties.
+    Each runs the usual jd_upload + match_resume_with_jd. Once a bound falls
+    below the current k-th best score, it and every JD after it are pruned.
+
+    Returns the `keep` best (score, jd, state) and a per-stage report.
+    """
+    start = time.perf_counter()
+    candidate_skills = set(candidate_state.candidate_skills)
+    resume_terms = Counter(_TOKEN.findall(candidate_state.resume_clean or ""))
+    resume_embedding = None
+    if any(f.get("embedding") for f in features.values()):
+        resume_embedding = np.asarray(get_embedding(candidate_state.resume_clean or "")[0], dtype=np.float32)
+
+    prepared = []
+    for jd in jds:
+        feature = features.get(jd["id"])
+        jd_clean = feature["clean_text"] if feature else clean_text(jd["text"] or "")
+        prepared.append((jd, feature, jd_clean))
+    cached = match_store.get_many([
+        match_store.key(candidate_state.resume_clean, jd["id"], jd_clean, MATCH_SCORING_CONFIG)
+        for jd, _, jd_clean in prepared
+    ])
+
+    stage1, stored_embeddings = [], 0
+    for jd, feature, jd_clean in prepared:
+        jd_skills = set(feature["skills"]) if feature else set(extract_skills(jd["text"] or ""))
+        overlap = len(candidate_skills & jd_skills) / max(len(jd_skills), 1)
+        if jd["id"] in cached:
+            embedding_bound, tfidf_bound = cached[jd["id"]]["embedding_score"], cached[jd["id"]]["tfidf_score"]
+        else:
+            embedding_bound = 1.0
+            if resume_embedding is not None and feature and feature.get("embedding"):
+                embedding_bound = _cosine(resume_embedding, np.frombuffer(feature["embedding"], dtype=np.float32))
+                stored_embeddings += 1
+            tfidf_bound = shared_term_bound(resume_terms, Counter(_TOKEN.findall(jd_clean)))
+        bound = (MATCH_WEIGHTS["embedding"] * embedding_bound + MATCH_WEIGHTS["tfidf"] * tfidf_bound
+                 + MATCH_WEIGHTS["skill_overlap"] * overlap)
+        # BM25 from SQLite is negative, lower = better; unmatched JDs sort last.
+        stage1.append((bound + BOUND_SLACK, bm25_scores.get(jd["id"], 0.0), jd))
+    stage1_ms = (time.perf_counter() - start) * 1000
+
+    stage1.sort(key=lambda c: (-c[0], c[1]))
+    start = time.perf_counter()
+    best: List[Tuple[float, Dict, CandidateState]] = []
+    scored = 0
+    for bound, _, jd in stage1:
+        if len(best) >= keep and bound < best[-1][0]:
+            break
+        state = candidate_state.model_copy(deep=True)
+        state.jd_text = jd["text"]
+        state.jd_id = jd["id"]
+        state = node.match_resume_with_jd(node.jd_upload(state))
+        scored += 1
+        best.append((state.match_score, jd, state))
+        # Stable sort keeps the earlier-visited JD first on ties.
+        best.sort(key=lambda b: -b[0])
+        del best[keep:]
+    stage2_ms = (time.perf_counter() - start) * 1000
+
+    report = {
+        "candidates": len(jds),
+        "stage1": {
+            "scored": len(stage1),
+            "bm25_hits": sum(1 for jd in jds if jd["id"] in bm25_scores),
+            "stored_features": sum(1 for jd in jds if jd["id"] in features),
+            "stored_embeddings": stored_embeddings,
+            "cached_scores": len(cached),
+            "elapsed_ms": round(stage1_ms, 1),
+        },
+        "stage2": {
+            "fully_scored": scored,
+            "pruned": len(stage1) - scored,
+            "elapsed_ms": round(stage2_ms, 1),
+        },
+    }
+    return best, report
@@ -1,6 +1,10 @@
 import re
 import string
 import json
+import hashlib
+import os
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize, sent_tokenize
@@ -8,23 +12,39 @@ from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from sentence_transformers import SentenceTransformer
 from pypdf import PdfReader
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.exceptions import OutputParserException
 import httpx
 import asyncio
 
 
 from src.langgraphagenticai.state import state
-from src.langgraphagenticai.state.state import CandidateState, MCQAssessment, InterviewAssessment
+from src.langgraphagenticai.state.state import (
+    CandidateState, MCQAssessment, InterviewAssessment, InterviewQuestion,
+    QuestionFeedback, SkillResourceRanking,
+)
 from src.langgraphagenticai.LLMS.groqllm import GroqLLM
-from src.langgraphagenticai.tools.web_search_tool import WebSearchTool
+from src.langgraphagenticai.LLMS.router import ModelRouter
+from src.langgraphagenticai.tools.web_search_tool import WebSearchTool, run_searches
 from src.langgraphagenticai.tools.interview_search_tool import InterviewWebSearchTool
+from src.langgraphagenticai.tools.resource_catalog import resource_catalog, SOURCE_LLM
+from src.langgraphagenticai.utils.context_packer import ContextPacker
+from src.langgraphagenticai.utils.json_extract import extract_json
+from src.langgraphagenticai.database.match_store import match_store, config_hash
+from src.langgraphagenticai.utils.metrics import NODE_SECONDS, EMBEDDING_SECONDS, PDF_PARSE_SECONDS
+from src.langgraphagenticai.utils.tracing import tracer
 
 
-embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+# match_score weights; MATCH_WEIGHTS='{"embedding": 0.6, "tfidf": 0.2, "skill_overlap": 0.2}' overrides them.
+MATCH_WEIGHTS = {"embedding": 0.5, "tfidf": 0.3, "skill_overlap": 0.2, **json.loads(os.getenv("MATCH_WEIGHTS", "{}"))}
+
+# Max concurrent single-answer evaluations when /evaluate-interview has to fill gaps.
+EVALUATION_CONCURRENCY = int(os.getenv("EVALUATION_CONCURRENCY", "4"))
 
 # ------------------ Utility functions ------------------ #
 
+@PDF_PARSE_SECONDS.timed()
 def extract_text_from_pdf(pdf_path: str) -> str:
     text = ""
     try:
@@ -50,7 +70,8 @@ def tokenize_text(text: str):
     return sent_tokenize(text), word_tokenize(text)
 
 def get_embedding(text: str) -> np.ndarray:
-    return np.array(embedding_model.encode([text]))
+    with EMBEDDING_SECONDS.time(call="single"):
+        return np.array(embedding_model.encode([text]))
 
 def vectorize_texts(resume_text: str, jd_text: str):
     tfidf = TfidfVectorizer()
@@ -115,6 +136,12 @@ RAW_COMMON_SKILLS = [
 
 COMMON_SKILLS = sorted([skill.lower() for skill in RAW_COMMON_SKILLS], key=lambda x: -len(x))
 
+# Everything that determines the vector scores match_store caches: part of its key.
+MATCH_SCORING_CONFIG = config_hash({
+    "embedding_model": EMBEDDING_MODEL_NAME,
+    "vectorizers": "sklearn-tfidf+count-default",
+})
+
 def extract_skills(text: str, skills_list: list = RAW_COMMON_SKILLS) -> list:
     """
     Extract skills from text based on a skills list.
@@ -139,69 +166,20 @@ def extract_skills(text: str, skills_list: list = RAW_COMMON_SKILLS) -> list:
     return list(set(matched_skills))
 
 
-
-def clean_json_string(s: str) -> str:
-    """Removes common LLM artifacts and control characters."""
-    # 1. Remove trailing commas (common JSON error)
-    s = re.sub(r",\s*([\]}])", r"\1", s)
-    # 2. Remove control characters
-    s = re.sub(r"[\x00-\x1f]+", "", s)
-    return s
-
 # --- The core safe parsing function ---
 def safe_parse_json(response_text, parser=None):
     """
     Safely parse JSON from LLM output (string or dict).
-    Handles extra text, thought tags, code fences, and control chars.
+    Delegates to the single-pass `extract_json` (handles thought tags, code fences
+    and surrounding prose) and validates against the parser's schema if given.
     """
-    if isinstance(response_text, dict):
-        return parser.parse(json.dumps(response_text)) if parser else response_text
-
-    response_text = str(response_text).strip()
-    
-    # Pre-cleanup: Remove thought traces and code blocks
-    response_text = re.sub(r"<think>.*?</think>", "", response_text, flags=re.DOTALL)
-    response_text = re.sub(r"```(?:json)?|```", "", response_text)
-    
-    # Apply JSON-specific cleanup
-    response_text = clean_json_string(response_text)
+    obj = extract_json(response_text)
+    return parser.pydantic_object.model_validate(obj) if parser else obj
 
-    # 1. Try direct parse first (clean but complete)
-    obj = None
-    try:
-        obj = json.loads(response_text)
-    except json.JSONDecodeError:
-        # 2. Fallback: Find the first valid {...} or [...] block
-        
-        # Array extraction is often prioritized for list responses like feedback
-        start_arr = response_text.find('[')
-        end_arr = response_text.rfind(']')
-        
-        # Object extraction
-        start_obj = response_text.find('{')
-        end_obj = response_text.rfind('}')
-
-        json_str = None
-
-        # Prioritize the array if it appears before the object, or if there's no object
-        if start_arr != -1 and end_arr != -1 and (start_arr < start_obj or start_obj == -1):
-             json_str = response_text[start_arr:end_arr + 1]
-        # Otherwise, use the object block
-        elif start_obj != -1 and end_obj != -1:
-             json_str = response_text[start_obj:end_obj + 1]
-        
-        if json_str:
-            try:
-                obj = json.loads(json_str)
-            except json.JSONDecodeError as e:
-                # This is the point where 'Extra data' errors often surface if the regex extraction was too broad.
-                # However, by using rfind() for the end, we aim to capture the outermost structure.
-                raise OutputParserException(f"Could not decode JSON: {e}")
-
-    if obj is None:
-        raise OutputParserException("No JSON object or array found in response.")
-
-    return parser.parse(json.dumps(obj)) if parser else obj
+def answer_fingerprint(answer: str) -> str:
+    """Stable hash of an answer, used to tell whether stored feedback is still valid."""
+    normalized = " ".join((answer or "").split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
 
 def extract_experience(text: str) -> str:
     """
@@ -215,18 +193,58 @@ def extract_experience(text: str) -> str:
         return match.group(1)
     return "fresher"
 
+def combine_match_score(components: Dict[str, float], weights: Dict[str, float] = MATCH_WEIGHTS) -> float:
+    return round(
+        weights["embedding"] * components["embedding_score"] +
+        weights["tfidf"] * components["tfidf_score"] +
+        weights["skill_overlap"] * components["skill_overlap"], 2)
+
+def compute_jd_features(jds: List[Dict]) -> List[Dict]:
+    """
+    Precompute what matching needs from a JD ({id, text} rows): skills, experience,
+    the cleaned text TF-IDF is fitted on, and the embedding (one batched encode).
+    """
+    cleaned = [clean_text(jd["text"] or "") for jd in jds]
+    with EMBEDDING_SECONDS.time(call="batch"):
+        embeddings = embedding_model.encode(cleaned, batch_size=64) if jds else []
+    return [
+        {
+            "jd_id": jd["id"],
+            "skills": extract_skills(jd["text"] or ""),
+            "experience": extract_experience(clean),
+            "clean_text": clean,
+            "embedding": np.asarray(vector, dtype=np.float32).tobytes(),
+        }
+        for jd, clean, vector in zip(jds, cleaned, embeddings)
+    ]
+
 # ------------------ Node Class ------------------ #
 
 class WebSearchChatbotNode:
     """Recruitment pipeline nodes with explicit web search for MCQs & interviews."""
 
-    def __init__(self, llm: GroqLLM):
+    def __init__(self, llm: GroqLLM, router: Optional[ModelRouter] = None):
         self.llm = llm
-        self.mcq_parser = PydanticOutputParser(pydantic_object=MCQAssessment)
-        self.interview_parser = PydanticOutputParser(pydantic_object=InterviewAssessment)
+        # Per-node model routing; defaults to routes built around the given model.
+        self.router = router or ModelRouter(default_model=llm.model_name, llms={llm.model_name: llm})
         self.web_search_tool = WebSearchTool()
         self.interview_search_tool = InterviewWebSearchTool()
+        self.context_packer = ContextPacker()
+        self.resource_catalog = resource_catalog
+
+    def _generate_structured(self, node: str, prompt: str, schema, metadata: Optional[Dict] = None,
+                             key: Optional[str] = None):
+        """
+        Structured generation on the model routed for `node`; the routing decision goes into `metadata`.
+        The routed GroqLLM adds `schema`'s format instructions when its mode needs them.
+        """
+        result, decision = self.router.call(node, lambda llm: llm.generate_structured(prompt, schema))
+        print(f"🧭 [{key or node}] routed to {decision['model']} ({decision['reason']}, {decision['latency_ms']} ms)")
+        if metadata is not None:
+            metadata.setdefault("routing", {})[key or node] = decision
+        return result
 
+    @NODE_SECONDS.timed(node="resume_upload")
     def resume_upload(self, state: CandidateState) -> CandidateState:
         try:
             # Extract raw text from PDF
@@ -249,6 +267,7 @@ class WebSearchChatbotNode:
 
 
 # --------- JD Upload ---------
+    @NODE_SECONDS.timed(node="jd_upload")
     def jd_upload(self, state: CandidateState) -> CandidateState:
         try:
             jd_raw = state.jd_text or ""
@@ -268,27 +287,31 @@ class WebSearchChatbotNode:
         return state
 
 
+    @NODE_SECONDS.timed(node="match_resume_with_jd")
     def match_resume_with_jd(self,state: CandidateState) -> CandidateState:
         try:
-            # Vector similarities
-            tfidf, bow, emb = vectorize_texts(state.resume_clean, state.jd_clean)
-
-            state.tfidf_score = tfidf
-            state.bow_score = bow
-            state.embedding_score = emb
-
             # Extract skills
             state.matched_skills = list(set(state.candidate_skills) & set(state.jd_skills))
             state.missing_skills = list(set(state.jd_skills) - set(state.candidate_skills))
-
-            skill_overlap = len(state.matched_skills) / max(len(state.jd_skills), 1)
             print(state.matched_skills)
             print(state.missing_skills)
 
-            state.match_score = round(
-                    0.5 * emb +   
-                    0.3 * tfidf +  
-                    0.2 * skill_overlap ,2)
+            # Vector similarities are cached per (resume, JD id, JD version, scoring config)
+            key = match_store.key(state.resume_clean, state.jd_id, state.jd_clean, MATCH_SCORING_CONFIG)
+            components = match_store.get(key)
+            if components is None:
+                tfidf, bow, emb = vectorize_texts(state.resume_clean, state.jd_clean)
+                components = {"tfidf_score": tfidf, "bow_score": bow, "embedding_score": emb}
+                match_store.put(key, components)
+            else:
+                print("♻️ Match scores served from cache")
+            # The skill lists can be posted or edited by the client, so overlap is never cached.
+            components["skill_overlap"] = len(state.matched_skills) / max(len(state.jd_skills), 1)
+
+            state.tfidf_score = components["tfidf_score"]
+            state.bow_score = components["bow_score"]
+            state.embedding_score = components["embedding_score"]
+            state.match_score = combine_match_score(components)
 
         except Exception as e:
             state.match_score = 0
@@ -299,6 +322,7 @@ class WebSearchChatbotNode:
 
 
 
+    @NODE_SECONDS.timed(node="skill_gap_analysis")
     def skill_gap_analysis(self, state: CandidateState) -> CandidateState:
 
         try:
@@ -360,65 +384,84 @@ class WebSearchChatbotNode:
                             })
                 return labeled_resources
 
-            for skill in state.missing_skills:
-                print(f"\n🔍 Processing skill: {skill}")
-                query = f"Best free resources to learn {skill} programming (docs, tutorials, YouTube, courses)"
-                search_results = self.web_search_tool.run(query)
-                print(f"🌐 Raw search output for {skill} (first 300 chars):\n{str(search_results)[:300]}")
+            def keep_valid(items) -> list:
+                """Keep well-formed {title, type, url} entries, top 5."""
+                final_resources = []
+                for item in items:
+                    if isinstance(item, dict) and all(key in item for key in ["title", "type", "url"]):
+                        final_resources.append({
+                            "title": item["title"],
+                            "type": item["type"],
+                            "url": item["url"]
+                        })
+                return final_resources[:5]
+
+            # ---- Serve known skills from the resource catalog ----
+            resources, unknown = self.resource_catalog.lookup(state.missing_skills)
+            state.run_metadata["resource_catalog"] = {"hits": sorted(resources), "misses": list(unknown)}
+            print(f"📗 Resource catalog: {len(resources)} hits, {len(unknown)} to fetch")
+            if not unknown:
+                state.skill_resources = resources
+                print(f"\n📚 Skill gap analysis completed for {len(resources)} skills (catalog only)")
+                return state
 
+            # ---- Search unknown/stale skills concurrently (one round trip, not N) ----
+            queries = [
+                f"Best free resources to learn {skill} programming (docs, tutorials, YouTube, courses)"
+                for skill in unknown
+            ]
+            extracted_by_skill = {}
+            for skill, search_results in zip(unknown, run_searches(self.web_search_tool, queries)):
+                print(f"🌐 Raw search output for {skill} (first 300 chars):\n{str(search_results)[:300]}")
                 extracted = extract_link_metadata(search_results)
-                
-                if not extracted:
+                if extracted:
+                    extracted_by_skill[skill] = extracted
+                else:
                     print(f"⚠️ No links extracted for {skill}")
                     resources[skill] = []
-                    continue
 
-                # --- LLM Ranking and Naming ---
-                ranked = extracted
+            # ---- One batched LLM call ranks and names resources for every unknown skill ----
+            ranked_by_skill = {}
+            if extracted_by_skill:
                 try:
-                    urls_text = "\n".join([f"- Title: {r['title']} (Type: {r['type']}, URL: {r['url']})" for r in extracted])
+                    blocks = []
+                    for skill, extracted in extracted_by_skill.items():
+                        urls_text = "\n".join([f"- Title: {r['title']} (Type: {r['type']}, URL: {r['url']})" for r in extracted])
+                        blocks.append(f"Resources for {skill}:\n{urls_text}")
                     prompt = f"""
                     You are an expert AI mentor.
-                    From the following list of learning resources for **{skill}**, 
-                    choose the top **5** that are most practical, high-quality, and beginner-friendly.
+                    For each skill below, from its list of learning resources choose the top **5**
+                    that are most practical, high-quality, and beginner-friendly.
                     For each chosen resource, give it a concise and professional **title** that clearly describes the resource (e.g., "Official Keras Documentation" or "PyTorch Fundamentals Video Course").
 
-                    Return a valid JSON array of objects, ensuring no text precedes or follows the array.
-                    Each object must have three keys: "title" (your generated name), "type", and "url".
+                    Return JSON with a "skills" array and nothing else. Each entry has "skill" (exactly as given)
+                    and "resources": an array of objects with three keys: "title" (your generated name), "type", and "url".
 
-                    Resources for {skill}:
-                    {urls_text}
+                    {chr(10).join(blocks)}
                     """
-                    
-                    response = self.llm.llm.invoke(prompt)
-                    raw = (response.content or "").strip()
-                    
-                    # Use the robust safe_parse_json utility
-                    parsed_data = safe_parse_json(raw)
-                    
-                    # Ensure the parsed data is a list of dictionaries
-                    if isinstance(parsed_data, dict):
-                        ranked = [parsed_data]
-                    elif isinstance(parsed_data, list):
-                        ranked = parsed_data
-                    else:
-                        raise ValueError("LLM did not return a valid list or object.")
-                        
+
+                    parsed = self._generate_structured(
+                        "skill_gap_analysis", prompt, SkillResourceRanking, metadata=state.run_metadata
+                    )
+                    wanted = {skill.lower(): skill for skill in extracted_by_skill}
+                    for entry in parsed.skills:
+                        skill = wanted.get(entry.skill.strip().lower())
+                        if skill:
+                            ranked_by_skill[skill] = keep_valid([r.model_dump() for r in entry.resources])
                 except Exception as e:
-                    print(f"⚠️ LLM ranking/naming error for {skill}: {e}. Keeping default top 5.")
-                    ranked = extracted[:5]
+                    print(f"⚠️ LLM ranking/naming error: {e}. Keeping default top 5.")
 
-                # Filter the LLM output to match the expected structure and limit to top 5
-                final_resources = []
-                for item in ranked:
-                    if isinstance(item, dict) and all(key in item for key in ["title", "type", "url"]):
-                        final_resources.append({
-                            "title": item["title"],
-                            "type": item["type"],
-                            "url": item["url"]
-                        })
-                
-                resources[skill] = final_resources[:5]
+            llm_ranked = {}
+            for skill, extracted in extracted_by_skill.items():
+                if ranked_by_skill.get(skill):
+                    resources[skill] = llm_ranked[skill] = ranked_by_skill[skill]
+                else:
+                    resources[skill] = keep_valid(extracted)
+
+            # Remember ranked results so the next candidate with this gap skips search + LLM.
+            # Unranked (fallback) lists are not stored, so they get ranked on a later run.
+            if llm_ranked:
+                self.resource_catalog.upsert_many(llm_ranked, SOURCE_LLM)
 
             state.skill_resources = resources
             print(f"\n📚 Skill gap analysis completed for {len(resources)} skills")
@@ -434,6 +477,7 @@ class WebSearchChatbotNode:
 
 
 
+    @NODE_SECONDS.timed(node="generate_assessment")
     def generate_assessment(self, state: CandidateState) -> CandidateState:
         try:
             if not state.jd_skills:
@@ -444,36 +488,34 @@ class WebSearchChatbotNode:
             print(f"🧩 JD Skills ({len(state.jd_skills)}): {state.jd_skills}")
 
             # ---- Aggregate web results for all topics ----
-            all_results = ""
-            for skill in state.jd_skills:  # limit to 20 to avoid overload
-                query = f"technical MCQs for {skill} with answers and explanations"
-                print(f"🌐 Searching MCQs for: {skill}")
-                try:
-                    result = self.web_search_tool.run(query)
-                    print(f"🔎 {skill}: {len(result)} chars")
-                    all_results += f"\n### {skill}\n{result[:1000]}\n"
-                except Exception as e:
-                    print(f"⚠️ Error fetching for {skill}: {e}")
+            skills = state.jd_skills  # limit to 20 to avoid overload
+            queries = [f"technical MCQs for {skill} with answers and explanations" for skill in skills]
+            print(f"🌐 Searching MCQs for {len(skills)} skills concurrently")
+            search_results = {}
+            for skill, result in zip(skills, run_searches(self.web_search_tool, queries)):
+                print(f"🔎 {skill}: {len(result)} chars")
+                search_results[skill] = result
+
+            # ---- Pack results under a token budget shared fairly by every skill ----
+            packed = self.context_packer.pack(search_results, intent="mcq question answer explanation code")
+            state.run_metadata.setdefault("context_tokens", {})["generate_assessment"] = packed.report()
+            print(f"📦 Packed context: {packed.tokens_used}/{packed.token_budget} tokens (raw {packed.raw_tokens})")
 
             prompt = f"""
             You are tasked with generating a technical MCQ assessment.
 
             - Generate **exactly 25** high-quality MCQs.
             - Mix: concept checks, applied coding, debugging, optimization.
-            - Each MCQ must include: "question", "options" (A-D), "correct_answer", "explanation".
+            - Each MCQ must include: "question", "options" (A-D), "answer", "explanation".
             - Context: Role requires skills in {', '.join(state.jd_skills[:20])}
             with {state.jd_experience} experience.
             - Output MUST be a **valid JSON object** and nothing else.
 
             Web Results (aggregated from all topics):
-            {all_results[:4000]}...
-
-            {self.mcq_parser.get_format_instructions()}
+            {packed.text}
             """
 
-            response = self.llm.llm.invoke(prompt)
-            parsed_data = safe_parse_json(response.content)
-            parsed_object = self.mcq_parser.parse(json.dumps(parsed_data))
+            parsed_object = self._generate_structured("generate_assessment", prompt, MCQAssessment, state.run_metadata)
             
             # ---- Convert correct answer text to single letter A-D ----
             for mcq in parsed_object.questions:
@@ -514,6 +556,7 @@ class WebSearchChatbotNode:
 
 
 
+    @NODE_SECONDS.timed(node="generate_interview_questions")
     def generate_interview_questions(self, state: CandidateState) -> CandidateState:
         """
         Generate interview questions (technical, behavioral, critical thinking).
@@ -528,16 +571,18 @@ class WebSearchChatbotNode:
             print(f"🎯 JD Skills ({len(state.jd_skills)}): {state.jd_skills}")
 
             # ---- Aggregate search results ----
-            all_results = ""
-            for skill in state.jd_skills[:20]:
-                query = f"interview questions for {skill} (technical, behavioral, critical thinking)"
-                print(f"🌐 Searching Interview Questions for: {skill}")
-                try:
-                    result = self.interview_search_tool.run(query)
-                    print(f"🔎 {skill}: {len(result)} chars")
-                    all_results += f"\n### {skill}\n{result[:1000]}\n"
-                except Exception as e:
-                    print(f"⚠️ Error fetching for {skill}: {e}")
+            skills = state.jd_skills[:20]
+            queries = [f"interview questions for {skill} (technical, behavioral, critical thinking)" for skill in skills]
+            print(f"🌐 Searching Interview Questions for {len(skills)} skills concurrently")
+            search_results = {}
+            for skill, result in zip(skills, run_searches(self.interview_search_tool, queries)):
+                print(f"🔎 {skill}: {len(result)} chars")
+                search_results[skill] = result
+
+            # ---- Pack results under a token budget shared fairly by every skill ----
+            packed = self.context_packer.pack(search_results, intent="interview question scenario behavioral explain")
+            state.run_metadata.setdefault("context_tokens", {})["generate_interview_questions"] = packed.report()
+            print(f"📦 Packed context: {packed.tokens_used}/{packed.token_budget} tokens (raw {packed.raw_tokens})")
 
             prompt = f"""
             You are tasked with generating interview questions.
@@ -551,20 +596,18 @@ class WebSearchChatbotNode:
             - Output MUST be valid JSON and nothing else.
 
             Web Results (aggregated from all topics):
-            {all_results[:4000]}...
+            {packed.text}
 
             Candidate Resume Snippet:
             {(state.resume_text or '')[:500]}
 
             Job Description Snippet:
             {(state.jd_text or '')[:500]}
-
-            {self.interview_parser.get_format_instructions()}
             """
 
-            response = self.llm.llm.invoke(prompt)
-            parsed_data = safe_parse_json(response.content)
-            parsed_object = self.interview_parser.parse(json.dumps(parsed_data))
+            parsed_object = self._generate_structured(
+                "generate_interview_questions", prompt, InterviewAssessment, state.run_metadata
+            )
             state.interview_questions = parsed_object.questions
 
             print(f"✅ Generated {len(state.interview_questions)} interview questions.")
@@ -575,9 +618,37 @@ class WebSearchChatbotNode:
 
         return state
     
+    @NODE_SECONDS.timed(node="evaluate_single_answer")
+    def evaluate_single_answer(self, question: InterviewQuestion, answer: str, index: int,
+                               metadata: Optional[Dict] = None) -> str:
+        """
+        Evaluate one interview answer. Called in the background as soon as an answer
+        is submitted or transcribed, so evaluation overlaps with the interview itself.
+        """
+        if not (answer or "").strip():
+            return "No answer provided."
+
+        prompt = f"""
+        You are an experienced technical interviewer.
+        Review the question and the candidate's answer and give concise, constructive feedback.
+
+        Q{index + 1} ({question.type}): {question.question}
+        Candidate Answer: {answer}
+
+        Your output MUST be ONLY valid JSON: {{"question_index": {index + 1}, "review_feedback": "..."}}
+        """
+
+        parsed = self._generate_structured(
+            "evaluate_answers", prompt, QuestionFeedback, metadata, key=f"evaluate_answers[Q{index + 1}]"
+        )
+        return parsed.review_feedback
+
+    @NODE_SECONDS.timed(node="evaluate_answers")
     def evaluate_answers(self, state: CandidateState) -> CandidateState:
         """
-        Evaluate each interview answer individually using the LLM.
+        Assemble per-question feedback for the interview.
+        Feedback already computed in the background (state.answer_feedback) is reused when the
+        answer is unchanged; only missing or edited answers are evaluated, concurrently.
         Returns structured per-question feedback (no overall score).
         """
         try:
@@ -586,40 +657,38 @@ class WebSearchChatbotNode:
                 state.feedback = []
                 return state
 
-            # Prepare questions and answers
-            questions_data = []
-            for i, question_obj in enumerate(state.interview_questions):
-                answer = state.candidate_answers[i] if i < len(state.candidate_answers) else "NO_ANSWER_PROVIDED"
-                questions_data.append(
-                    f"Q{i+1} ({question_obj.type}): {question_obj.question}\n"
-                    f"Candidate Answer: {answer}\n---"
-                )
-
-            questions_with_answers = "\n".join(questions_data)
-
-            prompt = f"""
-            You are an experienced technical interviewer. 
-            Review each question and the candidate's answer.
-            Provide constructive textual feedback for every question.
-
-            Candidate's interview session:
-            ---
-            {questions_with_answers}
-            ---
-
-            CRITICAL INSTRUCTION: Your output MUST be ONLY the valid JSON array and nothing else.
-            Return only a valid JSON array of objects, ensuring no text precedes or follows the array:
-            [
-            {{ "question_index": 1, "review_feedback": "Concise and correct explanation." }},
-            {{ "question_index": 2, "review_feedback": "Missed mentioning time complexity." }}
+            answers = {
+                i: state.candidate_answers[i] if i < len(state.candidate_answers) else ""
+                for i in range(len(state.interview_questions))
+            }
+
+            pending = {}
+            for i, answer in answers.items():
+                cached = state.answer_feedback.get(i)
+                if not cached or cached.get("answer_hash") != answer_fingerprint(answer):
+                    pending[i] = answer
+            print(f"🧾 Interview evaluation: {len(answers) - len(pending)} reused, {len(pending)} to evaluate")
+
+            if pending:
+                with ThreadPoolExecutor(max_workers=min(EVALUATION_CONCURRENCY, len(pending))) as pool:
+                    futures = {
+                        i: pool.submit(
+                            tracer.propagate(self.evaluate_single_answer),
+                            state.interview_questions[i], answer, i, state.run_metadata,
+                        )
+                        for i, answer in pending.items()
+                    }
+                for i, future in futures.items():
+                    try:
+                        review = future.result()
+                    except Exception as e:
+                        review = f"Error during evaluation: {e}"
+                    state.answer_feedback[i] = {"answer_hash": answer_fingerprint(pending[i]), "review_feedback": review}
+
+            parsed_feedback = [
+                {"question_index": i + 1, "review_feedback": state.answer_feedback[i]["review_feedback"]}
+                for i in sorted(answers)
             ]
-            """
-
-            response = self.llm.llm.invoke(prompt)
-            parsed_feedback = safe_parse_json(response.content)
-
-            if not isinstance(parsed_feedback, list):
-                parsed_feedback = [{"question_index": 1, "review_feedback": str(parsed_feedback)}]
 
             # --- FIX: Convert the list of dicts to a JSON string before saving to state ---
             state.feedback = json.dumps(parsed_feedback) # <--- THIS IS THE FIX
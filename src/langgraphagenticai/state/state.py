@@ -1,6 +1,28 @@
-from typing import List, Dict, Optional
+from typing import Annotated, Any, List, Dict, Optional
 from pydantic import BaseModel, Field
 
+
+# ------------------ Reducers ------------------ #
+# Used by LangGraph to merge writes from parallel branches into one channel.
+
+def merge_dicts(left: Optional[Dict], right: Optional[Dict]) -> Dict:
+    """Recursively merge two dicts; values from `right` win on conflicts."""
+    merged = dict(left or {})
+    for key, value in (right or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_dicts(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def merge_unique(left: Optional[List], right: Optional[List]) -> List:
+    """Append items from `right` that are not already in `left` (order preserving)."""
+    merged = list(left or [])
+    for item in right or []:
+        if item not in merged:
+            merged.append(item)
+    return merged
+
 class MCQQuestion(BaseModel):
     question: str = Field(..., description="The multiple-choice question text.")
     options: List[str] = Field(..., description="A list of four possible answer options.")
@@ -17,6 +39,28 @@ class MCQAssessment(BaseModel):
 class InterviewAssessment(BaseModel):
     questions: List[InterviewQuestion] = Field(..., description="A list of interview questions.")
 
+class QuestionFeedback(BaseModel):
+    question_index: int = Field(..., description="1-based index of the interview question.")
+    review_feedback: str = Field(..., description="Constructive feedback on the candidate's answer.")
+
+class InterviewFeedback(BaseModel):
+    feedback: List[QuestionFeedback] = Field(..., description="Feedback for every interview question.")
+
+class LearningResource(BaseModel):
+    title: str = Field(..., description="Concise, professional title for the resource.")
+    type: str = Field(..., description="Resource type: 'video', 'course' or 'article'.")
+    url: str = Field(..., description="URL of the resource.")
+
+class RankedResources(BaseModel):
+    resources: List[LearningResource] = Field(..., description="The top learning resources, best first.")
+
+class SkillResources(BaseModel):
+    skill: str = Field(..., description="The skill exactly as given in the request.")
+    resources: List[LearningResource] = Field(..., description="The top learning resources for the skill, best first.")
+
+class SkillResourceRanking(BaseModel):
+    skills: List[SkillResources] = Field(..., description="Ranked resources for every requested skill.")
+
 class CandidateState(BaseModel):
     # === Resume Info ===
     resume_file: Optional[str] = None
@@ -29,6 +73,7 @@ class CandidateState(BaseModel):
     candidate_experience: Optional[str] = None
 
     # === Job Description Info ===
+    jd_id: Optional[int] = None
     jd_file_path: Optional[str] = None
     jd_text: Optional[str] = None
     jd_clean: Optional[str] = None
@@ -60,10 +105,16 @@ class CandidateState(BaseModel):
     audio_transcripts: Dict[int, str] = {}
     interview_score: Optional[float] = None
     feedback: Optional[str] = None
+    # Per-question feedback computed as answers arrive: {index: {"answer_hash", "review_feedback"}}
+    answer_feedback: Dict[int, Dict[str, str]] = Field(default_factory=dict)
 
     # === Final Feedback ===
     final_score: Optional[float] = None
     resume_feedback: Optional[str] = None
     skill_feedback: Optional[str] = None
     study_resources: Dict[str, str] = Field(default_factory=dict)
-    next_steps: List[str] = Field(default_factory=list)
\ No newline at end of file
+    next_steps: List[str] = Field(default_factory=list)
+
+    # === Pipeline Bookkeeping ===
+    completed_steps: Annotated[List[str], merge_unique] = Field(default_factory=list)
+    run_metadata: Annotated[Dict[str, Any], merge_dicts] = Field(default_factory=dict)
@@ -0,0 +1,104 @@
+import os
+import json
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.langgraphagenticai.database.pool import SQLitePool
+from src.langgraphagenticai.database.jd_store import jd_store, JD_DB_PATH
+
+RESOURCE_CATALOG_DB = os.getenv("RESOURCE_CATALOG_DB", "./jds.db")
+# Entries ranked by the LLM are re-derived after this age; admin imports never expire.
+RESOURCE_CATALOG_MAX_AGE_S = float(os.getenv("RESOURCE_CATALOG_MAX_AGE_S", str(30 * 24 * 3600)))
+
+SOURCE_IMPORT = "import"
+SOURCE_LLM = "llm"
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS skill_resource_catalog (
+        skill TEXT PRIMARY KEY,
+        resources TEXT NOT NULL,
+        source TEXT NOT NULL,
+        refreshed_at REAL NOT NULL
+    );
+"""
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(str(skill).lower().split())
+
+
+class ResourceCatalog:
+    """
+    Persistent per-skill catalog of ranked learning resources ({title, type, url}).
+    Lets skill_gap_analysis skip the web search + LLM ranking for known skills.
+    """
+
+    def __init__(self, db_path: str = RESOURCE_CATALOG_DB, max_age_s: float = RESOURCE_CATALOG_MAX_AGE_S,
+                 pool: Optional[SQLitePool] = None):
+        self.pool = pool or SQLitePool(db_path)
+        self.max_age_s = max_age_s
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def lookup(self, skills: List[str]) -> Tuple[Dict[str, List[Dict[str, str]]], List[str]]:
+        """Split `skills` into (fresh catalog hits, unknown-or-stale skills)."""
+        if not skills:
+            return {}, []
+        keys = {skill: normalize_skill(skill) for skill in skills}
+        placeholders = ",".join("?" for _ in keys)
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT skill, resources, source, refreshed_at FROM skill_resource_catalog WHERE skill IN ({placeholders})",
+                list(set(keys.values())),
+            ).fetchall()
+        entries = {row[0]: row for row in rows}
+
+        now = time.time()
+        hits, misses = {}, []
+        for skill, key in keys.items():
+            row = entries.get(key)
+            if row and (row[2] == SOURCE_IMPORT or now - row[3] <= self.max_age_s):
+                hits[skill] = json.loads(row[1])
+            else:
+                misses.append(skill)
+        with self._lock:
+            self.stats["hits"] += len(hits)
+            self.stats["misses"] += len(misses)
+        return hits, misses
+
+    def upsert_many(self, resources_by_skill: Dict[str, List[Dict[str, str]]], source: str) -> int:
+        now = time.time()
+        rows = [
+            (normalize_skill(skill), json.dumps(resources), source, now)
+            for skill, resources in resources_by_skill.items()
+        ]
+        with self.pool.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO skill_resource_catalog (skill, resources, source, refreshed_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def import_entries(self, resources_by_skill: Dict[str, List[Dict[str, str]]]) -> int:
+        """Admin import path: curated entries that take precedence and never go stale."""
+        return self.upsert_many(resources_by_skill, SOURCE_IMPORT)
+
+    def list_entries(self) -> List[Dict]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT skill, resources, source, refreshed_at FROM skill_resource_catalog ORDER BY skill"
+            ).fetchall()
+        return [
+            {"skill": r[0], "resources": json.loads(r[1]), "source": r[2], "refreshed_at": r[3]}
+            for r in rows
+        ]
+
+
+# Process-wide catalog shared by the skill-gap node and the admin endpoints. It lives in
+# the JD database by default, and then shares that database's pool (and write lock).
+resource_catalog = ResourceCatalog(
+    pool=jd_store.pool if os.path.abspath(RESOURCE_CATALOG_DB) == os.path.abspath(JD_DB_PATH) else None
+)
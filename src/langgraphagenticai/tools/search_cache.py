@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+SEARCH_CACHE_DB = os.getenv("SEARCH_CACHE_DB", "./search_cache.db")
+SEARCH_CACHE_TTL_S = float(os.getenv("SEARCH_CACHE_TTL_S", str(7 * 24 * 3600)))
+# After the TTL an entry is still served for this long while it is refreshed in the background.
+SEARCH_CACHE_STALE_S = float(os.getenv("SEARCH_CACHE_STALE_S", str(30 * 24 * 3600)))
+SEARCH_CACHE_MEMORY_ITEMS = int(os.getenv("SEARCH_CACHE_MEMORY_ITEMS", "512"))
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(str(query).lower().split())
+
+
+def cache_key(query: str, params: Dict) -> str:
+    payload = json.dumps({"query": normalize_query(query), **params}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    Two-tier cache for search results: an in-memory LRU in front of a SQLite table.
+
+    Entries younger than `ttl_s` are served directly. Entries past the TTL but inside
+    the stale window are served immediately and refreshed in a background thread
+    (stale-while-revalidate). Anything older is fetched synchronously.
+    """
+
+    def __init__(self, db_path: str = SEARCH_CACHE_DB, ttl_s: float = SEARCH_CACHE_TTL_S,
+                 stale_s: float = SEARCH_CACHE_STALE_S, max_items: int = SEARCH_CACHE_MEMORY_ITEMS):
+        self.db_path = db_path
+        self.ttl_s = ttl_s
+        self.stale_s = stale_s
+        self.max_items = max_items
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._refreshing = set()
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+
+    # ---------------- storage ---------------- #
+    def _db(self) -> sqlite3.Connection:
+        # Called with self._lock held.
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return (value, created_at) from memory or SQLite, or None."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+            row = self._db().execute(
+                "SELECT value, created_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0], row[1])
+            return row[0], row[1]
+
+    def set(self, key: str, query: str, value: str) -> None:
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, value, created_at)
+            self._db().execute(
+                "INSERT OR REPLACE INTO search_cache (key, query, value, created_at) VALUES (?, ?, ?, ?)",
+                (key, normalize_query(query), value, created_at),
+            )
+            self._db().commit()
+
+    # ---------------- read-through ---------------- #
+    def _refresh(self, key: str, query: str, fetch: Callable[[], str]) -> None:
+        try:
+            self.set(key, query, fetch())
+            self.stats["refreshes"] += 1
+        except Exception as e:
+            print(f"⚠️ Background search refresh failed for '{query}': {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def lookup(self, query: str, params: Dict, refresh: Callable[[], str]) -> Tuple[str, Optional[str]]:
+        """
+        Return (key, cached value or None). Stale entries are returned as-is and
+        refreshed in the background with `refresh`.
+        """
+        key = cache_key(query, params)
+        entry = self.get(key)
+        if entry is not None:
+            value, created_at = entry
+            age = time.time() - created_at
+            if age <= self.ttl_s:
+                self.stats["hits"] += 1
+                return key, value
+            if age <= self.ttl_s + self.stale_s:
+                self.stats["stale_hits"] += 1
+                with self._lock:
+                    start_refresh = key not in self._refreshing
+                    self._refreshing.add(key)
+                if start_refresh:
+                    threading.Thread(target=self._refresh, args=(key, query, refresh), daemon=True).start()
+                return key, value
+
+        self.stats["misses"] += 1
+        return key, None
+
+    def get_or_fetch(self, query: str, params: Dict, fetch: Callable[[], str]) -> str:
+        key, value = self.lookup(query, params, fetch)
+        if value is None:
+            value = fetch()
+            self.set(key, query, value)
+        return value
+
+    async def aget_or_fetch(self, query: str, params: Dict, afetch: Callable[[], Awaitable[str]],
+                            refresh: Callable[[], str]) -> str:
+        """Async read-through; background refreshes use the sync `refresh` (they outlive the event loop)."""
+        key, value = self.lookup(query, params, refresh)
+        if value is None:
+            value = await afetch()
+            self.set(key, query, value)
+        return value
+
+
+# Process-wide cache shared by WebSearchTool and InterviewWebSearchTool.
+search_cache = SearchCache()
@@ -1,12 +1,31 @@
 import os
-from typing import Optional, Type
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Type
+import httpx
 from pydantic import BaseModel, Field
 from langchain.tools import BaseTool
 from dotenv import load_dotenv
-from tavily import TavilyClient  # Import the Tavily client
+
+from src.langgraphagenticai.backends.search import search_backend, SEARCH_TIMEOUT
+from src.langgraphagenticai.backends.fixtures import FixtureMissingError
+from src.langgraphagenticai.tools.search_cache import search_cache, cache_key
+from src.langgraphagenticai.utils.singleflight import SingleFlight
+from src.langgraphagenticai.utils.metrics import SEARCH_SECONDS
+from src.langgraphagenticai.utils.tracing import tracer
 
 load_dotenv()  # Load environment variables
 
+# Search parameters sent to Tavily; part of the cache key.
+DEFAULT_SEARCH_PARAMS = {"search_depth": "basic", "max_results": 3, "include_answer": False}
+
+# Max concurrent Tavily requests per fan-out.
+SEARCH_CONCURRENCY = int(os.getenv("SEARCH_CONCURRENCY", "8"))
+
+# Identical searches in flight at the same time (e.g. many candidates hitting the
+# same JD) share one Tavily request.
+search_flight = SingleFlight("web_search")
+
 class WebSearchToolInput(BaseModel):
     """Input schema for the WebSearchTool."""
     query: str = Field(description="The search query to perform.")
@@ -14,45 +33,110 @@ class WebSearchToolInput(BaseModel):
 class WebSearchTool(BaseTool):
     """
     A tool for performing a web search using the Tavily Search API.
+    Results are cached (memory LRU + SQLite, with TTL and stale-while-revalidate).
+    The search backend (live Tavily, record or replay) is chosen by SEARCH_BACKEND.
     """
     name: str = "web_search"
     description: str = "Use this tool to search the web for information."
     args_schema: Type[BaseModel] = WebSearchToolInput
-    
-    # Initialize the TavilyClient instance
-    _tavily_client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+    search_params: Dict = Field(default_factory=lambda: dict(DEFAULT_SEARCH_PARAMS))
+    use_cache: bool = True
+
+    @staticmethod
+    def format_results(search_results: Dict) -> str:
+        """Combine Tavily result snippets into the text block handed to the LLM."""
+        # The response is a dict — iterate over the "results" key
+        results = search_results.get("results", [])
+        if not results:
+            return "No search results found."
+
+        # Combine the snippets for LLM context
+        result_snippets = []
+        for result in results:
+            content = result.get("content", "")
+            url = result.get("url", "")
+            result_snippets.append(f"Content: {content}\nSource: {url}")
+
+        # Join results with separators
+        return "\n---\n".join(result_snippets)
+
+    def _search(self, query: str) -> str:
+        """Backend search; raises on API/network errors so failures are never cached."""
+        with SEARCH_SECONDS.time(tool=self.name, mode="sync"):
+            search_results = search_backend.search(query, self.search_params)
+        return self.format_results(search_results)
 
     def _run(self, query: str) -> str:
         """Perform a synchronous web search."""
+        with tracer.span(self.name, kind="search", query=query):
+            return self._run_cached(query)
+
+    def _run_cached(self, query: str) -> str:
         try:
-            # Perform the Tavily search
-            search_results = self._tavily_client.search(
-                query=query,
-                search_depth="basic",
-                max_results=3,
-                include_answer=False
-            )
+            key = cache_key(query, self.search_params)
+            fetch = lambda: search_flight.do(key, lambda: self._search(query))
+            if not self.use_cache or not search_backend.cacheable:
+                return fetch()
+            return search_cache.get_or_fetch(query, self.search_params, fetch)
 
-            # The response is a dict — iterate over the "results" key
-            results = search_results.get("results", [])
-            if not results:
-                return "No search results found."
+        except FixtureMissingError:
+            # A replay gap is a test setup error, not an empty search result.
+            raise
+        except Exception as e:
+            # Handle API key errors or network issues gracefully
+            return f"An error occurred during web search with Tavily: {e}"
+
+    async def _asearch(self, query: str, client: Optional[httpx.AsyncClient] = None) -> str:
+        """Async backend search (live Tavily goes over httpx, same request as TavilyClient.search)."""
+        with SEARCH_SECONDS.time(tool=self.name, mode="async"):
+            search_results = await search_backend.asearch(query, self.search_params, client)
+        return self.format_results(search_results)
 
-            # Combine the snippets for LLM context
-            result_snippets = []
-            for result in results:
-                content = result.get("content", "")
-                url = result.get("url", "")
-                result_snippets.append(f"Content: {content}\nSource: {url}")
+    async def _arun(self, query: str, client: Optional[httpx.AsyncClient] = None) -> str:
+        """Perform an asynchronous web search (optionally on a shared httpx client)."""
+        with tracer.span(self.name, kind="search", query=query):
+            return await self._arun_cached(query, client)
 
-            # Join results with separators
-            result_string = "\n---\n".join(result_snippets)
-            return result_string
+    async def _arun_cached(self, query: str, client: Optional[httpx.AsyncClient] = None) -> str:
+        try:
+            key = cache_key(query, self.search_params)
+            afetch = lambda: search_flight.ado(key, lambda: self._asearch(query, client))
+            if not self.use_cache or not search_backend.cacheable:
+                return await afetch()
+            return await search_cache.aget_or_fetch(
+                query, self.search_params, afetch,
+                lambda: search_flight.do(key, lambda: self._search(query)),
+            )
 
+        except FixtureMissingError:
+            raise
         except Exception as e:
-            # Handle API key errors or network issues gracefully
             return f"An error occurred during web search with Tavily: {e}"
 
-    def _arun(self, query: str) -> str:
-        """Asynchronous version (not implemented)."""
-        raise NotImplementedError("Asynchronous version not implemented for this tool.")
+
+def run_searches(tool: WebSearchTool, queries: List[str], max_concurrency: int = SEARCH_CONCURRENCY) -> List[str]:
+    """
+    Run `queries` concurrently on `tool` (at most `max_concurrency` in flight, one
+    shared keep-alive client) and return the results in input order.
+
+    Safe to call from sync code: graph nodes may run on a thread that already has
+    an event loop (e.g. inline from an async endpoint), in which case the fan-out
+    runs on a helper thread with its own loop.
+    """
+    if not queries:
+        return []
+
+    async def gather() -> List[str]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with httpx.AsyncClient(timeout=SEARCH_TIMEOUT) as client:
+            async def search(query: str) -> str:
+                async with semaphore:
+                    return await tool._arun(query, client=client)
+            return await asyncio.gather(*(search(q) for q in queries))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(gather())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(tracer.propagate(asyncio.run), gather()).result()
@@ -0,0 +1,109 @@
+import os
+import time
+import shutil
+import asyncio
+import threading
+from typing import Dict, Tuple
+
+# AUDIO_PREPROCESS: auto (when ffmpeg is on PATH) | on | off
+AUDIO_PREPROCESS = os.getenv("AUDIO_PREPROCESS", "auto").lower()
+FFMPEG_BINARY = os.getenv("FFMPEG_BINARY", "ffmpeg")
+AUDIO_SAMPLE_RATE = int(os.getenv("AUDIO_SAMPLE_RATE", "16000"))
+AUDIO_BITRATE = os.getenv("AUDIO_BITRATE", "24k")
+AUDIO_SILENCE_THRESHOLD_DB = os.getenv("AUDIO_SILENCE_THRESHOLD_DB", "-45dB")
+AUDIO_PREPROCESS_TIMEOUT_S = float(os.getenv("AUDIO_PREPROCESS_TIMEOUT_S", "20"))
+
+# Trim leading silence, reverse, trim again (= trailing silence), reverse back.
+_TRIM = f"silenceremove=start_periods=1:start_duration=0.1:start_threshold={AUDIO_SILENCE_THRESHOLD_DB}"
+SILENCE_TRIM_FILTER = f"{_TRIM},areverse,{_TRIM},areverse"
+
+
+class AudioPreprocessor:
+    """
+    Downmixes an uploaded recording to 16 kHz mono, trims leading/trailing
+    silence and re-encodes it as low-bitrate Opus (what Whisper needs anyway),
+    piping through ffmpeg in memory. Falls back to the original bytes when
+    ffmpeg is unavailable, fails, or the result is not smaller.
+    """
+
+    def __init__(self, mode: str = AUDIO_PREPROCESS, ffmpeg: str = FFMPEG_BINARY):
+        self.ffmpeg = shutil.which(ffmpeg)
+        self.enabled = mode == "on" or (mode == "auto" and self.ffmpeg is not None)
+        if mode == "on" and self.ffmpeg is None:
+            print(f"⚠️ AUDIO_PREPROCESS=on but '{ffmpeg}' was not found; uploading audio as-is.")
+            self.enabled = False
+        self._lock = threading.Lock()
+        self._stats = {"processed": 0, "skipped": 0, "failed": 0, "bytes_in": 0, "bytes_out": 0, "elapsed_ms": 0.0}
+
+    def _command(self):
+        return [
+            self.ffmpeg, "-hide_banner", "-loglevel", "error", "-nostdin",
+            "-i", "pipe:0",
+            "-af", SILENCE_TRIM_FILTER,
+            "-ac", "1", "-ar", str(AUDIO_SAMPLE_RATE),
+            "-c:a", "libopus", "-b:a", AUDIO_BITRATE, "-application", "voip",
+            "-f", "ogg", "pipe:1",
+        ]
+
+    async def _encode(self, content: bytes) -> bytes:
+        proc = await asyncio.create_subprocess_exec(
+            *self._command(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(content), timeout=AUDIO_PREPROCESS_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise RuntimeError(f"ffmpeg timed out after {AUDIO_PREPROCESS_TIMEOUT_S}s")
+        if proc.returncode != 0:
+            raise RuntimeError(err.decode(errors="replace").strip()[-300:] or f"ffmpeg exited with {proc.returncode}")
+        return out
+
+    async def process(self, content: bytes, filename: str) -> Tuple[bytes, str, Dict]:
+        """Returns (audio bytes, filename, report) — the original upload if preprocessing did not help."""
+        report = {"applied": False, "bytes_in": len(content), "bytes_out": len(content), "bytes_saved": 0, "elapsed_ms": 0.0}
+        if not self.enabled or not content:
+            self._record("skipped", report)
+            return content, filename, report
+
+        start = time.perf_counter()
+        try:
+            encoded = await self._encode(content)
+        except Exception as e:
+            report["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            report["error"] = str(e)
+            print(f"⚠️ Audio preprocessing failed, uploading original: {e}")
+            self._record("failed", report)
+            return content, filename, report
+
+        report["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        # Fully-silent clips trim to nothing; keep the original so Whisper still sees the upload.
+        if not encoded or len(encoded) >= len(content):
+            self._record("skipped", report)
+            return content, filename, report
+
+        report.update(applied=True, bytes_out=len(encoded), bytes_saved=len(content) - len(encoded))
+        self._record("processed", report)
+        return encoded, f"{os.path.splitext(filename)[0] or 'answer'}.ogg", report
+
+    def _record(self, outcome: str, report: Dict) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats["bytes_in"] += report["bytes_in"]
+            self._stats["bytes_out"] += report["bytes_out"]
+            self._stats["elapsed_ms"] += report["elapsed_ms"]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["enabled"] = self.enabled
+        stats["bytes_saved"] = stats["bytes_in"] - stats["bytes_out"]
+        stats["elapsed_ms"] = round(stats["elapsed_ms"], 1)
+        return stats
+
+
+# Process-wide preprocessor used by /transcribe-groq.
+audio_preprocessor = AudioPreprocessor()
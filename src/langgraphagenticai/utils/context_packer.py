@@ -0,0 +1,174 @@
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+
+
+# Separator used by WebSearchTool between result snippets.
+SNIPPET_SEPARATOR = "\n---\n"
+
+# Search tool outputs that carry no context and should never reach a prompt.
+EMPTY_RESULT_PREFIXES = ("No search results found", "An error occurred during web search")
+
+DEFAULT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "1000"))
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 chars per token for English BPE vocabularies)."""
+    if not text:
+        return 0
+    return max(1, (len(text) + 3) // 4)
+
+
+def _terms(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9+#.]+", text.lower())
+
+
+def _normalize(sentence: str) -> str:
+    return " ".join(_terms(sentence))
+
+
+def split_snippets(search_output: str) -> List[str]:
+    """Split raw WebSearchTool output into content snippets, dropping `Source:` boilerplate."""
+    if not search_output or str(search_output).startswith(EMPTY_RESULT_PREFIXES):
+        return []
+    snippets = []
+    for block in str(search_output).split(SNIPPET_SEPARATOR):
+        lines = [line for line in block.strip().splitlines() if not line.startswith("Source:")]
+        content = " ".join(lines).strip()
+        if content.startswith("Content:"):
+            content = content[len("Content:"):].strip()
+        content = re.sub(r"\s+", " ", content)
+        if content:
+            snippets.append(content)
+    return snippets
+
+
+class PackedContext(BaseModel):
+    text: str = ""
+    token_budget: int = 0
+    tokens_used: int = 0
+    raw_tokens: int = 0
+    tokens_per_skill: Dict[str, int] = Field(default_factory=dict)
+    duplicates_removed: int = 0
+
+    def report(self) -> Dict:
+        return self.model_dump(exclude={"text"})
+
+
+class ContextPacker:
+    """
+    Packs per-skill search results into a single prompt context under a token budget.
+
+    - dedupes repeated sentences across all skills (search engines return the same
+      boilerplate/intro text for related queries)
+    - ranks each skill's snippets by lexical relevance to the skill and intent terms
+    - splits the budget fairly across skills (water-filling), so skills at the end of
+      `jd_skills` are never silently dropped
+    """
+
+    def __init__(self, token_budget: Optional[int] = None):
+        self.token_budget = token_budget or DEFAULT_TOKEN_BUDGET
+
+    # ---------------- ranking ---------------- #
+    def _score(self, snippet: str, skill: str, intent_terms: List[str]) -> float:
+        terms = _terms(snippet)
+        if not terms:
+            return 0.0
+        skill_terms = set(_terms(skill))
+        skill_hits = sum(1 for t in terms if t in skill_terms)
+        intent_hits = sum(1 for t in terms if t in intent_terms)
+        # Favour dense, on-topic snippets over long ones that mention the skill once.
+        return (2.0 * skill_hits + intent_hits) / (len(terms) ** 0.5)
+
+    def _dedupe(self, snippet: str, seen: set) -> Tuple[str, int]:
+        kept, removed = [], 0
+        for sentence in re.split(r"(?<=[.!?])\s+", snippet):
+            key = _normalize(sentence)
+            if not key:
+                continue
+            if key in seen:
+                removed += 1
+                continue
+            seen.add(key)
+            kept.append(sentence)
+        return " ".join(kept), removed
+
+    # ---------------- budgeting ---------------- #
+    def _allocate(self, demand: Dict[str, int], budget: int) -> Dict[str, int]:
+        """Fair share: skills needing less than their share donate the rest to the others."""
+        allocation = {skill: 0 for skill in demand}
+        pending = {skill: need for skill, need in demand.items() if need > 0}
+        remaining = budget
+        while pending and remaining > 0:
+            share = max(1, remaining // len(pending))
+            for skill in sorted(pending, key=pending.get):
+                grant = min(share, pending[skill], remaining)
+                allocation[skill] += grant
+                pending[skill] -= grant
+                remaining -= grant
+                if pending[skill] <= 0:
+                    del pending[skill]
+                if remaining <= 0:
+                    break
+        return allocation
+
+    @staticmethod
+    def _truncate(text: str, max_tokens: int) -> str:
+        max_chars = max_tokens * 4
+        if len(text) <= max_chars:
+            return text
+        cut = text[:max_chars]
+        boundary = max(cut.rfind(". "), cut.rfind(" "))
+        return (cut[:boundary] if boundary > 0 else cut).rstrip(" .,") + "..."
+
+    # ---------------- public API ---------------- #
+    def pack(self, results: Dict[str, str], intent: str = "") -> PackedContext:
+        """
+        `results` maps skill -> raw search output. Returns the packed prompt text
+        together with the token accounting for it.
+        """
+        intent_terms = _terms(intent)
+        seen, duplicates, raw_tokens = set(), 0, 0
+        ranked: Dict[str, List[str]] = {}
+
+        for skill, output in results.items():
+            raw_tokens += estimate_tokens(str(output or ""))
+            snippets = split_snippets(output)
+            snippets.sort(key=lambda s: self._score(s, skill, intent_terms), reverse=True)
+            unique = []
+            for snippet in snippets:
+                text, removed = self._dedupe(snippet, seen)
+                duplicates += removed
+                if text:
+                    unique.append(text)
+            ranked[skill] = unique
+
+        header_tokens = {skill: estimate_tokens(f"### {skill}\n") for skill in ranked}
+        demand = {skill: sum(estimate_tokens(s) for s in snippets) for skill, snippets in ranked.items()}
+        allocation = self._allocate(demand, self.token_budget - sum(header_tokens.values()))
+
+        sections, per_skill = [], {}
+        for skill, snippets in ranked.items():
+            left = allocation.get(skill, 0)
+            picked = []
+            for snippet in snippets:
+                if left <= 0:
+                    break
+                piece = self._truncate(snippet, left)
+                picked.append(piece)
+                left -= estimate_tokens(piece)
+            if picked:
+                section = f"### {skill}\n" + "\n".join(picked)
+                sections.append(section)
+                per_skill[skill] = estimate_tokens(section)
+
+        text = "\n".join(sections)
+        return PackedContext(
+            text=text,
+            token_budget=self.token_budget,
+            tokens_used=estimate_tokens(text),
+            raw_tokens=raw_tokens,
+            tokens_per_skill=per_skill,
+            duplicates_removed=duplicates,
+        )
@@ -0,0 +1,53 @@
+import json
+import re
+from typing import Any
+
+from langchain_core.exceptions import OutputParserException
+
+
+# strict=False lets raw newlines/tabs inside strings through, which LLMs emit often.
+_DECODER = json.JSONDecoder(strict=False)
+
+_THINK_CLOSE = "</think>"
+_TRAILING_COMMA = re.compile(r",\s*([\]}])")
+
+
+def _payload_start(text: str) -> int:
+    """Index of the first JSON value after any reasoning block, or -1."""
+    start = 0
+    think_end = text.rfind(_THINK_CLOSE)
+    if think_end != -1:
+        start = think_end + len(_THINK_CLOSE)
+    obj, arr = text.find("{", start), text.find("[", start)
+    if obj == -1 or arr == -1:
+        return max(obj, arr)
+    return min(obj, arr)
+
+
+def extract_json(response: Any) -> Any:
+    """
+    Extract the JSON payload from an LLM response in a single linear pass.
+
+    Skips a leading `<think>...</think>` block and any prose / code fences before
+    the first `{` or `[`, then decodes exactly one JSON value with `raw_decode`
+    (trailing text such as a closing fence is ignored). Only when that decode
+    fails is a trailing-comma repair attempted once.
+    """
+    if isinstance(response, (dict, list)):
+        return response
+
+    text = str(response)
+    start = _payload_start(text)
+    if start == -1:
+        raise OutputParserException("No JSON object or array found in response.")
+
+    try:
+        obj, _ = _DECODER.raw_decode(text, start)
+        return obj
+    except json.JSONDecodeError as first_error:
+        repaired = _TRAILING_COMMA.sub(r"\1", text[start:])
+        try:
+            obj, _ = _DECODER.raw_decode(repaired)
+            return obj
+        except json.JSONDecodeError:
+            raise OutputParserException(f"Could not decode JSON: {first_error}")
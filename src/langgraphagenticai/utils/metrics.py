@@ -0,0 +1,183 @@
+import math
+import time
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Seconds; spans cache hits (ms) up to slow LLM generations (minutes).
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (labels, value) samples of one metric family, produced at scrape time.
+Sample = Tuple[Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels, in the Prometheus data model."""
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # [per-bucket counts..., +Inf count, sum]
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def timed(self, **labels) -> Callable:
+        """Decorator form of `time` for plain functions and methods."""
+        def decorate(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.time(**labels):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+        for key, values in sorted(series.items()):
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), values):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_labels({**labels, 'le': _number(bound)})} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(labels)} {_number(values[-1])}")
+            lines.append(f"{self.name}_count{_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Histograms observed in-process, plus collectors: callables that read existing
+    stats() counters (caches, queues) at scrape time and return
+    [(name, type, description, samples)], so those modules need no metrics code of their own.
+    """
+
+    def __init__(self):
+        self._histograms: Dict[str, Histogram] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]] = []
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, description: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, description, labelnames, buckets)
+            return self._histograms[name]
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            histograms, collectors = list(self._histograms.values()), list(self._collectors)
+        lines: List[str] = []
+        for histogram in histograms:
+            lines.extend(histogram.render())
+        for collector in collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                # One failing source must not take the whole scrape down.
+                print(f"⚠️ Metrics collector {getattr(collector, '__name__', collector)} failed: {e}")
+                continue
+            for name, kind, description, samples in families:
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(f"{name}{_labels(labels)} {_number(value)}" for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+def cache_families(caches: Dict[str, Dict[str, float]]) -> List[Tuple[str, str, str, List[Sample]]]:
+    """Hit/miss counters and hit ratio per cache, from {cache: {"hits": n, "misses": n}}."""
+    hits = [({"cache": name}, stats.get("hits", 0)) for name, stats in caches.items()]
+    misses = [({"cache": name}, stats.get("misses", 0)) for name, stats in caches.items()]
+    ratios = []
+    for name, stats in caches.items():
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        ratios.append(({"cache": name}, stats.get("hits", 0) / lookups if lookups else 0.0))
+    return [
+        ("talentfit_cache_hits_total", "counter", "Cache lookups served from cache.", hits),
+        ("talentfit_cache_misses_total", "counter", "Cache lookups that had to compute or fetch.", misses),
+        ("talentfit_cache_hit_ratio", "gauge", "Hits / lookups since process start.", ratios),
+    ]
+
+
+# Process-wide registry rendered by GET /metrics.
+metrics = MetricsRegistry()
+
+NODE_SECONDS = metrics.histogram(
+    "talentfit_node_duration_seconds", "WebSearchChatbotNode method latency.", ["node"])
+LLM_SECONDS = metrics.histogram(
+    "talentfit_llm_request_duration_seconds", "Provider call latency per attempt, excluding pool queue wait.",
+    ["model", "mode"])
+LLM_TOKENS = metrics.histogram(
+    "talentfit_llm_tokens", "Tokens per LLM call.", ["model", "type"], buckets=TOKEN_BUCKETS)
+SEARCH_SECONDS = metrics.histogram(
+    "talentfit_search_duration_seconds", "Search backend (Tavily) call latency, cache misses only.", ["tool", "mode"])
+EMBEDDING_SECONDS = metrics.histogram(
+    "talentfit_embedding_encode_duration_seconds", "Sentence-transformer encode latency.", ["call"])
+PDF_PARSE_SECONDS = metrics.histogram(
+    "talentfit_pdf_parse_duration_seconds", "Resume PDF text extraction latency.")
+
+
+def observe_token_usage(model: str, usage: Optional[Dict]) -> Dict[str, int]:
+    """
+    Record prompt/completion tokens from a provider usage dict (OpenAI or LangChain
+    key names) and return the normalised counts.
+    """
+    if not usage:
+        return {}
+    tokens = {
+        "prompt_tokens": usage.get("prompt_tokens", usage.get("input_tokens")),
+        "completion_tokens": usage.get("completion_tokens", usage.get("output_tokens")),
+    }
+    tokens = {k: v for k, v in tokens.items() if v is not None}
+    for key, value in tokens.items():
+        LLM_TOKENS.observe(value, model=model, type=key.split("_")[0])
+    return tokens
@@ -0,0 +1,76 @@
+import copy
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+# name -> SingleFlight, so every group's counters can be reported together.
+FLIGHT_GROUPS: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    The first caller (leader) runs the function; callers arriving while it is in
+    flight wait for and share its result (or exception). Followers receive a deep
+    copy so callers can't mutate each other's results. Works across threads and
+    across event loops: the shared slot is a concurrent.futures.Future.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "executions": 0, "coalesced": 0}
+        FLIGHT_GROUPS[name] = self
+
+    def _join(self, key: str):
+        with self._lock:
+            self.stats["calls"] += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            self.stats["executions"] += 1
+            return future, True
+
+    def _finish(self, key: str) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        future, leader = self._join(key)
+        if not leader:
+            return copy.deepcopy(future.result())
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._finish(key)
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        future, leader = self._join(key)
+        if not leader:
+            return copy.deepcopy(await asyncio.wrap_future(future))
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._finish(key)
+
+
+def singleflight_stats() -> Dict[str, Dict[str, int]]:
+    return {name: dict(group.stats) for name, group in FLIGHT_GROUPS.items()}
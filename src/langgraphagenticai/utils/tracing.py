@@ -0,0 +1,182 @@
+import os
+import time
+import uuid
+import functools
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+TRACING_ENABLED = os.getenv("TRACING", "on").lower() not in ("0", "off", "false")
+# Finished spans kept in memory; the oldest are dropped first.
+TRACE_MAX_SPANS = int(os.getenv("TRACE_MAX_SPANS", "50000"))
+WATERFALL_WIDTH = 60
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent", "name", "kind", "thread_id", "attributes", "start", "end", "error")
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"], thread_id: Optional[str], attributes: Dict):
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex[:16]
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.name = name
+        self.kind = kind
+        self.thread_id = thread_id or (parent.thread_id if parent else None)
+        self.attributes = attributes
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def tag_thread(self, thread_id: str) -> None:
+        """Tag this span and any untagged ancestors (e.g. the HTTP request that only learns it from the body)."""
+        span = self
+        while span is not None and span.thread_id is None:
+            span.thread_id = thread_id
+            span = span.parent
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "name": self.name,
+            "kind": self.kind,
+            "thread_id": self.thread_id,
+            "attributes": self.attributes,
+            "start": self.start,
+            "duration_ms": round(((self.end or time.time()) - self.start) * 1000, 2),
+            "error": self.error,
+        }
+
+
+class Tracer:
+    """
+    Nested spans (endpoint -> graph node -> search / LLM / DB) tracked through a
+    contextvar, so nesting follows async tasks and any thread started via
+    `propagate`. Finished spans go into a bounded ring buffer and are looked up
+    by thread_id: a session's trace is every trace that touched that thread.
+    """
+
+    def __init__(self, max_spans: int = TRACE_MAX_SPANS, enabled: bool = TRACING_ENABLED):
+        self.enabled = enabled
+        self._spans: deque = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", thread_id: Optional[str] = None,
+             nested_only: bool = False, **attributes) -> Iterator[Optional[Span]]:
+        """Open a span under the current one. With `nested_only`, nothing is recorded outside a trace."""
+        if not self.enabled or (nested_only and _current_span.get() is None):
+            yield None
+            return
+        span = Span(name, kind, _current_span.get(), thread_id, attributes)
+        if thread_id:
+            span.tag_thread(thread_id)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"[:300]
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end = time.time()
+            with self._lock:
+                self._spans.append(span)
+
+    def traced(self, name: str, kind: str = "internal") -> Callable:
+        """Decorator form of `span` for plain functions and methods."""
+        def decorate(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name, kind):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    @staticmethod
+    def annotate(**attributes) -> None:
+        """Add attributes to the innermost open span, if any."""
+        span = _current_span.get()
+        if span is not None:
+            span.attributes.update(attributes)
+
+    @staticmethod
+    def tag_thread(thread_id: str) -> None:
+        span = _current_span.get()
+        if span is not None and thread_id:
+            span.tag_thread(thread_id)
+
+    @staticmethod
+    def propagate(fn: Callable) -> Callable:
+        """Bind `fn` to the caller's context, so spans it opens on a pool thread nest under the caller's span."""
+        context = contextvars.copy_context()
+        return functools.wraps(fn)(lambda *args, **kwargs: context.run(fn, *args, **kwargs))
+
+    def session(self, thread_id: str) -> List[Dict[str, Any]]:
+        """Every trace that touched `thread_id`, oldest first, each as a waterfall of spans."""
+        with self._lock:
+            spans = list(self._spans)
+        trace_ids = {s.trace_id for s in spans if s.thread_id == thread_id}
+        traces: Dict[str, List[Span]] = {}
+        for span in spans:
+            if span.trace_id in trace_ids:
+                traces.setdefault(span.trace_id, []).append(span)
+        return sorted((waterfall(members) for members in traces.values()), key=lambda t: t["start"])
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"enabled": self.enabled, "spans": len(self._spans), "max_spans": self._spans.maxlen}
+
+
+def waterfall(spans: List[Span]) -> Dict[str, Any]:
+    """
+    One trace laid out for reading top to bottom: spans in start order with
+    depth, offset from the trace start, and duration. A span whose parent was
+    evicted from the buffer is shown at depth 0.
+    """
+    by_id = {s.span_id: s for s in spans}
+    start = min(s.start for s in spans)
+    end = max(s.end or s.start for s in spans)
+
+    def depth(span: Span) -> int:
+        d = 0
+        while span.parent is not None and span.parent.span_id in by_id:
+            span, d = span.parent, d + 1
+        return d
+
+    rows = []
+    for span in sorted(spans, key=lambda s: (s.start, depth(s))):
+        row = span.to_dict()
+        row["depth"] = depth(span)
+        row["offset_ms"] = round((span.start - start) * 1000, 2)
+        rows.append(row)
+    roots = [r for r in rows if r["depth"] == 0]
+    return {
+        "trace_id": spans[0].trace_id,
+        "name": roots[0]["name"] if roots else rows[0]["name"],
+        "start": start,
+        "duration_ms": round((end - start) * 1000, 2),
+        "spans": rows,
+    }
+
+
+def render_waterfall(trace: Dict[str, Any], width: int = WATERFALL_WIDTH) -> str:
+    """Plain-text bars, one line per span, scaled to the trace duration."""
+    total = trace["duration_ms"] or 1.0
+    lines = [f"trace {trace['trace_id']}  {trace['name']}  {trace['duration_ms']:.1f} ms"]
+    for span in trace["spans"]:
+        offset = int(span["offset_ms"] / total * width)
+        length = max(1, int(span["duration_ms"] / total * width))
+        label = ("  " * span["depth"] + f"{span['kind']}:{span['name']}")[:48]
+        flag = "  ❌ " + span["error"] if span["error"] else ""
+        lines.append(f"{label:<48} |{' ' * offset}{'█' * length:<{width - offset}}| {span['duration_ms']:>9.1f} ms{flag}")
+    return "\n".join(lines)
+
+
+# Process-wide tracer used by the API, graph, tools, LLM wrapper and stores.
+tracer = Tracer()
@@ -0,0 +1,15 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# The stores open their SQLite files at import time; keep them out of the working tree.
+_DB_DIR = tempfile.mkdtemp(prefix="talentfit-tests-")
+for _var, _name in (("JD_DB_PATH", "jds.db"), ("RESOURCE_CATALOG_DB", "jds.db"),
+                    ("JOB_QUEUE_DB", "jobs.db"), ("SEARCH_CACHE_DB", "search_cache.db")):
+    os.environ.setdefault(_var, os.path.join(_DB_DIR, _name))
+# Clients are built at import time; tests never reach the providers.
+os.environ.setdefault("GROQ_API_KEY", "test-key")
+os.environ.setdefault("TAVILY_API_KEY", "test-key")
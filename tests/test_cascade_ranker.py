@@ -0,0 +1,129 @@
+import random
+import hashlib
+from collections import Counter
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+# The ranker scores with the match node's helpers, which need the node's model stack.
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("nltk")
+pytest.importorskip("pypdf")
+
+from src.langgraphagenticai.nodes import cascade_ranker
+from src.langgraphagenticai.nodes.cascade_ranker import shared_term_bound, cascade_rank, _TOKEN
+from src.langgraphagenticai.nodes.nodes import clean_text, extract_skills, combine_match_score, MATCH_SCORING_CONFIG
+from src.langgraphagenticai.database.match_store import match_store
+from src.langgraphagenticai.state.state import CandidateState
+
+VOCAB = [f"word{i}" for i in range(60)] + ["python", "fastapi", "docker", "aws", "sql", "react", "java", "kubernetes"]
+
+
+def _doc(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(VOCAB) for _ in range(n))
+
+
+def _tfidf_cosine(a: str, b: str) -> float:
+    matrix = TfidfVectorizer().fit_transform([a, b])
+    return float(cosine_similarity(matrix[0:1], matrix[1:2])[0][0])
+
+
+def _embed(text: str) -> np.ndarray:
+    """Deterministic stand-in for the sentence-transformer: one vector per text."""
+    seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=4).digest(), "little")
+    return np.random.default_rng(seed).normal(size=16).astype(np.float32)
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+class ScoringNode:
+    """
+    jd_upload + match_resume_with_jd with the real TF-IDF cosine and skill overlap,
+    and the embedding cosine from `_embed`, so bounds can be checked against full scores.
+    """
+
+    def jd_upload(self, state: CandidateState) -> CandidateState:
+        state.jd_clean = clean_text(state.jd_text)
+        state.jd_skills = extract_skills(state.jd_text)
+        return state
+
+    def match_resume_with_jd(self, state: CandidateState) -> CandidateState:
+        state.match_score = full_score(state.resume_clean, state.candidate_skills, state.jd_text)
+        return state
+
+
+def vector_scores(resume_clean: str, jd_clean: str) -> dict:
+    return {
+        "embedding_score": _cosine(_embed(resume_clean), _embed(jd_clean)),
+        "tfidf_score": _tfidf_cosine(resume_clean, jd_clean),
+        "bow_score": 0.0,
+    }
+
+
+def full_score(resume_clean: str, candidate_skills, jd_text: str) -> float:
+    jd_clean, jd_skills = clean_text(jd_text), extract_skills(jd_text)
+    return combine_match_score({
+        **vector_scores(resume_clean, jd_clean),
+        "skill_overlap": len(set(candidate_skills) & set(jd_skills)) / max(len(jd_skills), 1),
+    })
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_shared_term_bound_dominates_tfidf_cosine(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        a, b = _doc(rng, rng.randint(5, 200)), _doc(rng, rng.randint(5, 200))
+        bound = shared_term_bound(Counter(_TOKEN.findall(a)), Counter(_TOKEN.findall(b)))
+        assert bound >= _tfidf_cosine(a, b) - 1e-9
+
+
+def test_shared_term_bound_edge_cases():
+    assert shared_term_bound(Counter(), Counter({"python": 1})) == 0.0
+    assert shared_term_bound(Counter({"python": 1}), Counter({"java": 2})) == 0.0
+    assert shared_term_bound(Counter({"python": 2, "sql": 1}), Counter({"python": 2, "sql": 1})) == pytest.approx(1.0)
+
+
+@pytest.fixture
+def scoring(monkeypatch):
+    monkeypatch.setattr(cascade_ranker, "get_embedding", lambda text: _embed(text)[None, :])
+    return ScoringNode()
+
+
+@pytest.mark.parametrize("seed, keep, cached", [(0, 1, False), (1, 1, False), (2, 3, False), (3, 5, False),
+                                                (4, 1, True), (5, 3, True)])
+def test_pruned_jds_never_beat_the_top_k(scoring, seed, keep, cached):
+    rng = random.Random(seed)
+    resume_clean = clean_text(_doc(rng, 150))
+    state = CandidateState(resume_clean=resume_clean, candidate_skills=extract_skills(resume_clean))
+    jds = [{"id": 1000 * seed + i, "text": _doc(rng, rng.randint(20, 200))} for i in range(40)]
+    # Stored embeddings make the embedding term of the bound exact, so pruning kicks in.
+    features = {
+        jd["id"]: {
+            "clean_text": clean_text(jd["text"]),
+            "skills": extract_skills(jd["text"]),
+            "embedding": _embed(clean_text(jd["text"])).tobytes(),
+        }
+        for jd in jds
+    }
+    if cached:
+        # Every other JD has vector scores in match_store (skill overlap is always recomputed).
+        for jd in jds[::2]:
+            jd_clean = clean_text(jd["text"])
+            key = match_store.key(resume_clean, jd["id"], jd_clean, MATCH_SCORING_CONFIG)
+            match_store.put(key, vector_scores(resume_clean, jd_clean))
+
+    best, report = cascade_rank(scoring, state, jds, features, {}, keep=keep)
+
+    scores = {jd["id"]: full_score(resume_clean, state.candidate_skills, jd["text"]) for jd in jds}
+    returned = [jd["id"] for _, jd, _ in best]
+    assert len(best) == keep
+    assert [score for score, _, _ in best] == [scores[i] for i in returned]
+    assert sorted(scores.values(), reverse=True)[:keep] == [score for score, _, _ in best]
+    assert all(scores[i] <= best[-1][0] for i in scores if i not in returned)
+    assert report["stage2"]["fully_scored"] + report["stage2"]["pruned"] == len(jds)
+    assert report["stage2"]["pruned"] > 0
+    assert report["stage1"]["cached_scores"] == (len(jds[::2]) if cached else 0)
@@ -0,0 +1,140 @@
+import time
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from src.langgraphagenticai.LLMS import client_pool as cp
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    # Effectively no rate limit and fast backoff unless a test says otherwise.
+    monkeypatch.setattr(cp, "REQUESTS_PER_MINUTE", 600000.0)
+    monkeypatch.setattr(cp, "RATE_BURST", 1000.0)
+    monkeypatch.setattr(cp, "BACKOFF_BASE_S", 0.001)
+    monkeypatch.setattr(cp, "MAX_CONCURRENCY_PER_MODEL", 2)
+    monkeypatch.setattr(cp, "MAX_CONCURRENCY", 3)
+    return cp.ClientPool()
+
+
+class ProviderError(Exception):
+    def __init__(self, status: int, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.response = type("Response", (), {"status_code": status, "headers": headers or {}})()
+
+
+def flaky(failures):
+    """A call that raises each error in `failures` in turn, then returns "ok"."""
+    failures = list(failures)
+
+    def call():
+        if failures:
+            raise failures.pop(0)
+        return "ok"
+    return call
+
+
+def test_token_bucket_paces_after_the_burst():
+    bucket = cp.TokenBucket(rate_per_s=50, capacity=2)
+    start = time.perf_counter()
+    for _ in range(5):
+        bucket.acquire()
+    # 2 from the burst, 3 more at 50/s
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_retries_transient_errors(pool):
+    errors = [ProviderError(503), httpx.ConnectError("reset"), ProviderError(429, {"retry-after-ms": "5"})]
+    assert pool.execute("m", flaky(errors)) == "ok"
+    stats = pool.stats()["m"]
+    assert (stats["requests"], stats["retries"], stats["errors"], stats["rate_limited"]) == (4, 3, 3, 1)
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.parametrize("error", [ValueError("bug"), ProviderError(400), ProviderError(429, {"retry-after": "3600"})])
+def test_raises_what_retrying_cannot_fix(pool, error):
+    with pytest.raises(type(error)):
+        pool.execute("m", flaky([error]))
+    stats = pool.stats()["m"]
+    assert (stats["requests"], stats["retries"], stats["in_flight"]) == (1, 0, 0)
+
+
+def test_gives_up_after_max_retries(pool, monkeypatch):
+    monkeypatch.setattr(cp, "MAX_RETRIES", 2)
+    with pytest.raises(ProviderError):
+        pool.execute("m", flaky([ProviderError(500)] * 5))
+    assert pool.stats()["m"]["requests"] == 3
+
+
+def _run_concurrently(pool, calls):
+    """Run (model, seconds) calls on threads; return the peak number in flight per model and overall."""
+    lock, active, peak = threading.Lock(), {}, {}
+
+    def call(model, seconds):
+        def body():
+            with lock:
+                active[model] = active.get(model, 0) + 1
+                active["*"] = active.get("*", 0) + 1
+                peak[model] = max(peak.get(model, 0), active[model])
+                peak["*"] = max(peak.get("*", 0), active["*"])
+            time.sleep(seconds)
+            with lock:
+                active[model] -= 1
+                active["*"] -= 1
+        pool.execute(model, body)
+
+    threads = [threading.Thread(target=call, args=c) for c in calls]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return peak
+
+
+def test_concurrency_limits(pool):
+    peak = _run_concurrently(pool, [("a", 0.02)] * 8 + [("b", 0.02)] * 8)
+    assert peak["a"] <= 2 and peak["b"] <= 2
+    assert peak["*"] <= 3
+
+
+def test_saturated_model_does_not_starve_others(pool):
+    # Six slow calls queue on model "a"; "b" must get a global slot right away.
+    hogs = [threading.Thread(target=pool.execute, args=("a", lambda: time.sleep(0.3))) for _ in range(6)]
+    for t in hogs:
+        t.start()
+    time.sleep(0.05)
+    start = time.perf_counter()
+    pool.execute("b", lambda: None)
+    assert time.perf_counter() - start < 0.2
+    for t in hogs:
+        t.join()
+
+
+def test_cancelled_async_waiter_does_not_leak_its_slot(pool):
+    async def scenario():
+        # Hold both of model m's slots, so the next caller waits inside _acquire.
+        pool._acquire("m")
+        pool._acquire("m")
+
+        async def request():
+            return "done"
+
+        waiter = asyncio.create_task(pool.aexecute("m", request))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # The abandoned worker thread acquires once a slot frees up, and must hand it back.
+        pool._release("m")
+        pool._release("m")
+        results = await asyncio.wait_for(
+            asyncio.gather(*(pool.aexecute("m", request) for _ in range(4))), timeout=2
+        )
+        assert results == ["done"] * 4
+        await asyncio.sleep(0.05)
+        assert pool.stats()["m"]["in_flight"] == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,81 @@
+from langgraph.graph import StateGraph, START, END
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Overwrite
+
+from src.langgraphagenticai.graph.fast_path import DirectRunner
+from src.langgraphagenticai.state.state import CandidateState, merge_dicts
+
+
+def _update_node(state: CandidateState, config=None) -> dict:
+    return {"jd_skills": ["python", "sql"], "completed_steps": ["jd_upload"],
+            "run_metadata": {"node_cache": {"jd_upload": "miss"}}}
+
+
+def _state_node(state: CandidateState, config=None) -> CandidateState:
+    """Returns the whole state, as the memoized GraphBuilder nodes do."""
+    state.match_score = 0.5
+    state.completed_steps = state.completed_steps + ["match_resume_with_jd"]
+    state.run_metadata = merge_dicts(state.run_metadata, {"node_cache": {"match_resume_with_jd": "hit"}})
+    return state
+
+
+def _graph(name, node):
+    g = StateGraph(CandidateState)
+    g.add_node(name, node)
+    g.add_edge(START, name)
+    g.add_edge(name, END)
+    return g.compile(checkpointer=MemorySaver())
+
+
+def _entry_input(state: CandidateState) -> dict:
+    """Mirrors GraphBuilder._entry_input: bookkeeping fields overwrite the checkpoint."""
+    values = {field: getattr(state, field) for field in CandidateState.model_fields}
+    values["run_metadata"] = Overwrite(dict(state.run_metadata))
+    values["completed_steps"] = Overwrite(list(state.completed_steps))
+    return values
+
+
+def _input() -> CandidateState:
+    return CandidateState(resume_text="Python developer", jd_text="Backend engineer",
+                          completed_steps=["resume_upload"], run_metadata={"model": "m", "node_cache": {}})
+
+
+def _invoke(graph, state, thread_id):
+    return CandidateState(**graph.invoke(_entry_input(state), config={"configurable": {"thread_id": thread_id}}))
+
+
+def test_direct_runner_matches_graph_invoke():
+    for name, node in (("jd_upload", _update_node), ("match_resume_with_jd", _state_node)):
+        graph = _graph(name, node)
+        # An earlier call leaves a checkpoint on the thread; neither path should read it.
+        _invoke(graph, CandidateState(resume_text="old", completed_steps=["x"], run_metadata={"old": 1}), "t")
+
+        expected = _invoke(graph, _input(), "t")
+        direct = DirectRunner().run(node, _input(), "t")
+        assert direct.model_dump() == expected.model_dump(), name
+
+
+def test_direct_runner_leaves_input_untouched():
+    state = _input()
+    DirectRunner().run(_state_node, state, "t")
+    assert state.model_dump() == _input().model_dump()
+
+
+def test_checkpoint_is_opt_in():
+    graph = _graph("jd_upload", _update_node)
+    config = {"configurable": {"thread_id": "t"}}
+
+    off = DirectRunner(checkpoint=False)
+    off.run(_update_node, _input(), "t", graph=graph, as_node="jd_upload", to_checkpoint=_entry_input)
+    assert graph.get_state(config).values == {}
+    assert off.stats() == {"calls": 1, "checkpoints": 0, "checkpoint": False}
+
+    on = DirectRunner(checkpoint=True)
+    _invoke(graph, CandidateState(resume_text="old", completed_steps=["x"], run_metadata={"old": 1}), "t")
+    result = on.run(_update_node, _input(), "t", graph=graph, as_node="jd_upload", to_checkpoint=_entry_input)
+    assert CandidateState(**graph.get_state(config).values).model_dump() == result.model_dump()
+    assert on.stats()["checkpoints"] == 1
+
+    # No thread, no checkpoint.
+    on.run(_update_node, _input(), graph=graph, as_node="jd_upload", to_checkpoint=_entry_input)
+    assert on.stats() == {"calls": 2, "checkpoints": 1, "checkpoint": True}
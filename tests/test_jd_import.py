@@ -0,0 +1,99 @@
+import io
+import json
+import threading
+
+import pytest
+
+from src.langgraphagenticai.database.pool import SQLitePool
+from src.langgraphagenticai.database.jd_store import JDStore
+from src.langgraphagenticai.database.jd_import import import_jds, detect_format
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JDStore(str(tmp_path / "jds.db"), pool=SQLitePool(str(tmp_path / "jds.db"), size=1))
+
+
+def _jsonl(*rows) -> io.BytesIO:
+    return io.BytesIO("\n".join(r if isinstance(r, str) else json.dumps(r) for r in rows).encode())
+
+
+def _jd(i: int) -> dict:
+    return {"title": f"Role {i}", "company": "Acme", "text": f"unique posting number {i} " * 20}
+
+
+def test_jsonl_rows_are_validated_and_reported(store):
+    stream = _jsonl(_jd(1), "{not json", "[1, 2]", {"title": "", "text": "x"}, "", _jd(2))
+    report = import_jds(store, stream, "jsonl")
+
+    assert (report.rows_read, report.inserted, report.failed) == (5, 2, 3)
+    assert [e["row"] for e in report.errors] == [2, 3, 4]
+    assert report.errors[0]["error"].startswith("Invalid JSON")
+    assert report.errors[2]["error"].startswith("title:")
+    assert [jd["title"] for jd in store.get_many(report.jd_ids)] == ["Role 1", "Role 2"]
+    assert not stream.closed
+
+
+def test_csv_import(store):
+    stream = io.BytesIO(b"title,company,text\nData Engineer,Acme,spark and airflow pipelines\nShort Row,Acme\n")
+    report = import_jds(store, stream, "csv")
+    assert (report.rows_read, report.inserted, report.failed) == (2, 1, 1)
+    assert report.errors == [{"row": 3, "error": "text: Field required"}]
+
+
+def test_duplicates_within_an_import(store):
+    report = import_jds(store, _jsonl(_jd(1), _jd(1), _jd(2)), "jsonl")
+    assert (report.inserted, report.duplicates_flagged) == (3, 1)
+
+
+def test_detect_format():
+    assert detect_format("export.CSV") == "csv"
+    assert detect_format("upload", "text/csv; charset=utf-8") == "csv"
+    assert detect_format("export.jsonl") == "jsonl"
+    with pytest.raises(ValueError):
+        import_jds(None, io.BytesIO(b""), "xml")
+
+
+class PausingStream(io.RawIOBase):
+    """Serves `chunks` in order, blocking before the second one until `resume` is set."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.served = 0
+        self.paused, self.resume = threading.Event(), threading.Event()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self.chunks:
+            return 0
+        if self.served == 1:
+            self.paused.set()
+            self.resume.wait(5)
+        chunk = self.chunks.pop(0)
+        buffer[:len(chunk)] = chunk
+        self.served += 1
+        return len(chunk)
+
+
+def test_pool_is_free_between_batches(store):
+    """A slow upload must not hold a pooled connection (here the only one) while it reads."""
+    first = "".join(json.dumps(_jd(i)) + "\n" for i in range(2)).encode()
+    second = (json.dumps(_jd(2)) + "\n").encode()
+    stream = PausingStream([first, second])
+    result = {}
+    importer = threading.Thread(target=lambda: result.update(report=import_jds(store, stream, "jsonl", batch_size=2)))
+    importer.start()
+
+    assert stream.paused.wait(5)
+    # First batch committed, importer is blocked on the upload: the single connection is idle.
+    reader = threading.Thread(target=lambda: result.update(listed=store.list_all()))
+    reader.start()
+    reader.join(2)
+    assert not reader.is_alive()
+    assert len(result["listed"]) == 2
+
+    stream.resume.set()
+    importer.join(5)
+    assert result["report"].inserted == 3
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.langgraphagenticai.jobs.job_queue import JobQueue, QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    queues = []
+
+    def make(handlers, workers=1):
+        queue = JobQueue(handlers, db_path=str(tmp_path / "jobs.db"), workers=workers)
+        queues.append(queue)
+        return queue
+    yield make
+    for queue in queues:
+        queue.stop()
+
+
+def test_job_lifecycle(make_queue):
+    queue = make_queue({"double": lambda payload, is_cancelled: {"value": payload["n"] * 2}})
+    job_id = queue.submit("double", {"n": 21})
+    assert queue.get(job_id)["status"] == QUEUED
+
+    queue.start()
+    job = queue.wait(job_id, timeout=5)
+    assert job["status"] == SUCCEEDED
+    assert job["result"] == {"value": 42}
+    assert job["started_at"] <= job["finished_at"]
+    assert "payload" not in job
+    assert queue.depth()[SUCCEEDED] == 1
+
+
+def test_unknown_kind_is_rejected(make_queue):
+    with pytest.raises(ValueError):
+        make_queue({}).submit("nope", {})
+
+
+def test_handler_error_fails_the_job(make_queue):
+    def boom(payload, is_cancelled):
+        raise RuntimeError("handler broke")
+
+    queue = make_queue({"boom": boom})
+    queue.start()
+    job = queue.wait(queue.submit("boom", {}), timeout=5)
+    assert job["status"] == FAILED
+    assert job["error"] == "handler broke" and job["result"] is None
+
+
+def test_higher_priority_runs_first(make_queue):
+    order = []
+    queue = make_queue({"record": lambda payload, is_cancelled: order.append(payload["name"]) or {}})
+    low = queue.submit("record", {"name": "low"}, priority=-1)
+    queue.submit("record", {"name": "normal"})
+    high = queue.submit("record", {"name": "high"}, priority=5)
+    queue.start()
+    queue.wait(low, timeout=5)
+    assert queue.get(high)["status"] == SUCCEEDED
+    assert order == ["high", "normal", "low"]
+
+
+def test_cancel_queued_job_never_runs(make_queue):
+    ran = []
+    queue = make_queue({"work": lambda payload, is_cancelled: ran.append(1) or {}})
+    job_id = queue.submit("work", {})
+    job = queue.cancel(job_id)
+    assert job["status"] == CANCELLED and job["cancel_requested"]
+
+    queue.start()
+    marker = queue.wait(queue.submit("work", {}), timeout=5)
+    assert marker["status"] == SUCCEEDED
+    assert ran == [1]
+    assert queue.get(job_id)["status"] == CANCELLED
+
+
+def test_cancel_running_job_discards_its_result(make_queue):
+    started, release = threading.Event(), threading.Event()
+    polls = []
+
+    def slow(payload, is_cancelled):
+        started.set()
+        release.wait(5)
+        polls.append(is_cancelled())
+        return {"done": True}
+
+    queue = make_queue({"slow": slow})
+    queue.start()
+    job_id = queue.submit("slow", {})
+    assert started.wait(5)
+    assert queue.cancel(job_id)["status"] == RUNNING
+    release.set()
+
+    job = queue.wait(job_id, timeout=5)
+    assert polls == [True]
+    assert job["status"] == CANCELLED and job["result"] is None
+
+
+def test_wait_returns_on_status_change(make_queue):
+    release = threading.Event()
+    queue = make_queue({"slow": lambda payload, is_cancelled: release.wait(5) and {}})
+    job_id = queue.submit("slow", {})
+    queue.start()
+    assert queue.wait(job_id, timeout=5, since_status=QUEUED)["status"] == RUNNING
+    release.set()
+    assert queue.wait(job_id, timeout=5, since_status=RUNNING)["status"] == SUCCEEDED
+
+
+def test_interrupted_jobs_are_requeued_on_start(make_queue, tmp_path):
+    queue = make_queue({"work": lambda payload, is_cancelled: {"ok": True}})
+    job_id = queue.submit("work", {})
+    queue._claim()  # a previous process claimed it, then died
+    assert queue.get(job_id)["status"] == RUNNING
+
+    restarted = make_queue({"work": lambda payload, is_cancelled: {"ok": True}})
+    restarted.start()
+    assert restarted.wait(job_id, timeout=5)["status"] == SUCCEEDED
+
+
+def test_async_twins(make_queue):
+    queue = make_queue({"work": lambda payload, is_cancelled: {}})
+
+    async def scenario():
+        job_id = await queue.asubmit("work", {"n": 1}, priority=2)
+        assert (await queue.aget(job_id))["priority"] == 2
+        assert (await queue.acancel(job_id))["status"] == CANCELLED
+        assert (await queue.adepth())[CANCELLED] == 1
+        assert await queue.aget("missing") is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,66 @@
+import uuid
+
+import pytest
+
+from src.langgraphagenticai.database.pool import SQLitePool
+from src.langgraphagenticai.database.match_store import MatchStore, ADHOC_JD_ID
+
+CONFIG = "cfg-1"
+VECTORS = {"tfidf_score": 0.4, "bow_score": 0.5, "embedding_score": 0.7}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MatchStore(SQLitePool(str(tmp_path / "match.db")))
+
+
+def test_key_tracks_content_and_config():
+    key = MatchStore.key("python dev", 7, "backend role", CONFIG)
+    assert key == MatchStore.key("python dev", 7, "backend role", CONFIG)
+    assert key != MatchStore.key("python developer", 7, "backend role", CONFIG)
+    # Editing a JD changes its version, so its old scores stop matching.
+    assert key != MatchStore.key("python dev", 7, "backend role, remote", CONFIG)
+    assert key != MatchStore.key("python dev", 8, "backend role", CONFIG)
+    assert key != MatchStore.key("python dev", 7, "backend role", "cfg-2")
+    assert MatchStore.key("python dev", None, "backend role", CONFIG)[1] == ADHOC_JD_ID
+    assert MatchStore.key(None, 7, None, CONFIG) == MatchStore.key("", 7, "", CONFIG)
+
+
+def test_round_trip_keeps_only_vector_scores(store):
+    key = MatchStore.key("resume", 1, "jd", CONFIG)
+    assert store.get(key) is None
+    store.put(key, {**VECTORS, "skill_overlap": 1.0, "match_score": 0.99})
+    assert store.get(key) == VECTORS
+    assert store.stats() == {"hits": 1, "misses": 1, "writes": 1, "hit_rate": 0.5}
+
+
+def test_get_many_by_jd_id(store):
+    keys = [MatchStore.key("resume", jd_id, f"jd {jd_id}", CONFIG) for jd_id in (1, 2, 3)]
+    store.put(keys[0], VECTORS)
+    store.put(keys[2], {**VECTORS, "tfidf_score": 0.1})
+    found = store.get_many(keys + [MatchStore.key("other resume", 2, "jd 2", CONFIG)])
+    assert found == {1: VECTORS, 3: {**VECTORS, "tfidf_score": 0.1}}
+    assert store.stats()["hits"] == 2 and store.stats()["misses"] == 2
+
+
+def test_cache_hit_rescores_skill_overlap(monkeypatch):
+    pytest.importorskip("sentence_transformers")
+    from src.langgraphagenticai.nodes import nodes
+    from src.langgraphagenticai.state.state import CandidateState
+
+    calls = []
+    monkeypatch.setattr(nodes, "vectorize_texts", lambda resume, jd: calls.append(1) or (0.5, 0.5, 0.5))
+    node = object.__new__(nodes.WebSearchChatbotNode)  # match_resume_with_jd needs no LLM or tools
+    state = dict(resume_clean=f"resume {uuid.uuid4()}", jd_clean="python sql docker", jd_id=None,
+                 jd_skills=["python", "sql", "docker", "aws"])
+
+    first = node.match_resume_with_jd(CandidateState(candidate_skills=["python"], **state))
+    # Same resume and JD text, but the client now posts more skills: a cache hit.
+    second = node.match_resume_with_jd(CandidateState(candidate_skills=["python", "sql", "docker"], **state))
+
+    assert len(calls) == 1
+    assert sorted(second.matched_skills) == ["docker", "python", "sql"]
+    assert first.match_score == nodes.combine_match_score(
+        {"embedding_score": 0.5, "tfidf_score": 0.5, "skill_overlap": 0.25})
+    assert second.match_score == nodes.combine_match_score(
+        {"embedding_score": 0.5, "tfidf_score": 0.5, "skill_overlap": 0.75})
@@ -0,0 +1,133 @@
+import random
+from array import array
+
+import pytest
+
+from src.langgraphagenticai.database import near_duplicates as nd
+from src.langgraphagenticai.database.jd_store import JDStore
+
+WORDS = [f"term{i}" for i in range(2000)]
+
+
+def _text(rng: random.Random, n: int = 300) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _reference_signature(text: str) -> array:
+    """The original pure-Python MinHash; stored signatures were written with it."""
+    hashes = [nd._hash64(s) for s in nd.shingles(text)] or [0]
+    return array("I", (
+        min(((a * h + b) % nd._MERSENNE_PRIME) & nd._MAX_HASH for h in hashes)
+        for a, b in nd._PERMUTATIONS
+    ))
+
+
+def _jaccard(a: str, b: str) -> float:
+    sa, sb = nd.shingles(a), nd.shingles(b)
+    return len(sa & sb) / len(sa | sb)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_signature_matches_reference(seed):
+    rng = random.Random(seed)
+    for text in ("", "one", "two words", _text(rng, 20), _text(rng, 600)):
+        assert nd.minhash_signature(text) == _reference_signature(text)
+
+
+def test_near_duplicate_above_threshold():
+    rng = random.Random(1)
+    words = _text(rng, 400).split()
+    edited = list(words)
+    edited[200] = "changed"  # one word touches SHINGLE_WORDS shingles
+    a, b = " ".join(words), " ".join(edited)
+
+    similarity = nd.estimate_similarity(nd.minhash_signature(a), nd.minhash_signature(b))
+    assert _jaccard(a, b) > 0.95
+    assert similarity >= nd.JD_DUPLICATE_THRESHOLD
+    # Near-identical signatures agree on most rows, so at least one band collides.
+    assert set(enumerate(nd.lsh_buckets(nd.minhash_signature(a)))) & set(enumerate(nd.lsh_buckets(nd.minhash_signature(b))))
+
+
+def test_distinct_below_threshold():
+    rng = random.Random(2)
+    a, b = _text(rng), _text(rng)
+    similarity = nd.estimate_similarity(nd.minhash_signature(a), nd.minhash_signature(b))
+    assert similarity < 0.1
+    assert similarity < nd.JD_DUPLICATE_THRESHOLD
+
+
+def test_estimate_tracks_jaccard():
+    rng = random.Random(3)
+    words = _text(rng, 400).split()
+    for keep in (100, 200, 300):
+        a = " ".join(words)
+        b = " ".join(words[:keep] + _text(rng, 400 - keep).split())
+        estimate = nd.estimate_similarity(nd.minhash_signature(a), nd.minhash_signature(b))
+        # 128 permutations: standard error is at most 0.5 / sqrt(128) ~ 0.044.
+        assert abs(estimate - _jaccard(a, b)) < 0.15
+
+
+def test_signature_bytes_round_trip():
+    signature = nd.minhash_signature("senior python engineer with fastapi")
+    assert nd.signature_from_bytes(signature.tobytes()) == signature
+    assert len(nd.lsh_buckets(signature)) == nd.LSH_BANDS
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JDStore(str(tmp_path / "jds.db"))
+
+
+def test_duplicates_join_the_oldest_cluster(store):
+    rng = random.Random(4)
+    body = _text(rng)
+    first = store.add("Backend Engineer", "Acme", body)
+    second = store.add("Backend Engineer", "Acme", body + " remote")
+    other = store.add("Data Scientist", "Globex", _text(rng))
+
+    assert first["duplicate_of"] is None
+    assert second["duplicate_of"] == first["id"] and second["similarity"] >= nd.JD_DUPLICATE_THRESHOLD
+    assert other["duplicate_of"] is None
+
+    [cluster] = store.clusters()
+    assert cluster["cluster_id"] == first["id"]
+    assert cluster["representative"]["id"] == first["id"]
+    assert [d["id"] for d in cluster["duplicates"]] == [second["id"]]
+    assert {jd["id"] for jd in store.list_all(representatives_only=True)} == {first["id"], other["id"]}
+
+
+def test_merge_policy_skips_the_insert(store):
+    rng = random.Random(5)
+    body = _text(rng)
+    first = store.add("ML Engineer", "Initech", body)
+    merged = store.add_many([("ML Engineer", "Initech", body, None)], policy="merge")[0]
+    assert merged == {"id": first["id"], "duplicate_of": first["id"], "similarity": 1.0, "merged": True}
+    assert len(store.list_all()) == 1
+
+
+def test_delete_promotes_next_oldest(store):
+    rng = random.Random(6)
+    body = _text(rng)
+    ids = [store.add("SRE", "Hooli", body + f" variant{i}")["id"] for i in range(3)]
+
+    assert store.delete(ids[0])
+    [cluster] = store.clusters()
+    assert cluster["cluster_id"] == ids[1]
+    assert cluster["representative"]["id"] == ids[1]
+    assert [d["id"] for d in cluster["duplicates"]] == [ids[2]]
+    assert {jd["id"] for jd in store.list_all(representatives_only=True)} == {ids[1]}
+
+
+def test_text_update_drops_the_signature_and_promotes(store):
+    rng = random.Random(7)
+    body = _text(rng)
+    ids = [store.add("QA Engineer", "Umbrella", body + f" v{i}")["id"] for i in range(2)]
+
+    with store.pool.transaction() as conn:
+        conn.execute("UPDATE job_descriptions SET text = ? WHERE id = ?", (_text(rng), ids[0]))
+
+    # The rewritten JD is unsigned (its own cluster) until the next backfill; the copy takes over.
+    assert store.clusters() == []
+    assert {jd["id"] for jd in store.list_all(representatives_only=True)} == set(ids)
+    assert store.backfill_signatures() == 1
+    assert store.clusters() == []
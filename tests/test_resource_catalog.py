@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from src.langgraphagenticai.database.jd_store import jd_store
+from src.langgraphagenticai.tools.resource_catalog import (
+    ResourceCatalog, resource_catalog, SOURCE_IMPORT, SOURCE_LLM,
+)
+
+DOCS = [{"title": "Official Docs", "type": "docs", "url": "https://example.com/docs"}]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return ResourceCatalog(db_path=str(tmp_path / "catalog.db"), max_age_s=60)
+
+
+def test_default_catalog_shares_the_jd_pool():
+    assert resource_catalog.pool is jd_store.pool
+
+
+def test_lookup_splits_hits_and_misses(catalog):
+    assert catalog.upsert_many({"  Machine   Learning ": DOCS}, SOURCE_LLM) == 1
+    hits, misses = catalog.lookup(["machine learning", "Rust"])
+    assert hits == {"machine learning": DOCS}
+    assert misses == ["Rust"]
+    assert catalog.stats == {"hits": 1, "misses": 1}
+    assert catalog.lookup([]) == ({}, [])
+
+
+def test_llm_entries_expire_but_imports_do_not(catalog):
+    catalog.upsert_many({"docker": DOCS}, SOURCE_LLM)
+    catalog.import_entries({"kubernetes": DOCS})
+    with catalog.pool.transaction() as conn:
+        conn.execute("UPDATE skill_resource_catalog SET refreshed_at = ?", (time.time() - 3600,))
+
+    hits, misses = catalog.lookup(["docker", "kubernetes"])
+    assert list(hits) == ["kubernetes"] and misses == ["docker"]
+    sources = {entry["skill"]: entry["source"] for entry in catalog.list_entries()}
+    assert sources == {"docker": SOURCE_LLM, "kubernetes": SOURCE_IMPORT}
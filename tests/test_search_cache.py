@@ -0,0 +1,116 @@
+import asyncio
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.langgraphagenticai.tools.search_cache import SearchCache, cache_key, normalize_query
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "search_cache.db")
+
+
+class Fetcher:
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return self.values.pop(0)
+
+
+def test_keys_ignore_case_and_whitespace_but_not_params():
+    assert normalize_query("  Python   Tutorial\n") == "python tutorial"
+    assert cache_key("Python  tutorial", {"max_results": 5}) == cache_key("python tutorial", {"max_results": 5})
+    assert cache_key("python tutorial", {"max_results": 5}) != cache_key("python tutorial", {"max_results": 3})
+
+
+def test_fresh_entries_are_served_without_fetching(db_path):
+    cache = SearchCache(db_path, ttl_s=3600)
+    fetch = Fetcher("first", "second")
+    assert cache.get_or_fetch("python", {}, fetch) == "first"
+    assert cache.get_or_fetch("Python ", {}, fetch) == "first"
+    assert fetch.calls == 1
+    assert cache.stats == {"hits": 1, "stale_hits": 0, "misses": 1, "refreshes": 0}
+
+
+def test_sqlite_layer_survives_a_new_cache_and_memory_eviction(db_path):
+    SearchCache(db_path).get_or_fetch("python", {}, Fetcher("stored"))
+
+    cache = SearchCache(db_path, max_items=1)
+    assert cache.get_or_fetch("python", {}, Fetcher()) == "stored"
+    cache.get_or_fetch("docker", {}, Fetcher("other"))  # evicts "python" from memory
+    assert list(cache._memory) == [cache_key("docker", {})]
+    assert cache.get_or_fetch("python", {}, Fetcher()) == "stored"
+
+    rows = sqlite3.connect(db_path).execute("SELECT query, value FROM search_cache ORDER BY query").fetchall()
+    assert rows == [("docker", "other"), ("python", "stored")]
+
+
+def test_stale_entries_are_served_and_refreshed_once_in_the_background(db_path):
+    cache = SearchCache(db_path, ttl_s=-1, stale_s=3600)  # every entry is past its TTL
+    cache.set(cache_key("python", {}), "python", "old")
+
+    release = threading.Event()
+    refreshes = []
+
+    def refresh() -> str:
+        refreshes.append(1)
+        release.wait(5)
+        return "new"
+
+    assert cache.get_or_fetch("python", {}, refresh) == "old"
+    assert cache.get_or_fetch("python", {}, refresh) == "old"  # refresh already running
+    release.set()
+    for _ in range(100):
+        if cache.stats["refreshes"]:
+            break
+        time.sleep(0.01)
+
+    assert len(refreshes) == 1
+    assert cache.stats["stale_hits"] == 2
+    assert cache.get(cache_key("python", {}))[0] == "new"
+
+
+def test_failed_refresh_keeps_the_stale_value(db_path):
+    cache = SearchCache(db_path, ttl_s=-1, stale_s=3600)
+    key = cache_key("python", {})
+    cache.set(key, "python", "old")
+
+    def failing() -> str:
+        raise RuntimeError("search down")
+
+    assert cache.get_or_fetch("python", {}, failing) == "old"
+    for _ in range(100):
+        if key not in cache._refreshing:
+            break
+        time.sleep(0.01)
+    assert key not in cache._refreshing
+    assert cache.get(key)[0] == "old"
+
+
+def test_entries_past_the_stale_window_are_fetched_synchronously(db_path):
+    cache = SearchCache(db_path, ttl_s=-1, stale_s=0)
+    cache.set(cache_key("python", {}), "python", "old")
+    assert cache.get_or_fetch("python", {}, Fetcher("new")) == "new"
+    assert cache.stats["misses"] == 1
+
+
+def test_async_read_through(db_path):
+    cache = SearchCache(db_path)
+    fetch = Fetcher("async value")
+
+    async def afetch() -> str:
+        return fetch()
+
+    async def run():
+        first = await cache.aget_or_fetch("python", {}, afetch, fetch)
+        second = await cache.aget_or_fetch("python", {}, afetch, fetch)
+        return first, second
+
+    assert asyncio.run(run()) == ("async value", "async value")
+    assert fetch.calls == 1
@@ -0,0 +1,119 @@
+import time
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("ultralytics")
+pytest.importorskip("cv2")
+pytest.importorskip("sentence_transformers")
+
+import app as api
+from src.langgraphagenticai.state.state import CandidateState, InterviewQuestion
+
+QUESTIONS = [InterviewQuestion(type="technical", question=f"Question {i}?") for i in range(3)]
+
+
+@pytest.fixture
+def loop():
+    """The app's event loop, running on its own thread like uvicorn's."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    api.app.state.loop = loop
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture
+def evaluations(monkeypatch):
+    """Count single-answer evaluations; each one takes `delay` seconds."""
+    calls = []
+
+    def evaluate(question, answer, index, metadata, delay=0.2):
+        calls.append(index)
+        time.sleep(delay)
+        metadata.setdefault("routing", {})[f"evaluate_answers[Q{index + 1}]"] = {"model": "m"}
+        return f"feedback {index}"
+
+    monkeypatch.setattr(api.graph_builder.recruitment_node, "evaluate_single_answer", evaluate)
+    return calls
+
+
+def _session(thread_id: str) -> CandidateState:
+    state = CandidateState(interview_questions=QUESTIONS, candidate_answers=["a0", "a1", "a2"])
+    api.ACTIVE_SESSIONS[thread_id] = state
+    return state
+
+
+async def _schedule(thread_id: str, index: int, answer: str) -> bool:
+    return api.schedule_answer_evaluation(thread_id, index, answer)
+
+
+def test_background_result_does_not_touch_snapshots(evaluations):
+    session = _session("snapshot")
+    snapshot = session.model_copy()
+
+    asyncio.run(api._evaluate_answer("snapshot", 0, QUESTIONS[0], "a0", "hash0"))
+
+    assert api.ACTIVE_SESSIONS["snapshot"].answer_feedback == {0: {"answer_hash": "hash0", "review_feedback": "feedback 0"}}
+    assert "evaluate_answers[Q1]" in api.ACTIVE_SESSIONS["snapshot"].run_metadata["routing"]
+    assert snapshot.answer_feedback == {} and snapshot.run_metadata == {}
+    api.end_session("snapshot")
+
+
+def test_evaluate_job_waits_for_in_flight_evaluations(loop, evaluations):
+    session = _session("job")
+    for index, answer in enumerate(session.candidate_answers):
+        assert asyncio.run_coroutine_threadsafe(_schedule("job", index, answer), loop).result()
+
+    seen = {}
+
+    def run_step(state: CandidateState, thread_id=None) -> CandidateState:
+        seen.update(state.answer_feedback)
+        return state
+
+    handler = api._step_job(run_step, lambda s: {}, reuse_feedback=True)
+    handler({"thread_id": "job", "state": session.model_dump(mode="json")}, lambda: False)
+
+    # The job saw every background result and never evaluated an answer itself.
+    assert sorted(seen) == [0, 1, 2]
+    assert sorted(evaluations) == [0, 1, 2]
+    assert "job" not in api.PENDING_EVALUATIONS
+    api.end_session("job")
+
+
+def test_session_feedback_wins_over_client_echo():
+    session = _session("merge")
+    session.answer_feedback = {0: {"answer_hash": "new", "review_feedback": "fresh"}}
+    client = CandidateState(answer_feedback={
+        0: {"answer_hash": "old", "review_feedback": "stale"},
+        1: {"answer_hash": "h1", "review_feedback": "client only"},
+    })
+    api.merge_answer_feedback("merge", client)
+    assert client.answer_feedback[0]["review_feedback"] == "fresh"
+    assert client.answer_feedback[1]["review_feedback"] == "client only"
+    api.end_session("merge")
+
+
+def test_end_session_cancels_pending_evaluations(loop, evaluations):
+    session = _session("ended")
+    assert asyncio.run_coroutine_threadsafe(_schedule("ended", 0, "a0"), loop).result()
+    [(_, task)] = api.PENDING_EVALUATIONS["ended"].values()
+
+    loop.call_soon_threadsafe(api.end_session, "ended")
+    time.sleep(0.05)
+    assert task.cancelled()
+    assert "ended" not in api.ACTIVE_SESSIONS and "ended" not in api.PENDING_EVALUATIONS
+
+
+def test_idle_sessions_are_found_by_last_write():
+    store = api.SessionStore()
+    store["old"] = CandidateState()
+    store.last_seen["old"] -= 100
+    store["new"] = CandidateState()
+    assert store.idle(50) == ["old"]
+    store.pop("old")
+    assert "old" not in store.last_seen
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+
+from src.langgraphagenticai.utils.singleflight import SingleFlight, singleflight_stats
+
+
+def _start_calls(flight, key, fn, count):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for t in threads:
+        t.start()
+    return threads, results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test-share")
+    started, release = threading.Event(), threading.Event()
+    executions = []
+
+    def fn():
+        executions.append(1)
+        started.set()
+        release.wait(5)
+        return {"items": [1, 2]}
+
+    leader, _, _ = _start_calls(flight, "k", fn, 1)
+    assert started.wait(5)
+    threads, results, errors = _start_calls(flight, "k", fn, 3)
+    while flight.stats["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in threads + leader:
+        t.join(5)
+
+    assert executions == [1]
+    assert results == [{"items": [1, 2]}] * 3 and not errors
+    # Followers get copies, not the leader's object.
+    results[0]["items"].append(3)
+    assert results[1] == {"items": [1, 2]}
+    assert flight.stats == {"calls": 4, "executions": 1, "coalesced": 3}
+    assert singleflight_stats()["test-share"] == flight.stats
+
+
+def test_exceptions_reach_followers_and_the_key_is_released():
+    flight = SingleFlight("test-error")
+    started, release = threading.Event(), threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("provider down")
+
+    leader, _, leader_errors = _start_calls(flight, "k", fn, 1)
+    assert started.wait(5)
+    threads, results, errors = _start_calls(flight, "k", fn, 2)
+    while flight.stats["coalesced"] < 2:
+        time.sleep(0.001)
+    release.set()
+    for t in threads + leader:
+        t.join(5)
+
+    assert not results
+    assert [str(e) for e in leader_errors + errors] == ["provider down"] * 3
+    # The failed flight is gone: the next call runs again.
+    assert flight.do("k", lambda: "recovered") == "recovered"
+
+
+def test_sequential_calls_and_distinct_keys_are_not_coalesced():
+    flight = SingleFlight("test-sequential")
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("a", lambda: 2) == 2
+    assert flight.do("b", lambda: 3) == 3
+    assert flight.stats == {"calls": 3, "executions": 3, "coalesced": 0}
+
+
+def test_async_calls_coalesce_with_threaded_calls():
+    flight = SingleFlight("test-async")
+    release = threading.Event()
+    executions = []
+
+    async def afn():
+        executions.append(1)
+        await asyncio.to_thread(release.wait, 5)
+        return ["result"]
+
+    async def main():
+        leader = asyncio.create_task(flight.ado("k", afn))
+        while not executions:
+            await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.ado("k", afn))
+        threaded = asyncio.create_task(asyncio.to_thread(flight.do, "k", lambda: ["unused"]))
+        while flight.stats["coalesced"] < 2:
+            await asyncio.sleep(0.001)
+        release.set()
+        return await asyncio.gather(leader, follower, threaded)
+
+    assert asyncio.run(main()) == [["result"]] * 3
+    assert executions == [1]
+    assert flight.stats == {"calls": 3, "executions": 1, "coalesced": 2}
@@ -0,0 +1,82 @@
+import time
+
+from langgraph.graph import StateGraph, START, END
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Overwrite
+
+from src.langgraphagenticai.state.state import CandidateState, merge_dicts, merge_unique
+
+
+def test_merge_dicts_is_recursive_and_right_wins():
+    left = {"branches": {"a": {"elapsed_ms": 1}}, "model": "x", "keep": 1}
+    right = {"branches": {"b": {"elapsed_ms": 2}}, "model": "y"}
+    assert merge_dicts(left, right) == {
+        "branches": {"a": {"elapsed_ms": 1}, "b": {"elapsed_ms": 2}}, "model": "y", "keep": 1,
+    }
+    assert left == {"branches": {"a": {"elapsed_ms": 1}}, "model": "x", "keep": 1}
+    assert merge_dicts(None, None) == {}
+    assert merge_dicts({"a": {"b": 1}}, {"a": 2}) == {"a": 2}
+
+
+def test_merge_unique_keeps_order_and_drops_repeats():
+    assert merge_unique(["a", "b"], ["b", "c", "a", "d"]) == ["a", "b", "c", "d"]
+    assert merge_unique(None, ["a", "a"]) == ["a"]
+    assert merge_unique(["a"], None) == ["a"]
+
+
+def _branch(name: str, field: str, value, delay: float = 0.0):
+    def run(state: CandidateState) -> dict:
+        time.sleep(delay)
+        return {
+            field: value,
+            "completed_steps": [name],
+            "run_metadata": {"branches": {name: {"ok": True}}, "node_cache": {name: "miss"}},
+        }
+    return run
+
+
+def _fan_out_graph(checkpointer=None):
+    """START fans out to three branches writing disjoint fields plus the shared bookkeeping."""
+    g = StateGraph(CandidateState)
+    g.add_node("skill_gap", _branch("skill_gap", "priority_skills", ["go"], delay=0.02))
+    g.add_node("assessment", _branch("assessment", "based_on_skills", ["python"]))
+    g.add_node("interview", _branch("interview", "interview_questions", [{"type": "behavioral", "question": "Why?"}], delay=0.01))
+    g.add_node("join", lambda state: {"completed_steps": ["join"]})
+    for name in ("skill_gap", "assessment", "interview"):
+        g.add_edge(START, name)
+    g.add_edge(["skill_gap", "assessment", "interview"], "join")
+    g.add_edge("join", END)
+    return g.compile(checkpointer=checkpointer) if checkpointer else g.compile()
+
+
+def test_parallel_branches_merge_bookkeeping():
+    result = CandidateState(**_fan_out_graph().invoke(
+        CandidateState(completed_steps=["match"], run_metadata={"routing": {"match": "m1"}})
+    ))
+
+    assert result.priority_skills == ["go"]
+    assert result.based_on_skills == ["python"]
+    assert [q.question for q in result.interview_questions] == ["Why?"]
+    assert result.completed_steps[0] == "match" and result.completed_steps[-1] == "join"
+    assert set(result.completed_steps) == {"match", "skill_gap", "assessment", "interview", "join"}
+    assert result.run_metadata["routing"] == {"match": "m1"}
+    assert set(result.run_metadata["branches"]) == {"skill_gap", "assessment", "interview"}
+    assert result.run_metadata["node_cache"] == {"skill_gap": "miss", "assessment": "miss", "interview": "miss"}
+
+
+def test_checkpointed_thread_accumulates_unless_overwritten():
+    graph = _fan_out_graph(MemorySaver())
+    config = {"configurable": {"thread_id": "t"}}
+    graph.invoke(CandidateState(run_metadata={"first": 1}), config=config)
+
+    merged = CandidateState(**graph.invoke(CandidateState(run_metadata={"second": 2}), config=config))
+    assert {"first", "second"} <= set(merged.run_metadata)
+
+    # GraphBuilder._entry_input resets the bookkeeping this way at graph entry.
+    reset = CandidateState(**graph.invoke(
+        {"run_metadata": Overwrite({"third": 3}), "completed_steps": Overwrite([])}, config=config
+    ))
+    assert "first" not in reset.run_metadata and "second" not in reset.run_metadata
+    assert reset.run_metadata["third"] == 3
+    assert set(reset.run_metadata["branches"]) == {"skill_gap", "assessment", "interview"}
+    assert sorted(reset.completed_steps) == ["assessment", "interview", "join", "skill_gap"]
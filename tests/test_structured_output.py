@@ -0,0 +1,88 @@
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage
+
+from src.langgraphagenticai.LLMS.groqllm import GroqLLM, format_instructions
+from src.langgraphagenticai.state.state import QuestionFeedback
+from src.langgraphagenticai.utils.json_extract import extract_json
+
+
+@pytest.mark.parametrize("response, expected", [
+    ('{"a": 1}', {"a": 1}),
+    ('Sure! Here it is:\n```json\n{"a": [1, 2]}\n```', {"a": [1, 2]}),
+    ('<think>maybe {"wrong": true}</think>\n{"a": 1}', {"a": 1}),
+    ('[{"a": 1}, {"b": 2}] trailing prose', [{"a": 1}, {"b": 2}]),
+    ('{"a": [1, 2,], "b": {"c": 3,},}', {"a": [1, 2], "b": {"c": 3}}),
+    ('{"text": "line one\nline two"}', {"text": "line one\nline two"}),
+    ({"already": "parsed"}, {"already": "parsed"}),
+])
+def test_extract_json(response, expected):
+    assert extract_json(response) == expected
+
+
+@pytest.mark.parametrize("response", ["no json here", '{"a": ', "<think>{\"a\": 1}</think> done"])
+def test_extract_json_rejects_non_json(response):
+    with pytest.raises(OutputParserException):
+        extract_json(response)
+
+
+class FakeChatModel:
+    """Records prompts; structured calls fail with `structured_error` when set."""
+
+    def __init__(self, structured_error=None):
+        self.structured_error = structured_error
+        self.calls = []
+
+    def with_structured_output(self, schema, method):
+        def invoke(prompt):
+            self.calls.append((method, prompt))
+            if self.structured_error:
+                raise self.structured_error
+            return {"question_index": 1, "review_feedback": "structured"}
+        return type("Structured", (), {"invoke": staticmethod(invoke)})()
+
+    def invoke(self, prompt):
+        self.calls.append(("text", prompt))
+        return AIMessage(content='Here you go: {"question_index": 1, "review_feedback": "text"}')
+
+
+def _llm(monkeypatch, mode, chat_model):
+    monkeypatch.setenv("LLM_BACKEND", "replay")  # no API key, no client pool
+    llm = GroqLLM(model_name="test-model", structured_output=mode)
+    llm.llm = chat_model
+    return llm
+
+
+def _has_schema(prompt: str) -> bool:
+    return format_instructions(QuestionFeedback) in prompt
+
+
+@pytest.mark.parametrize("mode, schema_in_prompt", [
+    ("function_calling", False), ("json_schema", False), ("json_mode", True),
+])
+def test_schema_in_prompt_only_when_provider_lacks_it(monkeypatch, mode, schema_in_prompt):
+    chat = FakeChatModel()
+    result = _llm(monkeypatch, mode, chat).generate_structured(f"evaluate ({mode})", QuestionFeedback)
+    assert result.review_feedback == "structured"
+    assert [(m, _has_schema(p)) for m, p in chat.calls] == [(mode, schema_in_prompt)]
+
+
+def test_text_mode_prompt_carries_the_schema(monkeypatch):
+    chat = FakeChatModel()
+    result = _llm(monkeypatch, "off", chat).generate_structured("evaluate (off)", QuestionFeedback)
+    assert result.review_feedback == "text"
+    assert [(m, _has_schema(p)) for m, p in chat.calls] == [("text", True)]
+
+
+def test_schema_error_falls_back_with_the_schema(monkeypatch):
+    chat = FakeChatModel(structured_error=OutputParserException("bad tool call"))
+    result = _llm(monkeypatch, "function_calling", chat).generate_structured("evaluate (fallback)", QuestionFeedback)
+    assert result.review_feedback == "text"
+    assert [(m, _has_schema(p)) for m, p in chat.calls] == [("function_calling", False), ("text", True)]
+
+
+def test_other_errors_are_raised(monkeypatch):
+    chat = FakeChatModel(structured_error=TimeoutError("provider down"))
+    with pytest.raises(TimeoutError):
+        _llm(monkeypatch, "function_calling", chat).generate_structured("evaluate (raise)", QuestionFeedback)
+    assert [m for m, _ in chat.calls] == ["function_calling"]